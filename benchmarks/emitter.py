@@ -0,0 +1,86 @@
+#!/usr/bin/python3
+
+"""
+WordNet YAML emitter benchmark
+Compares the fast schema emitter with yaml.dump() on the documents that wordnet_toyaml.save() writes, and checks that
+their output is the same. Timings are the best of several runs.
+
+Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
+"""
+
+#  Copyright (c) 2024.
+#  Creative Commons 4 for original code
+#  GPL3 for rewrite
+
+import argparse
+import sys
+import time
+from typing import Any, Dict, List, Tuple
+
+import yaml
+
+from benchmarks.fused import timed
+from oewn_core.deserialize import load as load_pickle
+from oewn_core.wordnet import WordnetModel
+from oewn_core.wordnet_emitter import SchemaEmitter
+from oewn_core.wordnet_fromyaml import load
+from oewn_core.wordnet_toyaml import entries_to_yaml, synsets_to_yaml, verbframes_to_yaml
+
+
+def documents(wn: WordnetModel) -> List[Dict[str, Any]]:
+    """
+    Documents, as saved
+    :param wn: model
+    :return: top-level dictionaries of YAML files
+    """
+    return list(entries_to_yaml(wn).values()) + list(synsets_to_yaml(wn).values()) + [verbframes_to_yaml(wn)]
+
+
+def benchmark(wn: WordnetModel, repeat: int) -> Tuple[Dict[str, float], bool]:
+    """
+    Benchmark
+    :param wn: model
+    :param repeat: number of runs
+    :return: best duration per stage, whether outputs are the same
+    """
+    durations: Dict[str, List[float]] = {'build': [], 'yaml.dump': [], 'emit': [], 'emit (cold)': []}
+    same = True
+    for _ in range(repeat):
+        duration, docs = timed(lambda: documents(wn))
+        durations['build'].append(duration)
+        duration, dumped = timed(lambda: [yaml.dump(y, allow_unicode=True) for y in docs])
+        durations['yaml.dump'].append(duration)
+        emitter = SchemaEmitter()
+        duration, emitted = timed(lambda: [emitter.emit(y) for y in docs])
+        durations['emit (cold)'].append(duration)
+        duration, emitted = timed(lambda: [emitter.emit(y) for y in docs])
+        durations['emit'].append(duration)
+        same = same and dumped == emitted
+    return {k: min(v) for k, v in durations.items()}, same
+
+
+def report(durations: Dict[str, float], same: bool, out=sys.stdout) -> None:
+    for name, duration in durations.items():
+        print(f'{name:<24}{duration:>10.3f}s', file=out)
+    print(f'{"speedup (cold)":<24}{durations["yaml.dump"] / durations["emit (cold)"]:>10.1f}x', file=out)
+    print(f'{"speedup":<24}{durations["yaml.dump"] / durations["emit"]:>10.1f}x', file=out)
+    print(f'{"same output":<24}{same!s:>11}', file=out)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="compare fast YAML emitter with yaml.dump()")
+    arg_parser.add_argument('--repeat', type=int, default=3, help='number of runs')
+    arg_parser.add_argument('--pickle', action='store_true', default=False, help='in_dir holds a pickle')
+    arg_parser.add_argument('in_dir', type=str, help='from-dir for yaml or pickle')
+    arg_parser.add_argument('pickled', type=str, nargs='?', default='oewn.pickle', help='from-pickle')
+    args = arg_parser.parse_args()
+    wn = load_pickle(args.in_dir, args.pickled, extend=False) if args.pickle else load(args.in_dir, extend=False)
+    report(*benchmark(wn, args.repeat))
+
+
+if __name__ == '__main__':
+    start_time = time.time()
+    main()
+    end_time = time.time()
+    duration = end_time - start_time
+    print(f"Benchmark took {duration:.6f} seconds", file=sys.stderr)
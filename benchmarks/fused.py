@@ -0,0 +1,97 @@
+#!/usr/bin/python3
+
+"""
+WordNet fused loader benchmark
+Compares the fused single-pass YAML loader with the multi-pass pipeline (load_core(), extend(), resolve(), info()).
+Runs are interleaved, in alternating order, and timings are medians over runs, with their range.
+The fused loader's post-parse work is done while parsing, so it is not timed apart: what is saved is the difference
+of totals, taken per run.
+
+Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
+"""
+
+#  Copyright (c) 2024.
+#  Creative Commons 4 for original code
+#  GPL3 for rewrite
+
+import argparse
+import gc
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from oewn_core.wordnet_fromyaml import load_core
+from oewn_core.wordnet_fused import load as load_fused
+
+
+def timed(f: Callable[[], Any]) -> Tuple[float, Any]:
+    """
+    Time f
+    :param f: function to call
+    :return: duration in seconds, result of f
+    """
+    gc.collect()
+    start = time.perf_counter()
+    result = f()
+    return time.perf_counter() - start, result
+
+
+def multi_pass(home: str) -> Dict[str, float]:
+    """
+    Multi-pass pipeline, timed per pass
+    :param home: home dir for YAML *.yaml file
+    :return: duration per pass
+    """
+    durations: Dict[str, float] = {}
+    durations['parse'], wn = timed(lambda: load_core(home))
+    durations['extend'], _ = timed(wn.extend)
+    durations['resolve'], _ = timed(wn.resolve)
+    durations['count'], _ = timed(lambda: (wn.info(), wn.info_relations()))
+    return durations
+
+
+def benchmark(home: str, repeat: int) -> Dict[str, List[float]]:
+    """
+    Benchmark, runs of both loaders being interleaved in alternating order so that drift affects them alike
+    :param home: home dir for YAML *.yaml file
+    :param repeat: number of runs
+    :return: durations per run, by multi-pass pass ('multi-pass parse', ...), multi-pass total, fused total and saved total
+    """
+    durations: Dict[str, List[float]] = {}
+    for i in range(repeat):
+        if i % 2 == 0:
+            multi = multi_pass(home)
+            fused, _ = timed(lambda: load_fused(home))
+        else:
+            fused, _ = timed(lambda: load_fused(home))
+            multi = multi_pass(home)
+        for name, duration in multi.items():
+            durations.setdefault(f'multi-pass {name}', []).append(duration)
+        total = sum(multi.values())
+        durations.setdefault('multi-pass total', []).append(total)
+        durations.setdefault('fused', []).append(fused)
+        durations.setdefault('saved', []).append(total - fused)
+    return durations
+
+
+def report(durations: Dict[str, List[float]], out=sys.stdout) -> None:
+    print(f'{"":<24}{"median":>10} {"min":>10} {"max":>10}', file=out)
+    for name, runs in durations.items():
+        print(f'{name:<24}{statistics.median(runs):>10.3f}s{min(runs):>10.3f}s{max(runs):>10.3f}s', file=out)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="compare fused single-pass loader with multi-pass pipeline")
+    arg_parser.add_argument('--repeat', type=int, default=5, help='number of runs')
+    arg_parser.add_argument('in_dir', type=str, help='from-dir for yaml')
+    args = arg_parser.parse_args()
+    report(benchmark(args.in_dir, args.repeat))
+
+
+if __name__ == '__main__':
+    start_time = time.time()
+    main()
+    end_time = time.time()
+    duration = end_time - start_time
+    print(f"Benchmark took {duration:.6f} seconds", file=sys.stderr)
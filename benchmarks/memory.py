@@ -0,0 +1,140 @@
+#!/usr/bin/python3
+
+"""
+WordNet model memory benchmark
+Compares the compact (__slots__) layout of model objects with the former per-instance __dict__ layout.
+Both layouts are measured by cloning every model object, the clones sharing the original's attribute values,
+so that the difference is only attributable to object layout.
+
+Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
+"""
+
+#  Copyright (c) 2024.
+#  Creative Commons 4 for original code
+#  GPL3 for rewrite
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple, Type
+
+from oewn_core.wordnet import WordnetModel, Entry, Sense, Synset, Pronunciation, Example, VerbFrame, Slotted
+
+
+def collect(wn: WordnetModel) -> Dict[Type[Slotted], List[Slotted]]:
+    """
+    Collect model objects by class
+    :param wn: model
+    :return: dictionary of class to instances
+    """
+    objects: Dict[Type[Slotted], List[Slotted]] = {c: [] for c in (Entry, Sense, Synset, Sense.Relation, Synset.Relation, Pronunciation, Example, VerbFrame)}
+    for e in wn.entries:
+        objects[Entry].append(e)
+        objects[Pronunciation].extend(e.pronunciations)
+        for s in e.senses:
+            objects[Sense].append(s)
+            objects[Sense.Relation].extend(s.relations)
+    for ss in wn.synsets:
+        objects[Synset].append(ss)
+        objects[Synset.Relation].extend(ss.relations)
+        objects[Example].extend(x for x in ss.examples if isinstance(x, Example))
+    objects[VerbFrame].extend(wn.verbframes)
+    return objects
+
+
+def dict_class(cls: Type[Slotted]) -> Type:
+    """
+    Make the __dict__-based twin of a compact class
+    :param cls: compact class
+    :return: class with the same attributes but held in per-instance __dict__
+    """
+    return type(f'Dict{cls.__name__}', (), {})
+
+
+def clone(objects: List[Slotted], cls: Type) -> List[Any]:
+    """
+    Clone objects as instances of cls, attribute values are shared, not copied
+    :param objects: objects to clone
+    :param cls: class of clones
+    :return: clones
+    """
+    slots = type(objects[0]).__slots__ if objects else ()
+    clones = []
+    for o in objects:
+        c = cls.__new__(cls)
+        for k in slots:
+            setattr(c, k, getattr(o, k))
+        clones.append(c)
+    return clones
+
+
+def measure(f: Callable[[], Any]) -> Tuple[int, Any]:
+    """
+    Measure memory allocated (and retained) by f
+    :param f: function to call
+    :return: allocated size in bytes, result of f (held so that it is not freed before measurement)
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = f()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return size, result
+
+
+def benchmark(wn: WordnetModel) -> List[Tuple[str, int, int, int]]:
+    """
+    Compare layouts
+    :param wn: model
+    :return: list of (class name, count, compact size, dict size)
+    """
+    results = []
+    for cls, objects in collect(wn).items():
+        twin = dict_class(cls)
+        compact_size, compact_clones = measure(lambda: clone(objects, cls))
+        del compact_clones
+        dict_size, dict_clones = measure(lambda: clone(objects, twin))
+        del dict_clones
+        results.append((cls.__qualname__, len(objects), compact_size, dict_size))
+    return results
+
+
+def report(results: List[Tuple[str, int, int, int]], out=sys.stdout) -> None:
+    print(f'{"class":<16}{"count":>10}{"slots":>14}{"dict":>14}{"saved":>14}{"ratio":>8}', file=out)
+    total_compact = 0
+    total_dict = 0
+    for name, count, compact_size, dict_size in results:
+        total_compact += compact_size
+        total_dict += dict_size
+        ratio = compact_size / dict_size if dict_size else 1.
+        print(f'{name:<16}{count:>10}{compact_size:>14,}{dict_size:>14,}{dict_size - compact_size:>14,}{ratio:>8.2f}', file=out)
+    ratio = total_compact / total_dict if total_dict else 1.
+    print(f'{"total":<16}{"":>10}{total_compact:>14,}{total_dict:>14,}{total_dict - total_compact:>14,}{ratio:>8.2f}', file=out)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="compare memory of compact and dict layouts of model objects")
+    arg_parser.add_argument('--pickle', action='store_true', default=False, help='use pickle')
+    arg_parser.add_argument('in_dir', type=str, help='from-dir for yaml/pickle')
+    arg_parser.add_argument('pickled', type=str, nargs='?', default='oewn.pickle', help='from-pickle')
+    args = arg_parser.parse_args()
+
+    if args.pickle:
+        from oewn_core.deserialize import load
+        wn = load(args.in_dir, file=args.pickled)
+    else:
+        from oewn_core.wordnet_fromyaml import load
+        wn = load(args.in_dir)
+    report(benchmark(wn))
+
+
+if __name__ == '__main__':
+    start_time = time.time()
+    main()
+    end_time = time.time()
+    duration = end_time - start_time
+    print(f"Benchmark took {duration:.6f} seconds", file=sys.stderr)
@@ -15,8 +15,13 @@ import argparse
 import pickle
 import sys
 import time
+from typing import Optional, Sequence
 
 from oewn_core.wordnet import WordnetModel
+from oewn_core.wordnet_metrics import LoadMetrics, phase
+from oewn_core.wordnet_overlay import apply_overlay
+from oewn_core.wordnet_strings import intern_model
+from oewn_core.wordnet_text import store_text
 
 
 def load_pickle(path: str, file='wn.pickle') -> WordnetModel:
@@ -27,26 +32,62 @@ def load_pickle(path: str, file='wn.pickle') -> WordnetModel:
         return pickle.load(out)
 
 
-def load(home: str, file='oewn.pickle', extend: bool = True, resolve: bool = False, verbose: bool = False) -> WordnetModel:
+def load(home: str, file='oewn.pickle', extend: bool = True, resolve: bool = False, verbose: bool = False, intern: bool = False, virtual: bool = False, intern_strings: bool = False, lazy_text: bool = False, overlays: Sequence[str] = (),
+         metrics: Optional[LoadMetrics] = None) -> WordnetModel:
     if verbose:
         print(f'loading from pickle {file} in {home}')
-    wn = load_pickle(home, file=file)
+    with phase(metrics, 'unpickle'):
+        start = time.perf_counter()
+        wn = load_pickle(home, file=file)
+        if metrics is not None:
+            metrics.add_file(file, time.perf_counter() - start, len(wn.entries) + len(wn.synsets) + len(wn.verbframes))
     if verbose:
         print(f'loaded {wn} from pickle {file} in {home}')
+    if intern_strings:
+        if verbose:
+            print(f'interning strings')
+        with phase(metrics, 'intern_strings'):
+            intern_model(wn)
+        if verbose:
+            print(f'interned strings: {wn.strings}')
+    if intern:
+        if verbose:
+            print(f'interning relations')
+        with phase(metrics, 'intern'):
+            wn.intern_relations()
+        if verbose:
+            print(f'interned relations: {wn.relation_table}')
+    for overlay in overlays:
+        if verbose:
+            print(f'applying overlay {overlay}')
+        with phase(metrics, f'overlay {overlay}'):
+            replaced, added = apply_overlay(wn, overlay)
+        if verbose:
+            print(f'applied overlay {overlay}: {replaced} replaced, {added} added')
     if extend:
         if verbose:
             print(f'extending relations')
             print(f'before extension: {wn.info_relations()}')
-        wn.extend()
+        with phase(metrics, 'extend'):
+            wn.extend(virtual=virtual)
         if verbose:
             print(f'after extension:  {wn.info_relations()}')
             print(f'extended relations')
     if resolve:
         if verbose:
             print(f'resolving cross-references')
-        wn.resolve()
+        with phase(metrics, 'resolve'):
+            wn.resolve()
         if verbose:
             print(f'resolved cross-references')
+    if lazy_text:
+        with phase(metrics, 'text'):
+            store = store_text(wn)
+        if verbose:
+            print(f'stored text: {store}')
+    if metrics is not None:
+        metrics.count(wn)
+        wn.metrics = metrics
     if verbose:
         print(wn)
         print(wn.info())
@@ -67,8 +108,15 @@ def main() -> WordnetModel:
     arg_parser = argparse.ArgumentParser(description="load from yaml and save")
     arg_parser.add_argument('in_dir', type=str, help='from-dir for pickle')
     arg_parser.add_argument('pickled', type=str, nargs='?', default='oewn.pickle', help='from-pickle')
+    arg_parser.add_argument('--overlay', type=str, action='append', default=[], help='overlay YAML dir, applied on top of pickle (repeatable)')
+    arg_parser.add_argument('--metrics', type=str, default=None, help='save load metrics to this JSON file')
+    arg_parser.add_argument('--trace-memory', action='store_true', default=False, help='record memory peaks in load metrics (slower)')
     args = arg_parser.parse_args()
-    return load(args.in_dir, args.pickled)
+    metrics = LoadMetrics('pickle', f'{args.in_dir}/{args.pickled}', memory=args.trace_memory) if args.metrics else None
+    wn = load(args.in_dir, args.pickled, overlays=args.overlay, metrics=metrics)
+    if metrics is not None:
+        metrics.save(args.metrics)
+    return wn
 
 
 if __name__ == '__main__':
@@ -15,38 +15,83 @@ import argparse
 import glob
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import List, Optional
 
 import yaml
 
+from oewn_core import wordnet_toyaml
+from oewn_core.wordnet_toyaml import dumps, unchanged, write_atomically
 
-def normalize(home: str, verbose: bool = False) -> None:
-    """ Normalize (home dir)"""
+
+def normalize_file(f: str, check: bool = False, fast: Optional[bool] = None) -> bool:
+    """
+    Normalize one file, left untouched if it is already normalized
+    :param f: YAML file
+    :param check: whether the file is only checked, not rewritten
+    :param fast: whether the fast emitter is used, None for wordnet_toyaml.fast_emitter
+    :return: whether the file was not normalized
+    """
+    with open(f, encoding='utf-8') as inp:
+        data = yaml.load(inp, Loader=yaml.CLoader)
+    normalized = dumps(data, fast).encode('utf-8')
+    if unchanged(f, normalized):
+        return False
+    if not check:
+        write_atomically(f, normalized)
+    return True
+
+
+def normalize(home: str, verbose: bool = False, jobs: int = 1, check: bool = False) -> List[str]:
+    """
+    Normalize (home dir)
+    :param home: home dir for YAML *.yaml files
+    :param verbose: whether to print progress
+    :param jobs: number of processes that files are normalized in
+    :param check: whether files are only checked, not rewritten
+    :return: files that were not normalized (and, unless check, have been rewritten)
+    """
     if verbose:
-        print(f'normalizing YAML in {home}')
-    for f in glob.glob(f"{home}/*.yaml"):
-        data = yaml.load(open(f), Loader=yaml.CLoader)
-        with open(f, "w", encoding='utf-8') as out:
-            yaml.dump(data, out, allow_unicode=True)
+        print(f'{"checking" if check else "normalizing"} YAML in {home}')
+    files = sorted(glob.glob(f"{home}/*.yaml"))
+    if jobs > 1:
+        # the emitter flag is passed along, as worker processes may not share the module's state
+        with ProcessPoolExecutor(jobs) as executor:
+            results = list(executor.map(partial(normalize_file, check=check, fast=wordnet_toyaml.fast_emitter), files))
+    else:
+        results = [normalize_file(f, check) for f in files]
+    not_normalized = [f for f, r in zip(files, results) if r]
     if verbose:
-        print(f'normalized YAML in {home}')
+        print(f'{"checked" if check else "normalized"} YAML in {home}, {len(not_normalized)} of {len(files)} files not normalized')
+    return not_normalized
 
 
-def main() -> None:
+def main() -> bool:
     """
     WordNet normalize
     Will test YAML well-formedness
     Will have a limited normalizing effect, after which it's not modified
     YAML keys are not alphabetically reordered,
     turn to load()-save() if this is desired
+    Files that are already normalized are not rewritten.
+    :return: whether, when checking, all files are normalized
     """
     arg_parser = argparse.ArgumentParser(description="load from yaml and save")
+    arg_parser.add_argument('--jobs', type=int, default=1, help='number of processes that files are normalized in')
+    arg_parser.add_argument('--check', action='store_true', default=False, help='only report files that are not normalized, exit with status 1 if any')
     arg_parser.add_argument('in_dir', type=str, help='from-dir')
     args = arg_parser.parse_args()
-    normalize(args.in_dir)
+    not_normalized = normalize(args.in_dir, jobs=args.jobs, check=args.check)
+    for f in not_normalized:
+        print(f'{"not normalized" if args.check else "normalized"}: {f}')
+    return not args.check or not not_normalized
+
 
 if __name__ == '__main__':
     start_time = time.time()
-    main()
+    ok = main()
     end_time = time.time()
     duration = end_time - start_time
     print(f"Normalizing took {duration:.6f} seconds", file=sys.stderr)
+    sys.exit(0 if ok else 1)
@@ -18,6 +18,7 @@ import time
 
 from oewn_core.wordnet import WordnetModel
 from oewn_core.wordnet_fromyaml import load
+from oewn_core.wordnet_metrics import LoadMetrics, phase
 
 
 def save_pickle(wn: WordnetModel, path: str, file: str = 'wn.pickle', verbose: bool = False) -> None:
@@ -39,13 +40,21 @@ def main() -> WordnetModel:
     Will have a normalizing effect, after which it's not modified
     """
     arg_parser = argparse.ArgumentParser(description="load from yaml and save")
+    arg_parser.add_argument('--jobs', type=int, default=1, help='number of processes that files are parsed in')
+    arg_parser.add_argument('--stream', action='store_true', default=False, help='stream files one record at a time')
     arg_parser.add_argument('in_dir', type=str, help='from-dir')
     arg_parser.add_argument('out_dir', type=str, help='to-dir for pickle')
     arg_parser.add_argument('pickled', type=str, nargs='?', default='oewn.pickle', help='to-pickle')
+    arg_parser.add_argument('--metrics', type=str, default=None, help='save load (and pickle) metrics to this JSON file')
+    arg_parser.add_argument('--trace-memory', action='store_true', default=False, help='record memory peaks in metrics (slower)')
     args = arg_parser.parse_args()
 
-    wn = load(args.in_dir)
-    save_pickle(wn, args.out_dir, args.pickled)
+    metrics = LoadMetrics('yaml', args.in_dir, memory=args.trace_memory) if args.metrics else None
+    wn = load(args.in_dir, jobs=args.jobs, stream=args.stream, metrics=metrics)
+    with phase(metrics, 'pickle'):
+        save_pickle(wn, args.out_dir, args.pickled)
+    if metrics is not None:
+        metrics.save(args.metrics)
     return wn
 
 
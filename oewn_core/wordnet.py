@@ -10,12 +10,82 @@ Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
 #  GPL3 for rewrite
 
 from enum import StrEnum, Enum
-from typing import Any, Optional, Tuple, List, Dict, Set, Generator
+from typing import Any, Optional, Tuple, List, Dict, Set, Generator, Sequence
 
 
-class Entry:
+class Slotted:
+    """
+    Base of compact model classes.
+    Instances have no per-instance __dict__, their attributes are held in __slots__.
+    Pickled state is the same attribute dictionary as the former __dict__-based classes',
+    so that pickles remain interchangeable.
+    """
+
+    __slots__ = ()
+
+    transient: Tuple[str, ...] = ()
+    """ Slots that are excluded from being pickled (and reset to None when unpickled) """
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {k: getattr(self, k) for k in self.__slots__ if k not in self.transient and hasattr(self, k)}
+
+    def __setstate__(self, state) -> None:
+        for k, v in state.items():
+            setattr(self, k, v)
+        for k in self.transient:
+            setattr(self, k, None)  # restore o a default or None value
+
+
+class LazyResolution:
+    """
+    Lazy resolution context of a model (see WordnetModel.resolve(lazy=True)).
+    Objects that are resolved lazily hold their model's context in their resolved_* slot until first access, when it is
+    replaced by what the model's resolvers resolve (None if they can't), so that each object resolves through its own
+    model and a missed lookup is not repeated.
+    """
+
+    __slots__ = ('model',)
+
+    def __init__(self, model: 'WordnetModel') -> None:
+        self.model: Optional[WordnetModel] = model  # None when lazy resolution has ended
+
+    def synset(self, synsetid: str) -> Optional['Synset']:
+        return self.model.synset_resolver.get(synsetid) if self.model is not None else None
+
+    def sense(self, senseid: str) -> Optional['Sense']:
+        return self.model.sense_resolver.get(senseid) if self.model is not None else None
+
+    def members(self, synset: 'Synset') -> Optional[List['Entry']]:
+        if self.model is None:
+            return None
+        member_resolver = self.model.member_resolver
+        return [member_resolver.get((m, synset.id)) for m in synset.members]
+
+
+class LazyText:
+    """
+    Lazy text handle.
+    Synsets whose text (definitions, examples, usages, ILI definition) has been moved to a text store hold a handle
+    to it instead, the text being fetched on first access (see wordnet_text).
+    The handle holds its store, so the store lives as long as the synsets whose text it holds.
+    """
+
+    __slots__ = ('store', 'index')
+
+    def __init__(self, store: Any, index: int) -> None:
+        self.store: Any = store
+        self.index: int = index
+
+    def get(self) -> Tuple[List[str], List[Any], List[str], Optional[str]]:
+        """ Text fields, read from store """
+        return self.store.get(self.index)
+
+
+class Entry(Slotted):
     """The lexical entry consists of a single word"""
 
+    __slots__ = ('lemma', 'pos', 'discriminant', 'forms', 'pronunciations', 'senses')
+
     def __init__(self, lemma, pos, discriminant) -> None:
         self.lemma: str = lemma
         self.pos: str = pos
@@ -35,9 +105,12 @@ class Entry:
         return self.lemma, self.pos, self.discriminant
 
 
-class Sense:
+class Sense(Slotted):
     """ The sense links an entry to a synset """
 
+    __slots__ = ('id', 'entry', 'synsetid', '_resolved_synset', 'adjposition', 'examples', 'verbframeids', 'relations')
+    transient = ('_resolved_synset',)
+
     def __init__(self, senseid, entry, synsetid, adjposition=None) -> None:
         self.id: str = senseid
         self.entry: Entry = entry
@@ -54,19 +127,31 @@ class Sense:
     def __repr__(self) -> str:
         return f'{self.id} @{self.synsetid}'
 
-    def __getstate__(self) -> Dict[str, Any]:
-        state = self.__dict__.copy()
-        if 'resolved_synset' in state:
-            del state['resolved_synset']  # exclude from being pickled
-        return state
-
-    def __setstate__(self, state) -> None:
-        self.__dict__.update(state)
-        self.resolved_synset = None  # restore o a default or None value
+    @property
+    def resolved_synset(self) -> Optional['Synset']:
+        synset = self._resolved_synset
+        if type(synset) is LazyResolution:
+            synset = synset.synset(self.synsetid)
+            self._resolved_synset = synset
+        return synset
+
+    @resolved_synset.setter
+    def resolved_synset(self, synset: Optional['Synset']) -> None:
+        self._resolved_synset = synset
+
+    def stale(self, resolution: Optional[LazyResolution] = None) -> None:
+        """
+        Stale this sense's resolved synset (its relations' resolved targets are staled separately)
+        :param resolution: lazy resolution context of the model, for the synset to be resolved again on next access, None for it to be resolved again by resolve()
+        """
+        self._resolved_synset = resolution
 
-    class Relation:
+    class Relation(Slotted):
         """ Lexical relation (sense to sense)"""
 
+        __slots__ = ('target', '_resolved_target', 'relation_type', 'other_type')
+        transient = ('_resolved_target',)
+
         class Type(StrEnum):
             ANTONYM: str = 'antonym'
             ALSO: str = 'also'
@@ -125,21 +210,37 @@ class Sense:
         def __repr__(self) -> str:
             return f'{self.relation_type}: {self.target}'
 
-        def __getstate__(self) -> dict[str, Any]:
-            state = self.__dict__.copy()
-            if 'resolved_target' in state:
-                del state['resolved_target']  # exclude from being pickled
-            return state
+        @property
+        def resolved_target(self) -> Optional['Sense']:
+            target = self._resolved_target
+            if type(target) is LazyResolution:
+                target = target.sense(self.target)
+                self._resolved_target = target
+            return target
+
+        @resolved_target.setter
+        def resolved_target(self, sense: Optional['Sense']) -> None:
+            self._resolved_target = sense
 
-        def __setstate__(self, state) -> None:
-            self.__dict__.update(state)
-            self.resolved_target = None  # restore o a default or None value
+        def stale(self, resolution: Optional[LazyResolution] = None) -> None:
+            """
+            Stale this relation's resolved target
+            :param resolution: lazy resolution context of the model, for the target to be resolved again on next access, None for it to be resolved again by resolve()
+            """
+            self._resolved_target = resolution
 
 
-class Synset:
+class Synset(Slotted):
     """ Synset, a collection of members that share a common meaning """
 
+    __slots__ = ('id', 'pos', 'members', '_resolved_members', 'lex_name', '_definitions', '_examples', '_usages', '_ili_definition', '_text', 'source', 'wikidata', 'ili', 'relations')
+    transient = ('_resolved_members',)
+
+    text_fields: Tuple[str, ...] = ('definitions', 'examples', 'usages', 'ili_definition')
+    """ Text fields, that may be fetched lazily from a text store """
+
     def __init__(self, synsetid, pos, members, lex_name) -> None:
+        self._text: Optional[LazyText] = None
         self.id: str = synsetid
         self.pos: str = PartOfSpeech(pos).value
         self.members: List[str] = members
@@ -160,19 +261,102 @@ class Synset:
     def __repr__(self) -> str:
         return f'{self.id} [{' '.join(self.members)}]'
 
+    @property
+    def resolved_members(self) -> Optional[List[Entry]]:
+        members = self._resolved_members
+        if type(members) is LazyResolution:
+            members = members.members(self)
+            self._resolved_members = members
+        return members
+
+    @resolved_members.setter
+    def resolved_members(self, members: Optional[List[Entry]]) -> None:
+        self._resolved_members = members
+
+    def stale(self, resolution: Optional[LazyResolution] = None) -> None:
+        """
+        Stale this synset's resolved members (its relations' resolved targets are staled separately)
+        :param resolution: lazy resolution context of the model, for the members to be resolved again on next access, None for them to be resolved again by resolve()
+        """
+        self._resolved_members = resolution
+
+    # text, fetched on first access if it has been moved to a text store
+
+    def text(self) -> Tuple[List[str], List['str | Example'], List[str], Optional[str]]:
+        """ Text fields, read from text store if they are in one, without being fetched """
+        if self._text is not None:
+            return self._text.get()
+        return self._definitions, self._examples, self._usages, self._ili_definition
+
+    def fetch_text(self) -> None:
+        """ Fetch text fields from text store, if they are in one """
+        if self._text is not None:
+            self._definitions, self._examples, self._usages, self._ili_definition = self.text()
+            self._text = None
+
+    @property
+    def definitions(self) -> List[str]:
+        if self._text is not None:
+            self.fetch_text()
+        return self._definitions
+
+    @definitions.setter
+    def definitions(self, definitions: List[str]) -> None:
+        self.fetch_text()
+        self._definitions = definitions
+
+    @property
+    def examples(self) -> List['str | Example']:
+        if self._text is not None:
+            self.fetch_text()
+        return self._examples
+
+    @examples.setter
+    def examples(self, examples: List['str | Example']) -> None:
+        self.fetch_text()
+        self._examples = examples
+
+    @property
+    def usages(self) -> List[str]:
+        if self._text is not None:
+            self.fetch_text()
+        return self._usages
+
+    @usages.setter
+    def usages(self, usages: List[str]) -> None:
+        self.fetch_text()
+        self._usages = usages
+
+    @property
+    def ili_definition(self) -> Optional[str]:
+        if self._text is not None:
+            self.fetch_text()
+        return self._ili_definition
+
+    @ili_definition.setter
+    def ili_definition(self, ili_definition: Optional[str]) -> None:
+        self.fetch_text()
+        self._ili_definition = ili_definition
+
     def __getstate__(self) -> Dict[str, Any]:
-        state = self.__dict__.copy()
-        if 'resolved_members' in state:
-            del state['resolved_members']  # exclude from being pickled
+        # text under its public names, read from text store if it is in one
+        state = super().__getstate__()
+        del state['_text']
+        for k, v in zip(self.text_fields, self.text()):
+            del state[f'_{k}']
+            state[k] = v
         return state
 
     def __setstate__(self, state) -> None:
-        self.__dict__.update(state)
-        self.resolved_members = None  # restore o a default or None value
+        self._text = None
+        super().__setstate__(state)
 
-    class Relation:
+    class Relation(Slotted):
         """ Semantic relation (synset to synset)"""
 
+        __slots__ = ('target', '_resolved_target', 'relation_type')
+        transient = ('_resolved_target',)
+
         class Type(StrEnum):
             AGENT: str = 'agent'
             ALSO: str = 'also'
@@ -330,15 +514,24 @@ class Synset:
         def __repr__(self) -> str:
             return f'{self.relation_type}: {self.target}'
 
-        def __getstate__(self) -> dict[str, Any]:
-            state = self.__dict__.copy()
-            if 'resolved_target' in state:
-                del state['resolved_target']  # exclude from being pickled
-            return state
+        @property
+        def resolved_target(self) -> Optional['Synset']:
+            target = self._resolved_target
+            if type(target) is LazyResolution:
+                target = target.synset(self.target)
+                self._resolved_target = target
+            return target
 
-        def __setstate__(self, state) -> None:
-            self.__dict__.update(state)
-            self.resolved_target = None  # restore o a default or None value
+        @resolved_target.setter
+        def resolved_target(self, synset: Optional['Synset']) -> None:
+            self._resolved_target = synset
+
+        def stale(self, resolution: Optional[LazyResolution] = None) -> None:
+            """
+            Stale this relation's resolved target
+            :param resolution: lazy resolution context of the model, for the target to be resolved again on next access, None for it to be resolved again by resolve()
+            """
+            self._resolved_target = resolution
 
 
 ignored_symmetric_synset_relations: Set[Synset.Relation.Type] = {
@@ -382,26 +575,245 @@ ignored_symmetric_sense_relations: Set[Sense.Relation.Type] = {
     Sense.Relation.Type.IS_EXEMPLIFIED_BY
 }
 
+extended_synset_relations: Dict[str, str] = {t.value: inv_t.value for t, inv_t in Synset.Relation.inverses.items() if inv_t != t and t not in ignored_symmetric_synset_relations}
+""" Synset relation types that extension adds inverses for, mapped to the inverse relation type """
+
+extended_sense_relations: Dict[str, str] = {t.value: inv_t.value for t, inv_t in Sense.Relation.inverses.items() if inv_t != t and t not in ignored_symmetric_sense_relations}
+""" Sense relation types that extension adds inverses for, mapped to the inverse relation type """
+
+synset_relation_types: Set[str] = {t.value for t in Synset.Relation.Type}
+""" Known synset relation types """
+
+sense_relation_types: Set[str] = {t.value for t in Sense.Relation.Type}
+""" Known sense relation types, 'other' types excepted """
+
+
+def inverse_synset_relation_type(relation_type: str, synsetid: str) -> Optional[str]:
+    """
+    Inverse relation type that extension adds for synset relation type
+    :param relation_type: relation type
+    :param synsetid: source synset id, for error reporting
+    :return: inverse relation type, None if the type is known but extension adds no inverse for it
+    :raises: ValueError if the relation type is unknown
+    """
+    inv_t = extended_synset_relations.get(relation_type)
+    if inv_t is None and relation_type not in synset_relation_types:
+        raise ValueError(f'Unknown relation type {relation_type} in synset {synsetid}')
+    return inv_t
+
+
+def inverse_sense_relation_type(relation_type: str, senseid: str) -> Optional[str]:
+    """
+    Inverse relation type that extension adds for sense relation type ('other' types are not extended)
+    :param relation_type: relation type
+    :param senseid: source sense id, for error reporting
+    :return: inverse relation type, None if the type is known but extension adds no inverse for it
+    :raises: ValueError if the relation type is unknown
+    """
+    inv_t = extended_sense_relations.get(relation_type)
+    if inv_t is None and relation_type not in sense_relation_types:
+        raise ValueError(f'Unknown relation type {relation_type} in sense {senseid}')
+    return inv_t
+
+
+class InternedSenseRelation(Sense.Relation):
+    """
+    Immutable, hashable sense relation (flyweight), as interned in a relation table.
+    The instance is shared by all the senses of the table's model that have the same relation to the same target,
+    so it is not resolved eagerly: resolution is a side lookup (see WordnetModel.resolve_target), which resolved_target
+    performs, and caches, when resolution is lazy
+    """
+
+    __slots__ = ()
+
+    def __init__(self, target, relation_type, other_type=False) -> None:
+        object.__setattr__(self, 'target', target)
+        object.__setattr__(self, 'relation_type', relation_type)
+        object.__setattr__(self, 'other_type', other_type)
+        object.__setattr__(self, '_resolved_target', None)
+
+    def __setattr__(self, key, value) -> None:
+        raise AttributeError(f'Interned relation {self} is immutable')
+
+    def __delattr__(self, key) -> None:
+        raise AttributeError(f'Interned relation {self} is immutable')
+
+    @property
+    def resolved_target(self) -> Optional[Sense]:
+        target = self._resolved_target
+        if type(target) is LazyResolution:
+            target = target.sense(self.target)
+            object.__setattr__(self, '_resolved_target', target)
+        return target
+
+    def stale(self, resolution: Optional[LazyResolution] = None) -> None:
+        object.__setattr__(self, '_resolved_target', resolution)
+
+    @property
+    def key(self) -> Tuple[str, str, bool]:
+        return self.target, self.relation_type, self.other_type
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, InternedSenseRelation) and self.key == other.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return InternedSenseRelation, self.key
+
+
+class InternedSynsetRelation(Synset.Relation):
+    """
+    Immutable, hashable synset relation (flyweight), as interned in a relation table.
+    The instance is shared by all the synsets of the table's model that have the same relation to the same target,
+    so it is not resolved eagerly: resolution is a side lookup (see WordnetModel.resolve_target), which resolved_target
+    performs, and caches, when resolution is lazy
+    """
+
+    __slots__ = ()
+
+    def __init__(self, target, relation_type) -> None:
+        object.__setattr__(self, 'target', target)
+        object.__setattr__(self, 'relation_type', relation_type)
+        object.__setattr__(self, '_resolved_target', None)
+
+    def __setattr__(self, key, value) -> None:
+        raise AttributeError(f'Interned relation {self} is immutable')
+
+    def __delattr__(self, key) -> None:
+        raise AttributeError(f'Interned relation {self} is immutable')
+
+    @property
+    def resolved_target(self) -> Optional[Synset]:
+        target = self._resolved_target
+        if type(target) is LazyResolution:
+            target = target.synset(self.target)
+            object.__setattr__(self, '_resolved_target', target)
+        return target
+
+    def stale(self, resolution: Optional[LazyResolution] = None) -> None:
+        object.__setattr__(self, '_resolved_target', resolution)
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        return self.target, self.relation_type
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, InternedSynsetRelation) and self.key == other.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return InternedSynsetRelation, self.key
+
+
+class RelationTable:
+    """
+    Per-model table of interned relations.
+    Identical edges (same target, same type) share one instance.
+    """
+
+    def __init__(self) -> None:
+        self.sense_relations: Dict[Tuple[str, str, bool], InternedSenseRelation] = {}
+        self.synset_relations: Dict[Tuple[str, str], InternedSynsetRelation] = {}
+        self.requests: int = 0
+        self.resolution: Optional[LazyResolution] = None  # lazy resolution context of the model, that relations are interned with
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state['resolution']
+        return state
+
+    def __setstate__(self, state) -> None:
+        self.resolution = None
+        self.__dict__.update(state)
+
+    def __str__(self) -> str:
+        return f'{len(self)} interned relations for {self.requests} requests'
+
+    def __len__(self) -> int:
+        return len(self.sense_relations) + len(self.synset_relations)
+
+    def sense_relation(self, target: str, relation_type: str, other_type: bool = False) -> InternedSenseRelation:
+        """
+        Get interned sense relation, interning it if it is not in the table yet
+        :param target: target sense id
+        :param relation_type: relation type
+        :param other_type: whether relation type is one of the 'other' types
+        :return: interned sense relation
+        """
+        self.requests += 1
+        k = (target, relation_type, other_type)
+        r = self.sense_relations.get(k)
+        if r is None:
+            r = InternedSenseRelation(target, relation_type, other_type)
+            if self.resolution is not None:
+                r.stale(self.resolution)
+            self.sense_relations[k] = r
+        return r
+
+    def synset_relation(self, target: str, relation_type: str) -> InternedSynsetRelation:
+        """
+        Get interned synset relation, interning it if it is not in the table yet
+        :param target: target synset id
+        :param relation_type: relation type
+        :return: interned synset relation
+        """
+        self.requests += 1
+        k = (target, relation_type)
+        r = self.synset_relations.get(k)
+        if r is None:
+            r = InternedSynsetRelation(target, relation_type)
+            if self.resolution is not None:
+                r.stale(self.resolution)
+            self.synset_relations[k] = r
+        return r
+
+    def stale(self, resolution: Optional[LazyResolution] = None) -> None:
+        """
+        Stale the resolved targets of interned relations
+        :param resolution: lazy resolution context of the model, that relations interned from now on are also resolved with, None if resolution is not lazy
+        """
+        self.resolution = resolution
+        for r in self.sense_relations.values():
+            r.stale(resolution)
+        for r in self.synset_relations.values():
+            r.stale(resolution)
+
+    def intern_sense_relations(self, relations: List[Sense.Relation]) -> List[Sense.Relation]:
+        return [self.sense_relation(r.target, r.relation_type, r.other_type) for r in relations]
+
+    def intern_synset_relations(self, relations: List[Synset.Relation]) -> List[Synset.Relation]:
+        return [self.synset_relation(r.target, r.relation_type) for r in relations]
+
 
-class Pronunciation:
+class Pronunciation(Slotted):
     """ Pronunciation of a lemma"""
 
+    __slots__ = ('value', 'variety')
+
     def __init__(self, value, variety=None) -> None:
         self.value: str = value
         self.variety: Optional[str] = variety
 
 
-class Example:
+class Example(Slotted):
     """ Sourced example """
 
+    __slots__ = ('text', 'source')
+
     def __init__(self, text, source=None) -> None:
         self.text: str = text
         self.source: Optional[str] = source
 
 
-class VerbFrame:
+class VerbFrame(Slotted):
     """ Verb frame """
 
+    __slots__ = ('id', 'verbframe')
+
     def __init__(self, fid, verbframe) -> None:
         self.id: str = fid
         self.verbframe: str = verbframe
@@ -417,6 +829,131 @@ class PartOfSpeech(Enum):
     ADJECTIVE_SATELLITE: str = 's'
 
 
+class Adjacency:
+    """
+    Adjacency index of relations of one kind (synset or sense relations), by relation type, in both directions
+    """
+
+    none: Tuple[str, ...] = ()
+
+    def __init__(self) -> None:
+        self.outgoing: Dict[str, Dict[str, List[str]]] = {}  # source id -> relation type -> target ids
+        self.incoming: Dict[str, Dict[str, List[str]]] = {}  # target id -> relation type -> source ids
+        self.inverses: Dict[str, List[Tuple[str, str]]] = {}  # source id -> (relation type, target id) of virtual inverses
+
+    def add(self, source: str, relation_type: str, target: str) -> None:
+        self.outgoing.setdefault(source, {}).setdefault(relation_type, []).append(target)
+        self.incoming.setdefault(target, {}).setdefault(relation_type, []).append(source)
+
+    def add_inverse(self, source: str, relation_type: str, target: str) -> None:
+        """
+        Add virtual inverse relation, one that is indexed but not stored in the source's relations
+        :param source: source id
+        :param relation_type: relation type
+        :param target: target id
+        """
+        self.add(source, relation_type, target)
+        self.inverses.setdefault(source, []).append((relation_type, target))
+
+    def virtual_inverses(self, source: str) -> Sequence[Tuple[str, str]]:
+        """
+        Virtual inverse relations from source
+        :param source: source id
+        :return: (relation type, target id) of virtual inverses, must not be modified
+        """
+        return self.inverses.get(source, self.none)
+
+    def targets(self, source: str, relation_type: str) -> Sequence[str]:
+        """
+        Targets of relations of given type from source
+        :param source: source id
+        :param relation_type: relation type
+        :return: target ids, must not be modified
+        """
+        by_type = self.outgoing.get(source)
+        return by_type.get(relation_type, self.none) if by_type else self.none
+
+    def sources(self, target: str, relation_type: str) -> Sequence[str]:
+        """
+        Sources of relations of given type to target
+        :param target: target id
+        :param relation_type: relation type
+        :return: source ids, must not be modified
+        """
+        by_type = self.incoming.get(target)
+        return by_type.get(relation_type, self.none) if by_type else self.none
+
+
+class TrackedList(list):
+    """
+    List that notifies a listener when its content is mutated
+    """
+
+    __slots__ = ('listener',)
+
+    def __init__(self, iterable=(), listener=None) -> None:
+        super().__init__(iterable)
+        self.listener = listener
+
+    def changed(self) -> None:
+        if self.listener is not None:
+            self.listener()
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return list, (list(self),)  # pickled as plain list, without listener
+
+    def __setitem__(self, i, value) -> None:
+        super().__setitem__(i, value)
+        self.changed()
+
+    def __delitem__(self, i) -> None:
+        super().__delitem__(i)
+        self.changed()
+
+    def __iadd__(self, other):
+        result = super().__iadd__(other)
+        self.changed()
+        return result
+
+    def __imul__(self, n):
+        result = super().__imul__(n)
+        self.changed()
+        return result
+
+    def append(self, item) -> None:
+        super().append(item)
+        self.changed()
+
+    def extend(self, items) -> None:
+        super().extend(items)
+        self.changed()
+
+    def insert(self, i, item) -> None:
+        super().insert(i, item)
+        self.changed()
+
+    def remove(self, item) -> None:
+        super().remove(item)
+        self.changed()
+
+    def pop(self, i=-1):
+        result = super().pop(i)
+        self.changed()
+        return result
+
+    def clear(self) -> None:
+        super().clear()
+        self.changed()
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self.changed()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self.changed()
+
+
 class WordnetModel:
     """
     The Model/Lexicon contains all the synsets and entries
@@ -433,6 +970,17 @@ class WordnetModel:
         self.version: str = version
         self.url: str = url
 
+        # cached indexes, invalidated when entries/verbframes are mutated
+        self._entry_resolver: Optional[Dict[Tuple[str, str, str | None], Entry]] = None
+        self._verbframe_resolver: Optional[Dict[str, str]] = None
+
+        # cached adjacency indexes, invalidated by extend() and rebuild_indexes()
+        self._synset_adjacency: Optional[Adjacency] = None
+        self._sense_adjacency: Optional[Adjacency] = None
+
+        # extension mode
+        self.virtual_extension: bool = False  # True when inverse relations are served by the adjacency indexes instead of being stored
+
         # data
         self.entries: List[Entry] = []
         self.synsets: List[Synset] = []
@@ -443,9 +991,102 @@ class WordnetModel:
         self.sense_resolver: Dict[str, Sense] = {}
         self.member_resolver: Dict[Tuple[str, str], Entry] = {}  # key is (lemma,synsetid)
 
+        # flyweights
+        self.relation_table: Optional[RelationTable] = None  # not None when relations are interned
+
+        # string pool (see wordnet_strings)
+        self.strings: Optional[Any] = None  # not None when identifier strings are interned, in this pool that reloads and overlays intern in too
+
+        # lazy resolution
+        self.resolution: Optional[LazyResolution] = None  # not None when cross-references are resolved on first access
+
+        # columnar relation stores (see wordnet_graph)
+        self.synset_graph: Optional[Any] = None  # not None when synset relations are views over a columnar store
+        self.sense_graph: Optional[Any] = None  # not None when sense relations are views over a columnar store
+
+        # dense integer ids (see wordnet_ids)
+        self.dense_ids: Optional[Any] = None  # not None when dense integer ids have been assigned
+
+        # stored extension
+        self.extended: bool = False  # True when inverse relations have been added to relation sets by extend()
+
+        # text store (see wordnet_text)
+        self.text_store: Optional[Any] = None  # not None when synsets' text is fetched lazily from a text store
+
+        # source files (see wordnet_reload)
+        self.sources: Optional[Dict[str, Optional[Tuple[int, int, Optional[str]]]]] = None  # fingerprints of YAML files (None if left out), keyed by file name, when loaded from YAML
+
+        # load metrics (see wordnet_metrics)
+        self.metrics: Optional[Any] = None  # not None when the loader was asked to record metrics
+
     def __str__(self) -> str:
         return f"Wordnet '{self.id}'"
 
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        # data under their public names, cached indexes excluded from being pickled
+        state['entries'] = state.pop('_entries')
+        state['verbframes'] = state.pop('_verbframes')
+        del state['_entry_resolver']
+        del state['_verbframe_resolver']
+        del state['_synset_adjacency']
+        del state['_sense_adjacency']
+        del state['text_store']  # text is pickled with the synsets
+        del state['metrics']  # metrics are of the load, not of the model
+        del state['resolution']  # resolved fields are not pickled
+        del state['strings']  # pools are of the load, unpickled strings are not interned
+        return state
+
+    def __setstate__(self, state) -> None:
+        # defaults for members that pickles produced by earlier versions lack
+        self.relation_table = None
+        self.synset_graph = None
+        self.sense_graph = None
+        self.dense_ids = None
+        self.virtual_extension = False
+        self.extended = False
+        self.sources = None
+        self.text_store = None
+        self.metrics = None
+        self.resolution = None
+        self.strings = None
+        self._entry_resolver = None
+        self._verbframe_resolver = None
+        self._synset_adjacency = None
+        self._sense_adjacency = None
+        entries = state.pop('entries')
+        verbframes = state.pop('verbframes')
+        self.__dict__.update(state)
+        self.entries = entries
+        self.verbframes = verbframes
+        if 'extended' not in state:
+            # earlier versions did not record extension, though they pickled extended models
+            self.extended = self.stores_inverses()
+
+    @property
+    def entries(self) -> List[Entry]:
+        return self._entries
+
+    @entries.setter
+    def entries(self, entries: List[Entry]) -> None:
+        self._entries = TrackedList(entries, self.invalidate_entry_resolver)
+        self._entry_resolver = None
+
+    @property
+    def verbframes(self) -> List[VerbFrame]:
+        return self._verbframes
+
+    @verbframes.setter
+    def verbframes(self, verbframes: List[VerbFrame]) -> None:
+        self._verbframes = TrackedList(verbframes, self.invalidate_verbframe_resolver)
+        self._verbframe_resolver = None
+
+    def invalidate_entry_resolver(self) -> None:
+        self._entry_resolver = None
+
+    def invalidate_verbframe_resolver(self) -> None:
+        self._verbframe_resolver = None
+
     def info(self) -> str:
         """ Counts """
         return f'{self} has {len(self.entries)} entries, {len(self.synsets)} synsets and {sum(1 for _ in self.senses)} senses'
@@ -456,7 +1097,14 @@ class WordnetModel:
 
     @property
     def entry_resolver(self) -> Dict[Tuple[str, str, str | None], Entry]:
-        return {e.key: e for e in self.entries}
+        """
+        Entry resolver from (lemma, pos, discriminant) key.
+        Built on first access and kept until entries list is mutated or reassigned.
+        Changes to entries' keys are not tracked: call rebuild_indexes() after such changes.
+        """
+        if self._entry_resolver is None:
+            self._entry_resolver = {e.key: e for e in self.entries}
+        return self._entry_resolver
 
     @property
     def senses(self) -> Generator[Sense, None, None]:
@@ -481,56 +1129,296 @@ class WordnetModel:
 
     @property
     def verbframe_resolver(self) -> Dict[str, str]:
-        """ Verb frame resolver factory from id """
-        return {f.id: f.verbframe for f in self.verbframes}
+        """
+        Verb frame resolver from id.
+        Built on first access and kept until verbframes list is mutated or reassigned.
+        """
+        if self._verbframe_resolver is None:
+            self._verbframe_resolver = {f.id: f.verbframe for f in self.verbframes}
+        return self._verbframe_resolver
+
+    def rebuild_indexes(self) -> None:
+        """
+        Rebuild all indexes (synset, sense, member, entry, verbframe resolvers) from model data
+        """
+        self.synset_resolver = {ss.id: ss for ss in self.synsets}
+        self.sense_resolver = {}
+        self.member_resolver = {}
+        for e in self.entries:
+            for s in e.senses:
+                self.sense_resolver[s.id] = s
+                self.member_resolver[(e.lemma, s.synsetid)] = e
+        self._entry_resolver = {e.key: e for e in self.entries}
+        self._verbframe_resolver = {f.id: f.verbframe for f in self.verbframes}
+        self.invalidate_adjacency()
+
+    # A D J A C E N C Y
+
+    @property
+    def synset_adjacency(self) -> Adjacency:
+        """
+        Synset relations adjacency index, including inverse relations if extension is virtual.
+        Built on first access and kept until extend() or rebuild_indexes() is called.
+        Direct changes to relations are not tracked: call invalidate_adjacency() after such changes.
+        """
+        if self._synset_adjacency is None:
+            adjacency = Adjacency()
+            for ss in self.synsets:
+                for r in ss.relations:
+                    adjacency.add(ss.id, r.relation_type, r.target)
+            if self.virtual_extension:
+                edges = self.synset_edges()
+                for ss in self.synsets:
+                    for r in ss.relations:
+                        inv_t = inverse_synset_relation_type(r.relation_type, ss.id)
+                        if inv_t is not None and (r.target, inv_t, ss.id) not in edges:
+                            edges.add((r.target, inv_t, ss.id))
+                            adjacency.add_inverse(r.target, inv_t, ss.id)
+            self._synset_adjacency = adjacency
+        return self._synset_adjacency
+
+    @property
+    def sense_adjacency(self) -> Adjacency:
+        """
+        Sense relations adjacency index, including inverse relations if extension is virtual.
+        Built on first access and kept until extend() or rebuild_indexes() is called.
+        Direct changes to relations are not tracked: call invalidate_adjacency() after such changes.
+        """
+        if self._sense_adjacency is None:
+            adjacency = Adjacency()
+            for s in self.senses:
+                for r in s.relations:
+                    adjacency.add(s.id, r.relation_type, r.target)
+            if self.virtual_extension:
+                edges = self.sense_edges()
+                for s in self.senses:
+                    for r in s.relations:
+                        inv_t = None if r.other_type else inverse_sense_relation_type(r.relation_type, s.id)
+                        if inv_t is not None and (r.target, inv_t, s.id) not in edges:
+                            edges.add((r.target, inv_t, s.id))
+                            adjacency.add_inverse(r.target, inv_t, s.id)
+            self._sense_adjacency = adjacency
+        return self._sense_adjacency
+
+    def invalidate_adjacency(self) -> None:
+        self._synset_adjacency = None
+        self._sense_adjacency = None
+
+    def adjacency_of(self, node_id: str) -> Adjacency:
+        """
+        Adjacency index for synset or sense id
+        :param node_id: synset id or sense id
+        :return: synset adjacency if node_id is a synset id, sense adjacency otherwise
+        """
+        return self.synset_adjacency if node_id in self.synset_resolver else self.sense_adjacency
+
+    def outgoing(self, node_id: str, relation_type: str) -> Sequence[str]:
+        """
+        Targets of relations of given type from synset or sense
+        :param node_id: source synset id or sense id
+        :param relation_type: relation type
+        :return: target ids, must not be modified
+        """
+        return self.adjacency_of(node_id).targets(node_id, relation_type)
+
+    def incoming(self, node_id: str, relation_type: str) -> Sequence[str]:
+        """
+        Sources of relations of given type to synset or sense
+        :param node_id: target synset id or sense id
+        :param relation_type: relation type
+        :return: source ids, must not be modified
+        """
+        return self.adjacency_of(node_id).sources(node_id, relation_type)
+
+    def relations_of(self, node: Synset | Sense, inverses: bool = True) -> List[Synset.Relation | Sense.Relation]:
+        """
+        Relations of synset or sense
+        :param node: synset or sense
+        :param inverses: whether to include virtual inverse relations (see extend(virtual=True))
+        :return: stored relations followed by virtual inverse relations
+        """
+        relations = list(node.relations)
+        if inverses and self.virtual_extension:
+            if isinstance(node, Synset):
+                relations.extend(self.make_synset_relation(target, t) for t, target in self.synset_adjacency.virtual_inverses(node.id))
+            else:
+                relations.extend(self.make_sense_relation(target, t) for t, target in self.sense_adjacency.virtual_inverses(node.id))
+        return relations
 
-    def extend(self) -> None:
+    def hypernyms(self, synsetid: str) -> Sequence[str]:
+        """ Hypernyms of synset """
+        return self.synset_adjacency.targets(synsetid, Synset.Relation.Type.HYPERNYM)
+
+    def hyponyms(self, synsetid: str) -> Sequence[str]:
+        """ Hyponyms of synset, whether the model is extended or not """
+        return self.synset_adjacency.sources(synsetid, Synset.Relation.Type.HYPERNYM)
+
+    # E X T E N S I O N
+
+    def extend(self, virtual: bool = False) -> None:
         """
         Extend to include inverse relations can be added here
+        :param virtual: whether inverse relations are not stored in relations but served by the adjacency indexes
+        (see outgoing(), incoming(), relations_of()), which saves memory and time for read-only use
         """
-        for ss in self.synsets:
-            self.extend_synset_relations(ss)
-        for s in self.senses:
-            self.extend_sense_relations(s)
+        self.invalidate_adjacency()
+        if virtual:
+            self.virtual_extension = True
+            return
+        self.virtual_extension = False
+        self.extended = True
+        if self.synset_graph is not None:
+            self.synset_graph.extend()
+        else:
+            edges = self.synset_edges()
+            for ss in self.synsets:
+                self.extend_synset_relations(ss, edges)
+        if self.sense_graph is not None:
+            self.sense_graph.extend()
+        else:
+            edges = self.sense_edges()
+            for s in self.senses:
+                self.extend_sense_relations(s, edges)
+
+    def synset_edges(self) -> Set[Tuple[str, str, str]]:
+        """
+        Existing synset relations, as used by extension to test for existing inverses in constant time
+        :return: set of (source id, relation type, target id)
+        """
+        return {(ss.id, r.relation_type, r.target) for ss in self.synsets for r in ss.relations}
+
+    def sense_edges(self) -> Set[Tuple[str, str, str]]:
+        """
+        Existing sense relations, 'other' types excepted, as used by extension to test for existing inverses in constant time
+        :return: set of (source id, relation type, target id)
+        """
+        return {(s.id, r.relation_type, r.target) for s in self.senses for r in s.relations if not r.other_type}
 
-    def extend_sense_relations(self, sense: Sense) -> None:
+    def stores_inverses(self) -> bool:
+        """
+        Whether inverse relations are stored, as they are after extend(), told from the relations themselves
+        (used for models whose extension was not recorded)
+        :return: true if there are relations that extension adds inverses for and all their inverses are stored
+        """
+        found = False
+        for edges, inverses in ((self.synset_edges(), extended_synset_relations), (self.sense_edges(), extended_sense_relations)):
+            for source, relation_type, target in edges:
+                inv_t = inverses.get(relation_type)
+                if inv_t is not None:
+                    if (target, inv_t, source) not in edges:
+                        return False
+                    found = True
+        return found
+
+    def extend_sense_relations(self, sense: Sense, edges: Optional[Set[Tuple[str, str, str]]] = None) -> None:
         """
         Add inverse sense relations as needed
         :param sense: sense to extend
+        :param edges: existing sense relations (see sense_edges()), updated with added relations, None to scan the target's relations
         """
         for r in sense.relations:
             if not r.other_type:
-                t = Sense.Relation.Type(r.relation_type)
-                if t in Sense.Relation.inverses:
-                    inv_t = Sense.Relation.inverses[t]
-                    if inv_t != t and t not in ignored_symmetric_sense_relations:
-                        target_sense = self.sense_resolver[r.target]
-                        if not target_sense:
-                            raise ValueError(f'Unresolved target {r.target} in relation of type {t} in sense {sense.id}')
-                        if not any(r2 for r2 in target_sense.relations if
-                                   r2.target == sense.id and not r2.other_type and Sense.Relation.Type(r2.relation_type) == inv_t):
-                            target_sense.relations.append(Sense.Relation(sense.id, inv_t.value))
-
-    def extend_synset_relations(self, synset: Synset) -> None:
+                inv_t = inverse_sense_relation_type(r.relation_type, sense.id)
+                if inv_t is not None:
+                    target_sense = self.sense_resolver[r.target]
+                    if not target_sense:
+                        raise ValueError(f'Unresolved target {r.target} in relation of type {r.relation_type} in sense {sense.id}')
+                    if edges is not None:
+                        edge = (r.target, inv_t, sense.id)
+                        if edge in edges:
+                            continue
+                        edges.add(edge)
+                    elif any(r2 for r2 in target_sense.relations if r2.target == sense.id and not r2.other_type and r2.relation_type == inv_t):
+                        continue
+                    target_sense.relations.append(self.make_sense_relation(sense.id, inv_t))
+
+    def extend_synset_relations(self, synset: Synset, edges: Optional[Set[Tuple[str, str, str]]] = None) -> None:
         """
         Add inverse synset relations as needed
         :param synset: synset to extend
+        :param edges: existing synset relations (see synset_edges()), updated with added relations, None to scan the target's relations
         """
         for r in synset.relations:
-            t = Synset.Relation.Type(r.relation_type)
-            if t in Synset.Relation.inverses:
-                inv_t = Synset.Relation.inverses[t]
-                if inv_t != t and t not in ignored_symmetric_synset_relations:
-                    target_synset = self.synset_resolver[r.target]
-                    if not target_synset:
-                        raise ValueError(f'Unresolved target {r.target} in relation of type {t} in synset {synset.id}')
-                    if not any(r2 for r2 in target_synset.relations if r2.target == synset.id and Synset.Relation.Type(r2.relation_type) == inv_t):
-                        target_synset.relations.append(Synset.Relation(synset.id, inv_t.value))
-
-    def resolve(self) -> None:
+            inv_t = inverse_synset_relation_type(r.relation_type, synset.id)
+            if inv_t is not None:
+                target_synset = self.synset_resolver[r.target]
+                if not target_synset:
+                    raise ValueError(f'Unresolved target {r.target} in relation of type {r.relation_type} in synset {synset.id}')
+                if edges is not None:
+                    edge = (r.target, inv_t, synset.id)
+                    if edge in edges:
+                        continue
+                    edges.add(edge)
+                elif any(r2 for r2 in target_synset.relations if r2.target == synset.id and r2.relation_type == inv_t):
+                    continue
+                target_synset.relations.append(self.make_synset_relation(synset.id, inv_t))
+
+    def make_sense_relation(self, target: str, relation_type: str, other_type: bool = False) -> Sense.Relation:
+        """
+        Make sense relation, interned if this model interns its relations
+        :param target: target sense id
+        :param relation_type: relation type
+        :param other_type: whether relation type is one of the 'other' types
+        :return: sense relation
+        """
+        if self.relation_table is not None:
+            return self.relation_table.sense_relation(target, relation_type, other_type)
+        r = Sense.Relation(target, relation_type, other_type)
+        if self.resolution is not None:
+            r.stale(self.resolution)
+        return r
+
+    def make_synset_relation(self, target: str, relation_type: str) -> Synset.Relation:
+        """
+        Make synset relation, interned if this model interns its relations
+        :param target: target synset id
+        :param relation_type: relation type
+        :return: synset relation
+        """
+        if self.relation_table is not None:
+            return self.relation_table.synset_relation(target, relation_type)
+        r = Synset.Relation(target, relation_type)
+        if self.resolution is not None:
+            r.stale(self.resolution)
+        return r
+
+    def intern_relations(self) -> RelationTable:
+        """
+        Switch model to interned relations: identical edges will share one immutable instance.
+        Relations that are already interned in this model's table are kept as they are.
+        Resolution of interned relations is a side lookup (see resolve_target()).
+        :return: this model's relation table
+        """
+        if self.relation_table is None:
+            self.relation_table = RelationTable()
+            self.relation_table.stale(self.resolution)
+        if self.sense_graph is None:
+            for s in self.senses:
+                s.relations = self.relation_table.intern_sense_relations(s.relations)
+        if self.synset_graph is None:
+            for ss in self.synsets:
+                ss.relations = self.relation_table.intern_synset_relations(ss.relations)
+        return self.relation_table
+
+    def resolve_target(self, relation: Sense.Relation | Synset.Relation) -> Sense | Synset:
+        """
+        Resolve relation target by side lookup, valid for interned as well as non-interned relations
+        :param relation: sense or synset relation
+        :return: target sense or synset
+        :raises: KeyError when the resolvers can't resolve the target
+        """
+        if isinstance(relation, Sense.Relation):
+            return self.sense_resolver[relation.target]
+        return self.synset_resolver[relation.target]
+
+    def resolve(self, lazy: bool = False) -> None:
         """
         Resolve model internal cross-references.
         Side effect is computation of resolved_* fields.
+        If lazy, fields are computed on first access from this model's resolvers, and cached (None if the key can't be
+        resolved), per-object stale(resolution) then invalidates them. Objects are given this model's lazy resolution
+        context, which is a single pass that does no lookup, so any number of models may be resolved lazily.
+        :param lazy: whether to resolve on first access instead of now
         :raises: ValueError when the resolvers are not available
         :raises: KeyError when the resolvers can't resolve the keys
         """
@@ -542,31 +1430,77 @@ class WordnetModel:
         if not self.member_resolver:
             raise ValueError(f'{self} has no member resolver')
 
+        if lazy:
+            if self.resolution is None:
+                self.resolution = LazyResolution(self)
+            self.stale()
+            return
+
         for s in self.senses:
             # resolve synset reference in sense
             s.resolved_synset = self.synset_resolver[s.synsetid]
 
+            # relations in columnar store are interned, so resolved by side lookup
+            if self.sense_graph is not None:
+                continue
             for r in s.relations:
-                # resolve relation target reference in sense relation
-                r.resolved_target = self.sense_resolver[r.target]
+                # resolve relation target reference in sense relation (interned relations are resolved by side lookup)
+                if not isinstance(r, InternedSenseRelation):
+                    r.resolved_target = self.sense_resolver[r.target]
 
         for ss in self.synsets:
             # resolve member references in synset
             ss.resolved_members = [self.member_resolver[(m, ss.id)] for m in ss.members]
 
+            # relations in columnar store are interned, so resolved by side lookup
+            if self.synset_graph is not None:
+                continue
             for r in ss.relations:
-                # resolve relation target reference in synset relation
-                r.resolved_target = self.synset_resolver[r.target]
+                # resolve relation target reference in synset relation (interned relations are resolved by side lookup)
+                if not isinstance(r, InternedSynsetRelation):
+                    r.resolved_target = self.synset_resolver[r.target]
 
     def stale(self) -> None:
         """
         Stale all model internal cross-references.
+        If resolution is lazy, they will be resolved again on next access.
         """
+        resolution = self.resolution
+        for table in self.relation_tables():
+            table.stale(resolution)
         for s in self.senses:
-            s.resolved_synset = None
+            s.stale(resolution)
+            if self.sense_graph is not None:
+                continue
             for r in s.relations:
-                r.resolved_target = None
+                r.stale(resolution)
         for ss in self.synsets:
-            ss.resolved_members = None
+            ss.stale(resolution)
+            if self.synset_graph is not None:
+                continue
             for r in ss.relations:
-                r.resolved_target = None
+                r.stale(resolution)
+
+    def relation_tables(self) -> List[RelationTable]:
+        """ Tables this model's relations are interned in """
+        tables = [self.relation_table] if self.relation_table is not None else []
+        for graph in (self.synset_graph, self.sense_graph):
+            if graph is not None and all(graph.table is not table for table in tables):
+                tables.append(graph.table)
+        return tables
+
+    @property
+    def lazy(self) -> bool:
+        """ Whether this model is resolved lazily """
+        return self.resolution is not None
+
+    def end_lazy_resolution(self) -> None:
+        """
+        Stop resolving this model lazily.
+        Already resolved fields are kept, the others are no longer resolved.
+        """
+        if self.resolution is not None:
+            self.resolution.model = None
+            self.resolution = None
+            for table in self.relation_tables():
+                table.resolution = None
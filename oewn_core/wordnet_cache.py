@@ -0,0 +1,126 @@
+"""
+WordNet per-file cache of parsed YAML
+
+Entries and synsets built from each YAML file are cached in a binary (pickle) file, much as __pycache__ does for
+compiled Python. A cache file is valid as long as the YAML file's content hash and the library version it was built
+with are unchanged, otherwise the YAML file is parsed again and the cache file is rewritten.
+Cached batches hold neither interned relations nor interned strings, these are applied when batches are loaded.
+
+Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
+"""
+
+#  Copyright (c) 2024.
+#  Creative Commons 4 for original code
+#  GPL3 for rewrite
+
+import hashlib
+import os
+import pickle
+from functools import cache
+from importlib.metadata import version, PackageNotFoundError
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+cache_dir_name = '__oewncache__'
+""" Name of default cache dir, in YAML home dir """
+
+
+def default_cache_dir(home: str) -> str:
+    """
+    Default cache dir
+    :param home: home dir for YAML files
+    :return: cache dir in home dir
+    """
+    return f'{home}/{cache_dir_name}'
+
+
+@cache
+def library_version() -> str:
+    """
+    Library version, from package metadata, qualified with the digest of the sources that the cached data depend on,
+    so that the cache is invalidated by code changes that do not come with a new version
+    :return: version
+    """
+    try:
+        v = version('oewn-core')
+    except PackageNotFoundError:
+        v = 'unknown'  # not installed
+    digest = hashlib.sha256()
+    here = Path(__file__).parent
+    for module in ('wordnet.py', 'wordnet_fromyaml.py'):
+        digest.update((here / module).read_bytes())
+    return f'{v}+{digest.hexdigest()[:16]}'
+
+
+def content_hash(f: str) -> str:
+    """
+    Content hash of file
+    :param f: file
+    :return: hex digest of file content
+    """
+    with open(f, 'rb') as inp:
+        return hashlib.sha256(inp.read()).hexdigest()
+
+
+def fingerprint(f: str, digest: Optional[str] = None) -> Tuple[int, int, Optional[str]]:
+    """
+    Fingerprint of file, as used to detect changed files without reading them
+    :param f: file
+    :param digest: content hash of file if known, None otherwise
+    :return: (modification time in ns, size, content hash or None)
+    """
+    st = os.stat(f)
+    return st.st_mtime_ns, st.st_size, digest
+
+
+def cache_key(f: str) -> str:
+    """
+    Cache key of YAML file
+    :param f: YAML file
+    :return: key made of library version and file content hash
+    """
+    return f'{library_version()}:{content_hash(f)}'
+
+
+def cache_file(f: str, cache_dir: str) -> str:
+    """
+    Cache file of YAML file
+    :param f: YAML file
+    :param cache_dir: cache dir
+    :return: cache file path
+    """
+    return f'{cache_dir}/{Path(f).name}.pickle'
+
+
+def read_cached(f: str, cache_dir: str, key: str) -> Optional[List[Any]]:
+    """
+    Read cached batch of YAML file
+    :param f: YAML file
+    :param cache_dir: cache dir
+    :param key: cache key of YAML file
+    :return: cached batch, None if there is none or if it is not valid for key
+    """
+    try:
+        with open(cache_file(f, cache_dir), 'rb') as inp:
+            if pickle.load(inp) != key:
+                return None
+            return pickle.load(inp)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return None
+
+
+def write_cached(f: str, cache_dir: str, key: str, batch: List[Any]) -> None:
+    """
+    Write cached batch of YAML file, atomically
+    :param f: YAML file
+    :param cache_dir: cache dir
+    :param key: cache key of YAML file
+    :param batch: batch of entries or synsets built from YAML file
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    path = cache_file(f, cache_dir)
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'wb') as out:
+        pickle.dump(key, out, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle.dump(batch, out, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
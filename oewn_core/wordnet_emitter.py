@@ -0,0 +1,331 @@
+"""
+WordNet fast YAML emitter
+
+yaml.dump() goes through a representer (nodes), a serializer (events) and a generic emitter state machine.
+The OEWN files have a fixed schema: block mappings with sorted string keys, whose values are strings, block
+sequences (of strings or of mappings) or block mappings. This emitter writes that schema directly, with the same
+scalar styles, quoting, indentation and line-wrapping rules as yaml.dump(data, allow_unicode=True), so that its output
+is byte-identical. Scalar styles are decided by PyYAML's own analyzer and resolver, and cached.
+Data that fall outside the schema (empty or shared collections, multiline scalars, complex keys, non-string values)
+raise Unsupported, yaml.dump() is then to be used.
+
+Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
+"""
+
+#  Copyright (c) 2024.
+#  Creative Commons 4 for original code
+#  GPL3 for rewrite
+
+import re
+from typing import Any, Dict, List, Set
+
+from yaml.emitter import Emitter
+from yaml.nodes import ScalarNode
+from yaml.resolver import Resolver
+
+best_width = 80
+""" Preferred line width, as yaml.dump()'s default """
+
+best_indent = 2
+""" Indentation, as yaml.dump()'s default """
+
+max_simple_key = 128
+""" Keys this long or longer are complex keys """
+
+max_styles = 1 << 20
+""" Size above which the style cache is cleared """
+
+str_tag = 'tag:yaml.org,2002:str'
+
+line_breaks = re.compile('[\n\x85\u2028\u2029]')
+
+spaces = re.compile('( +)')
+
+escape_replacements = Emitter.ESCAPE_REPLACEMENTS
+
+analyzer = Emitter(None, allow_unicode=True)
+""" PyYAML emitter, only used for its scalar analysis """
+
+resolver = Resolver()
+""" PyYAML resolver, only used to tell whether plain scalars would be read back as strings """
+
+
+class Unsupported(Exception):
+    """
+    Data fall outside the schema the emitter is specialized to
+    """
+    pass
+
+
+class SchemaEmitter:
+    """
+    Fast emitter for OEWN YAML
+    """
+
+    def __init__(self) -> None:
+        self.styles: Dict[str, str] = {}  # scalar style ('' for plain, "'" or '"'), keyed by scalar
+        self.parts: List[str] = []
+        self.column: int = 0
+        self.seen: Set[int] = set()  # ids of collections, that yaml.dump() would emit as aliases if met twice
+
+    def style(self, value: str) -> str:
+        """
+        Scalar style, as chosen by yaml.dump() for a block context
+        :param value: scalar
+        :return: '' for plain, "'" for single-quoted, '"' for double-quoted
+        :raises: Unsupported if scalar is multiline
+        """
+        s = self.styles.get(value)
+        if s is None:
+            if line_breaks.search(value):
+                raise Unsupported('multiline scalar')
+            analysis = analyzer.analyze_scalar(value)
+            if analysis.allow_block_plain and resolver.resolve(ScalarNode, value, (True, False)) == str_tag:
+                s = ''
+            elif analysis.allow_single_quoted:
+                s = "'"
+            else:
+                s = '"'
+            if len(self.styles) >= max_styles:
+                self.styles.clear()
+            self.styles[value] = s
+        return s
+
+    def emit(self, data: Dict[str, Any]) -> str:
+        """
+        Emit document
+        :param data: top-level mapping
+        :return: YAML text, as yaml.dump(data, allow_unicode=True) returns
+        :raises: Unsupported if data fall outside the schema
+        """
+        if type(data) is not dict:
+            raise Unsupported(f'top-level {type(data).__name__}')
+        if not data:
+            return '{}\n'
+        self.parts = []
+        self.column = 0
+        self.seen = set()
+        try:
+            self.write_mapping(data, 0, 'root')
+            self.parts.append('\n')
+            return ''.join(self.parts)
+        finally:
+            self.parts = []
+            self.seen = set()
+
+    def check(self, collection: Any) -> None:
+        """
+        Check collection is not empty (yaml.dump() would emit it in flow style) and not met before (yaml.dump() would emit an alias)
+        :param collection: list or dict
+        :raises: Unsupported
+        """
+        if not collection:
+            raise Unsupported('empty collection')
+        if id(collection) in self.seen:
+            raise Unsupported('shared collection')
+        self.seen.add(id(collection))
+
+    def write_mapping(self, mapping: Dict[str, Any], indent: int, context: str) -> None:
+        """
+        Write block mapping
+        :param mapping: mapping
+        :param indent: indentation of keys
+        :param context: 'root' if document root, 'item' if sequence item (first key follows the '-' indicator), 'value' if mapping value
+        """
+        self.check(mapping)
+        try:
+            keys = sorted(mapping)
+        except TypeError as te:
+            raise Unsupported('unsortable keys') from te
+        parts = self.parts
+        for i, k in enumerate(keys):
+            if type(k) is not str:
+                raise Unsupported(f'{type(k).__name__} key')
+            if not k or len(k) >= max_simple_key:
+                raise Unsupported('complex key')
+
+            # key on its own line, but for the document's first key and the sequence item's first key
+            if i == 0 and context == 'root':
+                pass
+            elif i == 0 and context == 'item':
+                parts.append(' ')
+                self.column += 1
+            else:
+                parts.append('\n')
+                parts.append(' ' * indent)
+                self.column = indent
+            self.write_scalar(k, indent + best_indent, False, False)
+            parts.append(':')
+            self.column += 1
+
+            v = mapping[k]
+            t = type(v)
+            if t is str:
+                self.write_scalar(v, indent + best_indent, True, True)
+            elif t is list:
+                self.write_sequence(v, indent)
+            elif t is dict:
+                self.write_mapping(v, indent + best_indent, 'value')
+            else:
+                raise Unsupported(f'{t.__name__} value')
+
+    def write_sequence(self, sequence: List[Any], indent: int) -> None:
+        """
+        Write block sequence, indentless as it is a mapping value
+        :param sequence: sequence
+        :param indent: indentation of '-' indicators
+        """
+        self.check(sequence)
+        parts = self.parts
+        for v in sequence:
+            parts.append('\n')
+            parts.append(' ' * indent)
+            parts.append('-')
+            self.column = indent + 1
+            t = type(v)
+            if t is str:
+                self.write_scalar(v, indent + best_indent, True, True)
+            elif t is dict:
+                self.write_mapping(v, indent + best_indent, 'item')
+            else:
+                raise Unsupported(f'{t.__name__} item')
+
+    def write_scalar(self, value: str, indent: int, split: bool, space: bool) -> None:
+        """
+        Write scalar
+        :param value: scalar
+        :param indent: indentation of continuation lines
+        :param split: whether long scalars are wrapped (not in simple keys)
+        :param space: whether scalar is preceded by a space (not at start of line)
+        """
+        s = self.style(value)
+        if space:
+            self.parts.append(' ')
+            self.column += 1
+        if s == '':
+            if not split or self.column + len(value) <= best_width:
+                self.parts.append(value)
+                self.column += len(value)
+            else:
+                self.write_plain(value, indent)
+        elif s == "'":
+            quoted = value.replace("'", "''")
+            if not split or self.column + len(quoted) + 2 <= best_width:
+                self.parts.append(f"'{quoted}'")
+                self.column += len(quoted) + 2
+            else:
+                self.write_single_quoted(value, indent)
+        else:
+            self.write_double_quoted(value, indent, split)
+
+    def write_plain(self, text: str, indent: int) -> None:
+        """
+        Write plain scalar, wrapped at single spaces past the preferred width, as Emitter.write_plain() does
+        :param text: scalar
+        :param indent: indentation of continuation lines
+        """
+        parts = self.parts
+        column = self.column
+        for token in spaces.split(text):
+            if token and token[0] == ' ':
+                if len(token) == 1 and column > best_width:
+                    parts.append('\n')
+                    parts.append(' ' * indent)
+                    column = indent
+                else:
+                    parts.append(token)
+                    column += len(token)
+            else:
+                parts.append(token)
+                column += len(token)
+        self.column = column
+
+    def write_single_quoted(self, text: str, indent: int) -> None:
+        """
+        Write single-quoted scalar, wrapped at inner single spaces past the preferred width, as Emitter.write_single_quoted() does
+        :param text: scalar
+        :param indent: indentation of continuation lines
+        """
+        parts = self.parts
+        parts.append("'")
+        column = self.column + 1
+        n = len(text)
+        position = 0
+        for token in spaces.split(text):
+            if token[:1] == ' ':
+                # leading and trailing spaces are not wrapped
+                if len(token) == 1 and column > best_width and position != 0 and position + 1 != n:
+                    parts.append('\n')
+                    parts.append(' ' * indent)
+                    column = indent
+                else:
+                    parts.append(token)
+                    column += len(token)
+            elif token:
+                quoted = token.replace("'", "''")
+                parts.append(quoted)
+                column += len(quoted)
+            position += len(token)
+        parts.append("'")
+        self.column = column + 1
+
+    def write_double_quoted(self, text: str, indent: int, split: bool) -> None:
+        """
+        Write double-quoted scalar, escaping non-printable characters and wrapping past the preferred width, as Emitter.write_double_quoted() does
+        :param text: scalar
+        :param indent: indentation of continuation lines
+        :param split: whether long scalars are wrapped
+        """
+        parts = self.parts
+        parts.append('"')
+        column = self.column + 1
+        start = end = 0
+        n = len(text)
+        while end <= n:
+            ch = text[end] if end < n else None
+            if ch is None or ch in '"\\\x85\u2028\u2029\uFEFF' \
+                    or not ('\x20' <= ch <= '\x7E' or '\xA0' <= ch <= '\uD7FF' or '\uE000' <= ch <= '\uFFFD'):
+                if start < end:
+                    parts.append(text[start:end])
+                    column += end - start
+                    start = end
+                if ch is not None:
+                    if ch in escape_replacements:
+                        data = '\\' + escape_replacements[ch]
+                    elif ch <= '\xFF':
+                        data = '\\x%02X' % ord(ch)
+                    elif ch <= '\uFFFF':
+                        data = '\\u%04X' % ord(ch)
+                    else:
+                        data = '\\U%08X' % ord(ch)
+                    parts.append(data)
+                    column += len(data)
+                    start = end + 1
+            if 0 < end < n - 1 and (ch == ' ' or start >= end) and column + (end - start) > best_width and split:
+                data = text[start:end] + '\\'
+                if start < end:
+                    start = end
+                parts.append(data)
+                parts.append('\n')
+                parts.append(' ' * indent)
+                column = indent
+                if text[start] == ' ':
+                    parts.append('\\')
+                    column += 1
+            end += 1
+        parts.append('"')
+        self.column = column + 1
+
+
+emitter = SchemaEmitter()
+""" Shared emitter, whose style cache is reused across documents """
+
+
+def emit(data: Dict[str, Any]) -> str:
+    """
+    Emit document with the shared emitter
+    :param data: top-level mapping
+    :return: YAML text, as yaml.dump(data, allow_unicode=True) returns
+    :raises: Unsupported if data fall outside the schema
+    """
+    return emitter.emit(data)
@@ -13,84 +13,356 @@ Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
 import argparse
 import sys
 import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
 from glob import glob
 from pathlib import Path
-from typing import Any, Tuple, List, Dict
+from typing import Any, Callable, Collection, Generator, Tuple, List, Dict, Optional, TextIO
 
 import yaml
+from yaml.composer import ComposerError
+from yaml.events import AliasEvent, DocumentStartEvent, ScalarEvent, SequenceStartEvent, SequenceEndEvent, MappingStartEvent, MappingEndEvent
+from yaml.nodes import Node, ScalarNode, SequenceNode, MappingNode
 
-from oewn_core.wordnet import WordnetModel, Entry, Sense, Synset, PartOfSpeech, Example, Pronunciation, VerbFrame
+from oewn_core.wordnet import WordnetModel, Entry, Sense, Synset, PartOfSpeech, Example, Pronunciation, VerbFrame, RelationTable
+from oewn_core.wordnet_strings import StringPool
+from oewn_core.wordnet_text import store_text
+from oewn_core.wordnet_cache import cache_key, read_cached, write_cached, default_cache_dir, fingerprint
+from oewn_core.wordnet_metrics import LoadMetrics, phase
 
 
-def load_verbframes(home: str) -> List[VerbFrame]:
+sense_relation_types: Dict[str, str] = {str(t): t.value for t in Sense.Relation.Type}
+""" Sense relation type values, by YAML key """
+
+other_relation_types: Dict[str, str] = {str(t): t.value for t in Sense.Relation.OtherType}
+""" Other sense relation type values, by YAML key """
+
+synset_relation_types: Dict[str, str] = {str(t): t.value for t in Synset.Relation.Type}
+""" Synset relation type values, by YAML key """
+
+
+def load_verbframes(home: str, strings: Optional[StringPool] = None) -> List[VerbFrame]:
     """
     Load verb frames from YAML
     :param home: home dir for YAML frame.yaml file
+    :param strings: if not None, identifier strings will be interned in this pool
     :return: list of verb frames
     """
     with open(f'{home}/frames.yaml', encoding='utf-8') as inp:
         y: Dict[str, Any] = yaml.load(inp, Loader=yaml.CLoader)
-        return [VerbFrame(k, v) for k, v in y.items()]
+        return [VerbFrame(strings(k) if strings is not None else k, v) for k, v in y.items()]
+
+
+def compose_node(loader: yaml.CLoader, anchors: Dict[str, Node]) -> Node:
+    """
+    Compose node from the loader's next events, as PyYAML's composer does
+    :param loader: loader, positioned at the node's first event
+    :param anchors: anchored nodes
+    :return: node
+    """
+    event = loader.get_event()
+    if isinstance(event, AliasEvent):
+        if event.anchor not in anchors:
+            raise ComposerError(None, None, f'found undefined alias {event.anchor}', event.start_mark)
+        return anchors[event.anchor]
+    if isinstance(event, ScalarEvent):
+        tag = event.tag if event.tag not in (None, '!') else loader.resolve(ScalarNode, event.value, event.implicit)
+        node = ScalarNode(tag, event.value, event.start_mark, event.end_mark, style=event.style)
+    elif isinstance(event, SequenceStartEvent):
+        tag = event.tag if event.tag not in (None, '!') else loader.resolve(SequenceNode, None, event.implicit)
+        node = SequenceNode(tag, [], event.start_mark, None, flow_style=event.flow_style)
+        while not loader.check_event(SequenceEndEvent):
+            node.value.append(compose_node(loader, anchors))
+        node.end_mark = loader.get_event().end_mark
+    elif isinstance(event, MappingStartEvent):
+        tag = event.tag if event.tag not in (None, '!') else loader.resolve(MappingNode, None, event.implicit)
+        node = MappingNode(tag, [], event.start_mark, None, flow_style=event.flow_style)
+        while not loader.check_event(MappingEndEvent):
+            key = compose_node(loader, anchors)
+            value = compose_node(loader, anchors)
+            node.value.append((key, value))
+        node.end_mark = loader.get_event().end_mark
+    else:
+        raise ComposerError(None, None, f'unexpected event {event}', event.start_mark)
+    if event.anchor is not None:
+        anchors[event.anchor] = node
+    return node
+
+
+def stream_records(inp: TextIO) -> Generator[Tuple[Any, Any], None, None]:
+    """
+    Stream top-level (key, value) records of a YAML mapping, one at a time.
+    Parsing is event-driven: only the current record's node tree and data are held, not the whole file's.
+    Data are the same as PyYAML's full load (same loader, resolver and constructors).
+    :param inp: YAML input
+    :return: generator of (key, value)
+    """
+    loader = yaml.CLoader(inp)
+    try:
+        anchors: Dict[str, Node] = {}
+        loader.get_event()  # stream start
+        if not loader.check_event(DocumentStartEvent):
+            return  # empty stream
+        loader.get_event()  # document start
+        if not loader.check_event(MappingStartEvent):
+            raise ValueError(f'Top-level mapping expected, found {loader.peek_event()}')
+        loader.get_event()  # mapping start
+        while not loader.check_event(MappingEndEvent):
+            key = loader.construct_document(compose_node(loader, anchors))
+            value = loader.construct_document(compose_node(loader, anchors))
+            yield key, value
+    finally:
+        loader.dispose()
+
+
+def read_records(f: str, stream: bool = False) -> Generator[Tuple[Any, Any], None, None]:
+    """
+    Read top-level (key, value) records of a YAML file
+    :param f: YAML file
+    :param stream: whether records are streamed (see stream_records()) instead of the whole file being loaded first
+    :return: generator of (key, value)
+    """
+    with open(f, encoding='utf-8') as inp:
+        if stream:
+            yield from stream_records(inp)
+        else:
+            y: Dict[str, Any] = yaml.load(inp, Loader=yaml.CLoader)
+            yield from y.items()
+
+
+def entries_files(home: str) -> List[str]:
+    """
+    Entries files, in load order
+    :param home: home dir for YAML entries-*.yaml file
+    :return: list of file paths
+    """
+    return glob(f'{home}/entries-*.yaml')
+
+
+pos_files: Dict[str, str] = {'n': 'noun', 'v': 'verb', 'a': 'adj', 's': 'adj', 'r': 'adv'}
+""" Synsets file name prefix, per part-of-speech """
+
+dangling_policies = ('drop', 'keep', 'error')
+""" Policies for references to data that partial loads leave out """
+
+
+def synsets_files(home: str, pos: Optional[Collection[str]] = None, lexfiles: Optional[Collection[str]] = None) -> List[str]:
+    """
+    Synsets files, in load order
+    :param home: home dir for YAML (noun|verb|adj|adv))-*.yaml file
+    :param pos: if not None, parts-of-speech (n, v, a, s, r) of the files to select
+    :param lexfiles: if not None, lexical names (noun.animal, ...) of the files to select
+    :return: list of file paths
+    """
+    noun_files = glob(f'{home}/noun*.yaml')
+    verb_files = glob(f'{home}/verb*.yaml')
+    adj_files = glob(f'{home}/adj*.yaml')
+    adv_files = glob(f'{home}/adv*.yaml')
+    files = noun_files + verb_files + adj_files + adv_files
+    if pos is not None:
+        prefixes = {pos_files[p] for p in pos}
+        files = [f for f in files if Path(f).stem.split('.')[0] in prefixes]
+    if lexfiles is not None:
+        files = [f for f in files if Path(f).stem in lexfiles]
+    return files
 
 
-def load_entries(home: str) -> Tuple[List[Entry], Dict[str, Sense], Dict[Tuple[str, str], Entry]]:
+def source_files(home: str) -> List[str]:
+    """
+    YAML source files, entries files, synsets files and verb frames file
+    :param home: home dir for YAML *.yaml file
+    :return: list of file paths
+    """
+    return entries_files(home) + synsets_files(home) + [f'{home}/frames.yaml']
+
+
+def load_entries_file(f: str, table: Optional[RelationTable] = None, strings: Optional[StringPool] = None, stream: bool = False) -> List[Entry]:
+    """
+    Load entries from one YAML file
+    :param f: entries-*.yaml file
+    :param table: if not None, relations will be interned in this table
+    :param strings: if not None, identifier strings will be interned in this pool
+    :param stream: whether the file is streamed, one lemma at a time
+    :return: list of entries
+    """
+    entries: List[Entry] = []
+    for lemma, poses_discriminants in read_records(f, stream):
+        entries.extend(load_lemma(poses_discriminants, lemma, table, strings))
+    return entries
+
+
+def load_synsets_file(f: str, table: Optional[RelationTable] = None, strings: Optional[StringPool] = None, stream: bool = False) -> List[Synset]:
+    """
+    Load synsets from one YAML file
+    :param f: (noun|verb|adj|adv))-*.yaml file, whose stem is the synsets' lexical name
+    :param table: if not None, relations will be interned in this table
+    :param strings: if not None, identifier strings will be interned in this pool
+    :param stream: whether the file is streamed, one synset at a time
+    :return: list of synsets
+    """
+    synsets: List[Synset] = []
+    lex_name = Path(f).stem
+    for synsetid, synset_y in read_records(f, stream):
+        synsets.append(load_synset(synset_y, synsetid, lex_name, table, strings))
+    return synsets
+
+
+def load_batches(load_file: Callable[..., List[Any]], files: List[str], table: Optional[RelationTable], strings: Optional[StringPool], executor: Optional[Executor], stream: bool = False, cache: Optional[str] = None,
+                 metrics: Optional[LoadMetrics] = None) -> Generator[List[Any], None, None]:
+    """
+    Load per-file batches, in file order
+    :param load_file: per-file load function
+    :param files: files
+    :param table: if not None, relations will be interned in this table
+    :param strings: if not None, identifier strings will be interned in this pool
+    :param executor: if not None, process pool that files are parsed in, tables and pools being applied when batches are received
+    :param stream: whether files are streamed
+    :param cache: if not None, cache dir where batches are read from if they are valid for the file, written to otherwise
+    :param metrics: if not None, metrics that per-file durations are recorded in (with a process pool, the time spent waiting for the file's batch)
+    :return: generator of batches
+    """
+    if executor is None and cache is None:
+        for f in files:
+            start = time.perf_counter()
+            batch = load_file(f, table, strings, stream)
+            if metrics is not None:
+                metrics.add_file(f, time.perf_counter() - start, len(batch))
+            yield batch
+        return
+
+    # cached batches
+    keys: Dict[str, str] = {}
+    hits: Dict[str, List[Any]] = {}
+    durations: Dict[str, float] = {}
+    if cache is not None:
+        for f in files:
+            start = time.perf_counter()
+            keys[f] = cache_key(f)
+            batch = read_cached(f, cache, keys[f])
+            if batch is not None:
+                hits[f] = batch
+            durations[f] = time.perf_counter() - start
+
+    # parsed batches
+    misses = [f for f in files if f not in hits]
+    if executor is not None:
+        parsed = executor.map(partial(load_file, stream=stream), misses)
+    else:
+        parsed = (load_file(f, None, None, stream) for f in misses)
+
+    # interning tables and pools are per-process (and not cached), so they apply to batches once received
+    for f in files:
+        start = time.perf_counter()
+        batch = hits.pop(f, None)
+        if batch is None:
+            batch = next(parsed)
+            if cache is not None:
+                write_cached(f, cache, keys[f], batch)
+        if table is not None or strings is not None:
+            for o in batch:
+                if isinstance(o, Entry):
+                    if strings is not None:
+                        strings.intern_entry(o)
+                    for s in o.senses:
+                        if strings is not None:
+                            strings.intern_sense(s)
+                        if table is not None:
+                            s.relations = table.intern_sense_relations(s.relations)
+                else:
+                    if strings is not None:
+                        strings.intern_synset(o)
+                    if table is not None:
+                        o.relations = table.intern_synset_relations(o.relations)
+        if metrics is not None:
+            metrics.add_file(f, durations.get(f, 0.) + time.perf_counter() - start, len(batch))
+        yield batch
+
+
+def load_entries(home: str, table: Optional[RelationTable] = None, strings: Optional[StringPool] = None, executor: Optional[Executor] = None, stream: bool = False, cache: Optional[str] = None,
+                 metrics: Optional[LoadMetrics] = None) -> Tuple[List[Entry], Dict[str, Sense], Dict[Tuple[str, str], Entry]]:
     """
     Load entries from YAML
     :param home: home dir for YAML entries-*.yaml file
+    :param table: if not None, relations will be interned in this table
+    :param strings: if not None, identifier strings will be interned in this pool
+    :param executor: if not None, process pool that files are parsed in
+    :param stream: whether files are streamed, one lemma at a time
+    :param cache: if not None, cache dir of parsed files (see wordnet_cache)
+    :param metrics: if not None, metrics that per-file durations are recorded in
     :return: list of entries, sense resolver, member resolver
     """
     sense_resolver: Dict[str, Sense] = {}
     member_resolver: Dict[Tuple[str, str], Entry] = {}
     entries: List[Entry] = []
-    for f in glob(f'{home}/entries-*.yaml'):
-        with open(f, encoding='utf-8') as inp:
-            y: Dict[str, Any] = yaml.load(inp, Loader=yaml.CLoader)
-            for lemma, poses_discriminants in y.items():
-                for pos_discriminant, entry_y in poses_discriminants.items():
-                    pos = PartOfSpeech(pos_discriminant[:1]).value
-                    discriminant = pos_discriminant[2:] if len(pos_discriminant) > 2 else None
-                    entry = Entry(lemma, pos, discriminant)
-                    if 'form' in entry_y:
-                        entry.forms = entry_y['form']
-                    if 'pronunciation' in entry_y:
-                        entry.pronunciations = [Pronunciation(p['value'], p.get('variety')) for p in entry_y['pronunciation']]
-                    for n, sense_y in enumerate(entry_y['sense']):
-                        sense = load_sense(sense_y, entry)
-                        entry.senses.append(sense)
-                        sense_resolver[sense.id] = sense
-                        member_resolver[(lemma, sense.synsetid)] = entry
-                    entries.append(entry)
+    for batch in load_batches(load_entries_file, entries_files(home), table, strings, executor, stream, cache, metrics):
+        for entry in batch:
+            for sense in entry.senses:
+                sense_resolver[sense.id] = sense
+                member_resolver[(entry.lemma, sense.synsetid)] = entry
+            entries.append(entry)
     return entries, sense_resolver, member_resolver
 
 
-def load_synsets(home: str) -> Tuple[List[Synset], Dict[str, Synset]]:
+def load_synsets(home: str, table: Optional[RelationTable] = None, strings: Optional[StringPool] = None, executor: Optional[Executor] = None, stream: bool = False, cache: Optional[str] = None, pos: Optional[Collection[str]] = None, lexfiles: Optional[Collection[str]] = None,
+                 metrics: Optional[LoadMetrics] = None) -> Tuple[List[Synset], Dict[str, Synset]]:
     """
     Load synsets from YAML
     :param home: home dir for YAML (noun|verb|adj|adv))-*.yaml file
+    :param table: if not None, relations will be interned in this table
+    :param strings: if not None, identifier strings will be interned in this pool
+    :param executor: if not None, process pool that files are parsed in
+    :param stream: whether files are streamed, one synset at a time
+    :param cache: if not None, cache dir of parsed files (see wordnet_cache)
+    :param pos: if not None, parts-of-speech of the synsets to load, files that hold no such synsets are not parsed
+    :param lexfiles: if not None, lexical names of the synsets to load, other files are not parsed
+    :param metrics: if not None, metrics that per-file durations are recorded in
     :return: list of synsets, synset resolver
     """
     resolver: Dict[str, Synset] = {}
     synsets: List[Synset] = []
-    noun_files = glob(f'{home}/noun*.yaml')
-    verb_files = glob(f'{home}/verb*.yaml')
-    adj_files = glob(f'{home}/adj*.yaml')
-    adv_files = glob(f'{home}/adv*.yaml')
-    for f in noun_files + verb_files + adj_files + adv_files:
-        lex_name = Path(f).stem
-        with open(f, encoding='utf-8') as inp:
-            y: Dict[str, Any] = yaml.load(inp, Loader=yaml.CLoader)
-            for synsetid, synset_y in y.items():
-                synset = load_synset(synset_y, synsetid, lex_name)
-                synsets.append(synset)
-                resolver[synsetid] = synset
+    for batch in load_batches(load_synsets_file, synsets_files(home, pos, lexfiles), table, strings, executor, stream, cache, metrics):
+        for synset in batch:
+            if pos is not None and synset.pos not in pos:
+                continue  # adj files hold both a and s synsets
+            synsets.append(synset)
+            resolver[synset.id] = synset
     return synsets, resolver
 
 
-def load_sense(y: Dict[str, Any], entry: Entry) -> Sense:
+def load_lemma(y: Dict[str, Any], lemma: str, table: Optional[RelationTable] = None, strings: Optional[StringPool] = None) -> List[Entry]:
+    """
+    Load lemma's entries from YAML
+    :param y: properties provided by PyYAML, keyed by pos and discriminant
+    :param lemma: lemma
+    :param table: if not None, relations will be interned in this table
+    :param strings: if not None, identifier strings will be interned in this pool
+    :return: list of entries
+    """
+    entries: List[Entry] = []
+    for pos_discriminant, entry_y in y.items():
+        pos = PartOfSpeech(pos_discriminant[:1]).value
+        discriminant = pos_discriminant[2:] if len(pos_discriminant) > 2 else None
+        entry = Entry(lemma, pos, discriminant)
+        if 'form' in entry_y:
+            entry.forms = entry_y['form']
+        if 'pronunciation' in entry_y:
+            entry.pronunciations = [Pronunciation(p['value'], p.get('variety')) for p in entry_y['pronunciation']]
+        if strings is not None:
+            strings.intern_entry(entry)
+        for n, sense_y in enumerate(entry_y['sense']):
+            sense = load_sense(sense_y, entry, table, strings)
+            entry.senses.append(sense)
+        entries.append(entry)
+    return entries
+
+
+def load_sense(y: Dict[str, Any], entry: Entry, table: Optional[RelationTable] = None, strings: Optional[StringPool] = None) -> Sense:
     """
     Load sense from YAML
     :param y: properties provided by PyYAML
     :param entry: wrapping entry
+    :param table: if not None, relations will be interned in this table
+    :param strings: if not None, identifier strings will be interned in this pool
     :return: sense
     """
     s = Sense(y['id'], entry, y['synset'], y.get('adjposition'))
@@ -99,24 +371,30 @@ def load_sense(y: Dict[str, Any], entry: Entry) -> Sense:
     if 'subcat' in y:
         s.verbframeids = y['subcat']
     # relations
-    sense_rel_types: List[str] = [str(t) for t in Sense.Relation.Type]
-    other_rel_types: List[str] = [str(t) for t in Sense.Relation.OtherType]
     for rel, targets in y.items():
-        if rel in sense_rel_types:
-            for target in targets:
-                s.relations.append(Sense.Relation(target, Sense.Relation.Type(rel).value))
-        if rel in other_rel_types:
-            for target in targets:
-                s.relations.append(Sense.Relation(target, Sense.Relation.OtherType(rel).value, True))
+        t = sense_relation_types.get(rel)
+        other = t is None
+        if other:
+            t = other_relation_types.get(rel)
+            if t is None:
+                continue
+        if strings is not None:
+            targets = strings.list(targets)
+        for target in targets:
+            s.relations.append(table.sense_relation(target, t, other) if table is not None else Sense.Relation(target, t, other))
+    if strings is not None:
+        strings.intern_sense(s, relations=False)
     return s
 
 
-def load_synset(y: Dict[str, Any], synsetid: str, lex_name: str) -> Synset:
+def load_synset(y: Dict[str, Any], synsetid: str, lex_name: str, table: Optional[RelationTable] = None, strings: Optional[StringPool] = None) -> Synset:
     """
     Load synset from YAML
     :param y: properties provided by PyYAML
     :param synsetid: synset ID
     :param lex_name: lexical name, provided by file name's stem
+    :param table: if not None, relations will be interned in this table
+    :param strings: if not None, identifier strings will be interned in this pool
     :return: synset
     """
     pos = PartOfSpeech(y['partOfSpeech']).value
@@ -134,57 +412,173 @@ def load_synset(y: Dict[str, Any], synsetid: str, lex_name: str) -> Synset:
     ss.wikidata = y.get('wikidata')
     ss.ili = y.get('ili', 'in')
     # relations
-    synset_rel_types: List[str] = [str(t) for t in Synset.Relation.Type]
     for rel, targets in y.items():
-        if rel in synset_rel_types:
+        t = synset_relation_types.get(rel)
+        if t is not None:
+            if strings is not None:
+                targets = strings.list(targets)
             for target in targets:
-                ss.relations.append(Synset.Relation(target, Synset.Relation.Type(rel).value))
+                ss.relations.append(table.synset_relation(target, t) if table is not None else Synset.Relation(target, t))
+    if strings is not None:
+        strings.intern_synset(ss, relations=False)
     return ss
 
 
-def load_core(home: str) -> WordnetModel:
+def prune_dangling(wn: WordnetModel, dangling: str = 'drop') -> int:
+    """
+    Handle references to senses and synsets that are not in the model, as partial loads leave them:
+    senses whose synset is not loaded, relations whose target is not loaded
+    :param wn: model
+    :param dangling: 'drop' to remove dangling senses (and entries left with no sense) and dangling relations,
+    'keep' to leave them (the model can then be neither extended nor resolved), 'error' to raise an error
+    :return: number of dropped senses and relations
+    :raises: ValueError if dangling is 'error' and there are dangling references, or if dangling is not a policy
+    """
+    if dangling not in dangling_policies:
+        raise ValueError(f'Dangling policy {dangling} not in {dangling_policies}')
+    if dangling == 'keep':
+        return 0
+
+    def dangle(o: Any, target: str) -> None:
+        if dangling == 'error':
+            raise ValueError(f'Dangling reference {target} in {o.id}')
+
+    dropped = 0
+    entries: List[Entry] = []
+    for e in wn.entries:
+        senses: List[Sense] = []
+        for s in e.senses:
+            if s.synsetid in wn.synset_resolver:
+                senses.append(s)
+                continue
+            dangle(s, s.synsetid)
+            del wn.sense_resolver[s.id]
+            wn.member_resolver.pop((e.lemma, s.synsetid), None)
+            dropped += 1
+        if len(senses) != len(e.senses):
+            e.senses = senses
+        if senses:
+            entries.append(e)
+    if len(entries) != len(wn.entries):
+        wn.entries = entries
+    nodes: List[Tuple[Any, Dict[str, Any]]] = [(s, wn.sense_resolver) for s in wn.senses] + [(ss, wn.synset_resolver) for ss in wn.synsets]
+    for node, resolver in nodes:
+        relations = [r for r in node.relations if r.target in resolver]
+        if len(relations) != len(node.relations):
+            dangle(node, next(r.target for r in node.relations if r.target not in resolver))
+            dropped += len(node.relations) - len(relations)
+            node.relations = relations
+    return dropped
+
+
+def new_model() -> WordnetModel:
+    """
+    New empty model, with OEWN metadata
+    :return: model
+    """
+    return WordnetModel('oewn', 'Open English Wordnet', 'en',
+                        'english-wordnet@googlegroups.com',
+                        'https://creativecommons.org/licenses/by/4.0',
+                        '2024',
+                        'https://github.com/globalwordnet/english-wordnet')
+
+
+def load_core(home: str, intern: bool = False, intern_strings: bool = False, jobs: int = 1, stream: bool = False, cache: Optional[str] = None,
+              pos: Optional[Collection[str]] = None, lexfiles: Optional[Collection[str]] = None, include_entries: bool = True, include_frames: bool = True, dangling: str = 'drop',
+              metrics: Optional[LoadMetrics] = None) -> WordnetModel:
     """
     Load synset from YAML
     :param home: home dir for YAML *.yaml file
+    :param intern: whether relations are interned (see RelationTable)
+    :param intern_strings: whether identifier strings are interned (see StringPool)
+    :param jobs: number of processes that files are parsed in, the model is the same as when loaded by one
+    :param stream: whether files are streamed one record at a time (lower peak memory), the model is the same
+    :param cache: if not None, cache dir of parsed files (see wordnet_cache), only files that changed are parsed
+    :param pos: if not None, parts-of-speech (n, v, a, s, r) of the synsets to load, synsets files of other parts-of-speech are not parsed
+    :param lexfiles: if not None, lexical names (noun.animal, ...) of the synsets to load, other synsets files are not parsed
+    :param include_entries: whether entries (and their senses) are loaded
+    :param include_frames: whether verb frames are loaded
+    :param dangling: policy for senses and relations that refer to what a partial load leaves out (see prune_dangling())
+    :param metrics: if not None, metrics that per-file durations are recorded in
     :return: unresolved, unextended model
     """
-    wn = WordnetModel('oewn', 'Open English Wordnet', 'en',
-                      'english-wordnet@googlegroups.com',
-                      'https://creativecommons.org/licenses/by/4.0',
-                      '2024',
-                      'https://github.com/globalwordnet/english-wordnet')
-    # lex entries
-    wn.entries, wn.sense_resolver, wn.member_resolver = load_entries(home)
+    if dangling not in dangling_policies:
+        raise ValueError(f'Dangling policy {dangling} not in {dangling_policies}')
+    wn = new_model()
+    if intern:
+        wn.relation_table = RelationTable()
+
+    if intern_strings:
+        wn.strings = StringPool()
+    strings = wn.strings
 
-    # synsets
-    wn.synsets, wn.synset_resolver = load_synsets(home)
+    executor = ProcessPoolExecutor(jobs) if jobs > 1 else None
+    try:
+        # lex entries
+        if include_entries:
+            wn.entries, wn.sense_resolver, wn.member_resolver = load_entries(home, wn.relation_table, strings, executor, stream, cache, metrics)
+
+        # synsets
+        wn.synsets, wn.synset_resolver = load_synsets(home, wn.relation_table, strings, executor, stream, cache, pos, lexfiles, metrics)
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
     # frames
-    wn.verbframes = load_verbframes(home)
+    if include_frames:
+        start = time.perf_counter()
+        wn.verbframes = load_verbframes(home, strings)
+        if metrics is not None:
+            metrics.add_file(f'{home}/frames.yaml', time.perf_counter() - start, len(wn.verbframes))
+
+    # references to what is left out
+    partial = pos is not None or lexfiles is not None
+    if partial:
+        prune_dangling(wn, dangling)
+
+    # sources, as used by incremental reload, files that are left out have no fingerprint
+    loaded = set((entries_files(home) if include_entries else []) + synsets_files(home, pos, lexfiles) + ([f'{home}/frames.yaml'] if include_frames else []))
+    wn.sources = {Path(f).name: fingerprint(f) if f in loaded else None for f in source_files(home)}
 
     return wn
 
 
-def load(home: str, extend: bool=True, resolve: bool=False, verbose: bool = False) -> WordnetModel:
+def load(home: str, extend: bool=True, resolve: bool=False, verbose: bool = False, intern: bool = False, virtual: bool = False, intern_strings: bool = False, jobs: int = 1, stream: bool = False, cache: Optional[str] = None,
+         pos: Optional[Collection[str]] = None, lexfiles: Optional[Collection[str]] = None, include_entries: bool = True, include_frames: bool = True, dangling: str = 'drop', lazy_text: bool = False,
+         metrics: Optional[LoadMetrics] = None) -> WordnetModel:
     if verbose:
         print(f'loading from YAML in {home}')
-    wn = load_core(home)
+    with phase(metrics, 'parse'):
+        wn = load_core(home, intern=intern, intern_strings=intern_strings, jobs=jobs, stream=stream, cache=cache,
+                       pos=pos, lexfiles=lexfiles, include_entries=include_entries, include_frames=include_frames, dangling=dangling, metrics=metrics)
     if verbose:
         print(f'loaded {wn} from YAML in {home}')
+        if intern_strings:
+            print(f'interned strings: {wn.strings}')
     if extend:
         if verbose:
             print(f'extending relations')
             print(f'before extension: {wn.info_relations()}')
-        wn.extend()
+        with phase(metrics, 'extend'):
+            wn.extend(virtual=virtual)
         if verbose:
             print(f'after extension:  {wn.info_relations()}')
             print(f'extended relations')
     if resolve:
         if verbose:
             print(f'resolving cross-references')
-        wn.resolve()
+        with phase(metrics, 'resolve'):
+            wn.resolve()
         if verbose:
             print(f'resolved cross-references')
+    if lazy_text:
+        with phase(metrics, 'text'):
+            store = store_text(wn)
+        if verbose:
+            print(f'stored text: {store}')
+    if metrics is not None:
+        metrics.count(wn)
+        wn.metrics = metrics
     if verbose:
         print(wn)
         print(wn.info())
@@ -194,9 +588,27 @@ def load(home: str, extend: bool=True, resolve: bool=False, verbose: bool = Fals
 
 def main() -> WordnetModel:
     arg_parser = argparse.ArgumentParser(description="load from yaml")
+    arg_parser.add_argument('--jobs', type=int, default=1, help='number of processes that files are parsed in')
+    arg_parser.add_argument('--stream', action='store_true', default=False, help='stream files one record at a time')
+    arg_parser.add_argument('--cache', action='store_true', default=False, help='cache parsed files in from-dir')
+    arg_parser.add_argument('--cache-dir', type=str, default=None, help='cache parsed files in this dir')
+    arg_parser.add_argument('--pos', type=str, default=None, help='parts-of-speech of synsets to load (e.g. nv)')
+    arg_parser.add_argument('--lexfile', type=str, action='append', default=None, help='lexical name of synsets to load (repeatable)')
+    arg_parser.add_argument('--no-entries', action='store_true', default=False, help='do not load entries')
+    arg_parser.add_argument('--no-frames', action='store_true', default=False, help='do not load verb frames')
+    arg_parser.add_argument('--dangling', choices=dangling_policies, default='drop', help='policy for references to what is not loaded')
+    arg_parser.add_argument('--metrics', type=str, default=None, help='save load metrics to this JSON file')
+    arg_parser.add_argument('--trace-memory', action='store_true', default=False, help='record memory peaks in load metrics (slower)')
     arg_parser.add_argument('in_dir', type=str, help='from-dir')
     args = arg_parser.parse_args()
-    return load(args.in_dir)
+    cache = args.cache_dir if args.cache_dir else default_cache_dir(args.in_dir) if args.cache else None
+    pos = set(args.pos) if args.pos else None
+    metrics = LoadMetrics('yaml', args.in_dir, memory=args.trace_memory) if args.metrics else None
+    wn = load(args.in_dir, jobs=args.jobs, stream=args.stream, cache=cache,
+              pos=pos, lexfiles=args.lexfile, include_entries=not args.no_entries, include_frames=not args.no_frames, dangling=args.dangling, metrics=metrics)
+    if metrics is not None:
+        metrics.save(args.metrics)
+    return wn
 
 
 if __name__ == '__main__':
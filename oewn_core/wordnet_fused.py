@@ -0,0 +1,200 @@
+#!/usr/bin/python3
+
+"""
+WordNet fused single-pass YAML loader
+
+The multi-pass pipeline parses (load_core()), then extends (extend()), then resolves (resolve()), then counts
+(info(), info_relations()), each pass iterating over the whole model again.
+The fused loader does all of it while parsing: as each synset and sense is built, it is registered in the resolvers,
+its relations are resolved (or deferred when they refer forward), its inverse edges are recorded and it is counted.
+Recorded inverse edges and deferred references are then settled, without the model being iterated again.
+The model is the same as the multi-pass pipeline's.
+
+Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
+"""
+
+#  Copyright (c) 2024.
+#  Creative Commons 4 for original code
+#  GPL3 for rewrite
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+from oewn_core.wordnet import WordnetModel, Sense, Synset, RelationTable, inverse_sense_relation_type, inverse_synset_relation_type
+from oewn_core.wordnet_cache import fingerprint
+from oewn_core.wordnet_fromyaml import entries_files, synsets_files, source_files, read_records, load_lemma, load_synset, load_verbframes, new_model
+
+Edge = Tuple[str, str, str]
+""" Source id, relation type, target id """
+
+
+class Counts:
+    """
+    Counts maintained while loading
+    """
+
+    def __init__(self) -> None:
+        self.entries: int = 0
+        self.senses: int = 0
+        self.synsets: int = 0
+        self.sense_relations: int = 0
+        self.synset_relations: int = 0
+
+    def info(self, wn: WordnetModel) -> str:
+        """ Counts, as WordnetModel.info() """
+        return f'{wn} has {self.entries} entries, {self.synsets} synsets and {self.senses} senses'
+
+    def info_relations(self, wn: WordnetModel) -> str:
+        """ Counts of relations, as WordnetModel.info_relations() """
+        return f'{wn} has {self.sense_relations} sense relations and {self.synset_relations} synset relations'
+
+
+def load(home: str, extend: bool = True, resolve: bool = True, intern: bool = False, stream: bool = False, verbose: bool = False) -> Tuple[WordnetModel, Counts]:
+    """
+    Load model from YAML, in one pass
+    :param home: home dir for YAML *.yaml file
+    :param extend: whether inverse relations are added (as by WordnetModel.extend())
+    :param resolve: whether cross-references are resolved (as by WordnetModel.resolve())
+    :param intern: whether relations are interned (see RelationTable)
+    :param stream: whether files are streamed one record at a time
+    :param verbose: whether to print counts
+    :return: model, counts
+    :raises: KeyError when cross-references can't be resolved, as the multi-pass pipeline does
+    """
+    wn = new_model()
+    if intern:
+        wn.relation_table = RelationTable()
+    table = wn.relation_table
+    counts = Counts()
+    synset_resolver: Dict[str, Synset] = wn.synset_resolver
+    sense_resolver: Dict[str, Sense] = wn.sense_resolver
+    member_resolver = wn.member_resolver
+
+    # synsets first, so that senses' synsets are known when senses are built
+    synsets: List[Synset] = []
+    synset_edges: Set[Edge] = set()
+    synset_inverses: List[Edge] = []
+    deferred_synset_relations: List[Synset.Relation] = []
+    for f in synsets_files(home):
+        lex_name = Path(f).stem
+        for synsetid, synset_y in read_records(f, stream):
+            ss = load_synset(synset_y, synsetid, lex_name, table)
+            synsets.append(ss)
+            synset_resolver[ss.id] = ss
+            relations = ss.relations
+            if not relations:
+                continue
+            counts.synset_relations += len(relations)
+            if extend:
+                for r in relations:
+                    synset_edges.add((ss.id, r.relation_type, r.target))
+                    inv_t = inverse_synset_relation_type(r.relation_type, ss.id)
+                    if inv_t is not None:
+                        synset_inverses.append((r.target, inv_t, ss.id))
+            if resolve and not intern:
+                for r in relations:
+                    target = synset_resolver.get(r.target)
+                    if target is None:
+                        deferred_synset_relations.append(r)
+                    else:
+                        r.resolved_target = target
+    counts.synsets = len(synsets)
+
+    # entries
+    entries = []
+    sense_edges: Set[Edge] = set()
+    sense_inverses: List[Edge] = []
+    deferred_sense_relations: List[Sense.Relation] = []
+    for f in entries_files(home):
+        for lemma, poses_discriminants in read_records(f, stream):
+            for e in load_lemma(poses_discriminants, lemma, table):
+                entries.append(e)
+                senses = e.senses
+                counts.senses += len(senses)
+                for s in senses:
+                    sense_resolver[s.id] = s
+                    member_resolver[(e.lemma, s.synsetid)] = e
+                    if resolve:
+                        ss = synset_resolver[s.synsetid]
+                        s.resolved_synset = ss
+                    relations = s.relations
+                    if not relations:
+                        continue
+                    counts.sense_relations += len(relations)
+                    if extend:
+                        for r in relations:
+                            if not r.other_type:
+                                sense_edges.add((s.id, r.relation_type, r.target))
+                                inv_t = inverse_sense_relation_type(r.relation_type, s.id)
+                                if inv_t is not None:
+                                    sense_inverses.append((r.target, inv_t, s.id))
+                    if resolve and not intern:
+                        for r in relations:
+                            target = sense_resolver.get(r.target)
+                            if target is None:
+                                deferred_sense_relations.append(r)
+                            else:
+                                r.resolved_target = target
+    counts.entries = len(entries)
+
+    # settle deferred references, raising KeyError for dangling ones as resolve() does
+    for r in deferred_synset_relations:
+        r.resolved_target = synset_resolver[r.target]
+    for r in deferred_sense_relations:
+        r.resolved_target = sense_resolver[r.target]
+    if resolve:
+        for ss in synsets:
+            ss.resolved_members = [member_resolver[(m, ss.id)] for m in ss.members]
+
+    # settle inverse edges, in the order extend() adds them
+    if extend:
+        for target, inv_t, source in synset_inverses:
+            edge = (target, inv_t, source)
+            if edge not in synset_edges:
+                synset_edges.add(edge)
+                r = wn.make_synset_relation(source, inv_t)
+                target_synset = synset_resolver[target]
+                target_synset.relations.append(r)
+                if resolve and not intern:
+                    r.resolved_target = synset_resolver[source]
+                counts.synset_relations += 1
+        for target, inv_t, source in sense_inverses:
+            edge = (target, inv_t, source)
+            if edge not in sense_edges:
+                sense_edges.add(edge)
+                r = wn.make_sense_relation(source, inv_t)
+                target_sense = sense_resolver[target]
+                target_sense.relations.append(r)
+                if resolve and not intern:
+                    r.resolved_target = sense_resolver[source]
+                counts.sense_relations += 1
+        wn.extended = True
+
+    wn.entries = entries
+    wn.synsets = synsets
+    wn.verbframes = load_verbframes(home)
+    wn.sources = {Path(f).name: fingerprint(f) for f in source_files(home)}
+    if verbose:
+        print(counts.info(wn))
+        print(counts.info_relations(wn))
+    return wn, counts
+
+
+def main() -> WordnetModel:
+    arg_parser = argparse.ArgumentParser(description="load from yaml in one pass")
+    arg_parser.add_argument('--stream', action='store_true', default=False, help='stream files one record at a time')
+    arg_parser.add_argument('in_dir', type=str, help='from-dir')
+    args = arg_parser.parse_args()
+    wn, _ = load(args.in_dir, stream=args.stream, verbose=True)
+    return wn
+
+
+if __name__ == '__main__':
+    start_time = time.time()
+    main()
+    end_time = time.time()
+    duration = end_time - start_time
+    print(f"Loading took {duration:.6f} seconds", file=sys.stderr)
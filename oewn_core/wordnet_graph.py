@@ -0,0 +1,365 @@
+"""
+WordNet columnar relation store
+
+Synsets (or senses) are mapped to dense integers (see wordnet_ids) and their relations are held in CSR (compressed sparse row) arrays:
+- offsets : relations of node i are at [offsets[i], offsets[i+1])
+- targets : dense integer of target node
+- codes : relation type code
+Arrays are standard library arrays, available as zero-copy memoryviews or as NumPy arrays if NumPy is installed.
+Synset.relations and Sense.relations become read-only views over the store.
+
+Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
+"""
+
+#  Copyright (c) 2024.
+#  Creative Commons 4 for original code
+#  GPL3 for rewrite
+
+from array import array
+from collections.abc import Sequence
+from typing import Any, Dict, Generator, Iterable, List, Optional, Set, Tuple
+
+from oewn_core.wordnet import WordnetModel, Sense, Synset, RelationTable, ignored_symmetric_sense_relations, ignored_symmetric_synset_relations
+from oewn_core.wordnet_ids import IdMap, dense_ids
+
+synset_relation_types: List[str] = [t.value for t in Synset.Relation.Type]
+""" Synset relation type codes (index in list) """
+
+sense_relation_types: List[str] = [t.value for t in Sense.Relation.Type] + [t.value for t in Sense.Relation.OtherType]
+""" Sense relation type codes (index in list), 'other' types come last """
+
+sense_other_type_base: int = len(Sense.Relation.Type)
+""" Code of first 'other' sense relation type """
+
+
+def make_inverse_codes(types: List[str], inverses: Dict[Any, Any], ignored: Set[Any], limit: int) -> List[int]:
+    """
+    Make table of codes of inverse relation types, for the inverse relations that extension adds
+    :param types: relation types
+    :param inverses: map of relation type to inverse relation type
+    :param ignored: relation types that are not extended
+    :param limit: codes from limit upwards are not extended
+    :return: list, indexed by relation type code, of inverse type code or -1 if extension does not apply
+    """
+    codes = {t: i for i, t in enumerate(types)}
+    result = []
+    for i, t in enumerate(types):
+        inv_t = inverses.get(t) if i < limit else None
+        result.append(codes[inv_t] if inv_t is not None and inv_t != t and t not in ignored else -1)
+    return result
+
+
+class RelationGraph:
+    """
+    CSR store of relations between nodes of one kind (synsets or senses)
+    """
+
+    def __init__(self, nodes: IdMap, types: List[str], sense: bool, table: RelationTable) -> None:
+        self.nodes: IdMap = nodes
+        self.types: List[str] = types
+        self.type_codes: Dict[str, int] = {t: i for i, t in enumerate(types)}
+        self.sense: bool = sense
+        self.table: RelationTable = table
+        self.offsets: array = array('q', [0])
+        self.targets: array = array('i')
+        self.codes: array = array('B')
+
+    def __str__(self) -> str:
+        return f'{"sense" if self.sense else "synset"} graph with {len(self)} nodes and {len(self.targets)} relations'
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def ids(self) -> List[str]:
+        """ Node ids, indexed by dense integer """
+        return self.nodes.ids
+
+    @property
+    def index(self) -> Dict[str, int]:
+        """ Dense integers, indexed by node id """
+        return self.nodes.index
+
+    # B U I L D
+
+    def add_node(self, relations: Iterable[Sense.Relation | Synset.Relation], source: str) -> None:
+        """
+        Append relations of next node (in dense integer order)
+        :param relations: relations of node
+        :param source: id of node (for error messages)
+        """
+        index = self.index
+        for r in relations:
+            i = index.get(r.target)
+            if i is None:
+                raise ValueError(f'Unresolved target {r.target} in relation of type {r.relation_type} in {source}')
+            self.targets.append(i)
+            self.codes.append(self.type_codes[r.relation_type])
+        self.offsets.append(len(self.targets))
+
+    # A C C E S S
+
+    def relation(self, k: int) -> Sense.Relation | Synset.Relation:
+        """
+        Relation k as (interned) relation object
+        :param k: relation index in the CSR arrays
+        :return: interned relation
+        """
+        code = self.codes[k]
+        target = self.ids[self.targets[k]]
+        if self.sense:
+            return self.table.sense_relation(target, self.types[code], code >= sense_other_type_base)
+        return self.table.synset_relation(target, self.types[code])
+
+    def edges(self, i: int) -> Generator[Tuple[int, int], None, None]:
+        """
+        Relations of node i
+        :param i: dense integer of source node
+        :return: generator of (type code, dense integer of target node)
+        """
+        for k in range(self.offsets[i], self.offsets[i + 1]):
+            yield self.codes[k], self.targets[k]
+
+    def targets_of(self, i: int, code: int) -> List[int]:
+        """
+        Targets of relations of given type from node i
+        :param i: dense integer of source node
+        :param code: relation type code
+        :return: list of dense integers of target nodes
+        """
+        return [self.targets[k] for k in range(self.offsets[i], self.offsets[i + 1]) if self.codes[k] == code]
+
+    def closure(self, i: int, code: int) -> Set[int]:
+        """
+        Transitive closure of relations of given type from node i (e.g. all hypernyms)
+        :param i: dense integer of source node
+        :param code: relation type code
+        :return: set of dense integers of reachable nodes, node i is not included unless there is a loop
+        """
+        offsets = self.offsets
+        targets = self.targets
+        codes = self.codes
+        result: Set[int] = set()
+        stack = [i]
+        while stack:
+            n = stack.pop()
+            for k in range(offsets[n], offsets[n + 1]):
+                if codes[k] == code:
+                    j = targets[k]
+                    if j not in result:
+                        result.add(j)
+                        stack.append(j)
+        return result
+
+    def find_loops(self, codes: Set[int]) -> Generator[int, None, None]:
+        """
+        Find nodes that take part in a loop made of relations whose type is in codes
+        :param codes: relation type codes
+        :return: generator of dense integers of nodes on a loop
+        """
+        offsets = self.offsets
+        targets = self.targets
+        type_codes = self.codes
+        n = len(self)
+        # iterative three-color depth-first search
+        white, grey, black = 0, 1, 2
+        color = bytearray(n)
+        for root in range(n):
+            if color[root] != white:
+                continue
+            color[root] = grey
+            stack = [(root, offsets[root])]
+            while stack:
+                node, k = stack[-1]
+                end = offsets[node + 1]
+                while k < end and type_codes[k] not in codes:
+                    k += 1
+                if k == end:
+                    color[node] = black
+                    stack.pop()
+                    continue
+                stack[-1] = (node, k + 1)
+                j = targets[k]
+                if color[j] == grey:
+                    yield j
+                elif color[j] == white:
+                    color[j] = grey
+                    stack.append((j, offsets[j]))
+
+    @property
+    def buffers(self) -> Tuple[memoryview, memoryview, memoryview]:
+        """ Zero-copy views of offsets, targets and type codes arrays """
+        return memoryview(self.offsets), memoryview(self.targets), memoryview(self.codes)
+
+    def as_numpy(self) -> Tuple[Any, Any, Any]:
+        """
+        Zero-copy NumPy arrays of offsets, targets and type codes
+        :raises ImportError: if NumPy is not installed
+        """
+        import numpy
+        return tuple(numpy.frombuffer(b, dtype=b.format) for b in self.buffers)
+
+    # E X T E N D
+
+    def extend(self) -> int:
+        """
+        Add inverse relations as needed, as WordnetModel.extend() does.
+        Inverses are appended after the node's relations, in the same order.
+        :return: number of added relations
+        """
+        if self.sense:
+            inverse_codes = make_inverse_codes(self.types, Sense.Relation.inverses, ignored_symmetric_sense_relations, sense_other_type_base)
+        else:
+            inverse_codes = make_inverse_codes(self.types, Synset.Relation.inverses, ignored_symmetric_synset_relations, len(self.types))
+        n = len(self)
+        t = len(self.types)
+        offsets = self.offsets
+        targets = self.targets
+        codes = self.codes
+
+        # existing (source, type, target) triples, encoded as integers
+        existing: Set[int] = set()
+        for i in range(n):
+            for k in range(offsets[i], offsets[i + 1]):
+                existing.add((i * t + codes[k]) * n + targets[k])
+
+        # inverses to be added to target nodes
+        added: Dict[int, List[Tuple[int, int]]] = {}
+        for i in range(n):
+            for k in range(offsets[i], offsets[i + 1]):
+                inv_code = inverse_codes[codes[k]]
+                if inv_code != -1:
+                    j = targets[k]
+                    key = (j * t + inv_code) * n + i
+                    if key not in existing:
+                        existing.add(key)
+                        added.setdefault(j, []).append((inv_code, i))
+        if not added:
+            return 0
+
+        # rebuild
+        new_offsets = array('q', [0])
+        new_targets = array('i')
+        new_codes = array('B')
+        count = 0
+        for i in range(n):
+            new_targets.extend(targets[offsets[i]:offsets[i + 1]])
+            new_codes.extend(codes[offsets[i]:offsets[i + 1]])
+            for inv_code, j in added.get(i, ()):
+                new_codes.append(inv_code)
+                new_targets.append(j)
+                count += 1
+            new_offsets.append(len(new_targets))
+        self.offsets = new_offsets
+        self.targets = new_targets
+        self.codes = new_codes
+        return count
+
+
+class RelationsView(Sequence):
+    """
+    Read-only view of the relations of one node in a relation graph.
+    Relations are yielded as interned relations.
+    """
+
+    __slots__ = ('graph', 'node')
+
+    def __init__(self, graph: RelationGraph, node: int) -> None:
+        self.graph: RelationGraph = graph
+        self.node: int = node
+
+    def __len__(self) -> int:
+        return self.graph.offsets[self.node + 1] - self.graph.offsets[self.node]
+
+    def __getitem__(self, i):
+        start = self.graph.offsets[self.node]
+        end = self.graph.offsets[self.node + 1]
+        if isinstance(i, slice):
+            return [self.graph.relation(k) for k in range(start, end)[i]]
+        if i < 0:
+            i += end - start
+        if i < 0 or start + i >= end:
+            raise IndexError('relation index out of range')
+        return self.graph.relation(start + i)
+
+    def __iter__(self):
+        for k in range(self.graph.offsets[self.node], self.graph.offsets[self.node + 1]):
+            yield self.graph.relation(k)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+def build_synset_graph(wn: WordnetModel, table: Optional[RelationTable] = None) -> RelationGraph:
+    """
+    Build synset relation graph, nodes are numbered by the model's dense ids (which are updated as needed)
+    :param wn: model
+    :param table: table relations are interned in when accessed through views
+    :return: synset graph
+    """
+    ids = dense_ids(wn)
+    ids.update(wn)
+    graph = RelationGraph(ids.synsets, synset_relation_types, False, table if table is not None else RelationTable())
+    for ssid in ids.synsets:
+        ss = wn.synset_resolver.get(ssid)
+        graph.add_node(ss.relations if ss is not None else (), ssid)
+    return graph
+
+
+def build_sense_graph(wn: WordnetModel, table: Optional[RelationTable] = None) -> RelationGraph:
+    """
+    Build sense relation graph, nodes are numbered by the model's dense ids (which are updated as needed)
+    :param wn: model
+    :param table: table relations are interned in when accessed through views
+    :return: sense graph
+    """
+    ids = dense_ids(wn)
+    ids.update(wn)
+    graph = RelationGraph(ids.senses, sense_relation_types, True, table if table is not None else RelationTable())
+    for sid in ids.senses:
+        s = wn.sense_resolver.get(sid)
+        graph.add_node(s.relations if s is not None else (), sid)
+    return graph
+
+
+def install_views(wn: WordnetModel) -> None:
+    """
+    Make synsets' and senses' relations views over the model's graphs
+    :param wn: model
+    """
+    for ss in wn.synsets:
+        ss.relations = RelationsView(wn.synset_graph, wn.synset_graph.index[ss.id])
+    for s in wn.senses:
+        s.relations = RelationsView(wn.sense_graph, wn.sense_graph.index[s.id])
+
+
+def compact(wn: WordnetModel) -> WordnetModel:
+    """
+    Move model's relations to columnar store.
+    Synset.relations and Sense.relations become read-only views that yield interned relations.
+    :param wn: model
+    :return: model
+    """
+    if wn.relation_table is None:
+        wn.relation_table = RelationTable()
+        wn.relation_table.stale(wn.resolution)
+    wn.synset_graph = build_synset_graph(wn, wn.relation_table)
+    wn.sense_graph = build_sense_graph(wn, wn.relation_table)
+    install_views(wn)
+    return wn
+
+
+def expand(wn: WordnetModel) -> WordnetModel:
+    """
+    Move model's relations back from columnar store to lists of relations, for the model to be editable again.
+    Relations remain interned.
+    :param wn: model
+    :return: model
+    """
+    for ss in wn.synsets:
+        ss.relations = list(ss.relations)
+    for s in wn.senses:
+        s.relations = list(s.relations)
+    wn.synset_graph = None
+    wn.sense_graph = None
+    return wn
@@ -0,0 +1,129 @@
+"""
+WordNet dense integer ids
+
+Synset ids, sense ids and entry keys (lemma, pos, discriminant) are mapped to contiguous integers, in model order.
+The mapping is built once per model, held by the model and pickled with it.
+It is stable: keys are only ever appended, so that integers remain valid as the model grows.
+
+Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
+"""
+
+#  Copyright (c) 2024.
+#  Creative Commons 4 for original code
+#  GPL3 for rewrite
+
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional
+
+from oewn_core.wordnet import WordnetModel
+
+
+class IdMap:
+    """
+    Bidirectional mapping of keys to contiguous integers
+    """
+
+    def __init__(self, keys: Iterable[Hashable] = ()) -> None:
+        self.ids: List[Any] = []
+        self.index: Dict[Any, int] = {}
+        for k in keys:
+            if k in self.index:
+                raise ValueError(f'Duplicate key {k}')
+            self.add(k)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, key) -> bool:
+        return key in self.index
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.ids)
+
+    def __getitem__(self, key) -> int:
+        """
+        Integer of key
+        :param key: key
+        :return: integer
+        :raises: KeyError if key is not mapped
+        """
+        return self.index[key]
+
+    def get(self, key, default: Optional[int] = None) -> Optional[int]:
+        return self.index.get(key, default)
+
+    def key(self, i: int) -> Any:
+        """
+        Key of integer
+        :param i: integer
+        :return: key
+        :raises: IndexError if integer is not mapped
+        """
+        return self.ids[i]
+
+    def add(self, key) -> int:
+        """
+        Map key, if it is not mapped yet, to next integer
+        :param key: key
+        :return: integer of key
+        """
+        i = self.index.get(key)
+        if i is None:
+            i = len(self.ids)
+            self.ids.append(key)
+            self.index[key] = i
+        return i
+
+    def rebuild_index(self) -> None:
+        """ Rebuild key-to-integer index, after keys have been replaced in place by equal keys """
+        self.index = {k: i for i, k in enumerate(self.ids)}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {'ids': self.ids}  # index is rebuilt when unpickled
+
+    def __setstate__(self, state) -> None:
+        self.ids = state['ids']
+        self.rebuild_index()
+
+
+class DenseIds:
+    """
+    Dense integer ids of a model's synsets, senses and entries
+    """
+
+    def __init__(self, wn: Optional[WordnetModel] = None) -> None:
+        self.synsets: IdMap = IdMap()
+        self.senses: IdMap = IdMap()
+        self.entries: IdMap = IdMap()
+        if wn is not None:
+            self.synsets = IdMap(ss.id for ss in wn.synsets)
+            self.senses = IdMap(s.id for s in wn.senses)
+            self.entries = IdMap(e.key for e in wn.entries)
+
+    def __str__(self) -> str:
+        return f'dense ids for {len(self.synsets)} synsets, {len(self.senses)} senses, {len(self.entries)} entries'
+
+    def update(self, wn: WordnetModel) -> int:
+        """
+        Map model's synsets, senses and entries that are not mapped yet. Existing integers are left unchanged.
+        :param wn: model
+        :return: number of added keys
+        """
+        n = len(self.synsets) + len(self.senses) + len(self.entries)
+        for ss in wn.synsets:
+            self.synsets.add(ss.id)
+        for e in wn.entries:
+            self.entries.add(e.key)
+            for s in e.senses:
+                self.senses.add(s.id)
+        return len(self.synsets) + len(self.senses) + len(self.entries) - n
+
+
+def dense_ids(wn: WordnetModel) -> DenseIds:
+    """
+    Get model's dense ids, building them on first call
+    :param wn: model
+    :return: dense ids, held by the model (and pickled with it)
+    """
+    if wn.dense_ids is None:
+        wn.dense_ids = DenseIds(wn)
+    return wn.dense_ids
@@ -0,0 +1,140 @@
+"""
+WordNet load metrics
+
+Loaders record, in a LoadMetrics object passed to them and attached to the model they return (wn.metrics):
+- per-file parse time and throughput (records per second),
+- per-phase (parse, extend, resolve, ...) time and, optionally, tracemalloc peak,
+so that builds can be compared run to run. Metrics are exported as JSON.
+Memory tracing slows loading down, so it is off unless asked for.
+
+Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
+"""
+
+#  Copyright (c) 2024.
+#  Creative Commons 4 for original code
+#  GPL3 for rewrite
+
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, ContextManager, Dict, Generator, List, Optional
+
+
+class LoadMetrics:
+    """
+    Load metrics
+    """
+
+    def __init__(self, loader: str = '', source: str = '', memory: bool = False) -> None:
+        """
+        Constructor
+        :param loader: loader name (yaml, xml, pickle)
+        :param source: source dir or file
+        :param memory: whether tracemalloc peaks are recorded per phase
+        """
+        self.loader: str = loader
+        self.source: str = source
+        self.memory: bool = memory
+        self.timestamp: float = time.time()
+        self.phases: Dict[str, Dict[str, Any]] = {}  # duration (s), peak and allocated (bytes, if memory is traced), keyed by phase name, in phase order
+        self.files: List[Dict[str, Any]] = []  # file name, duration (s), records, records per second, in load order
+        self.counts: Dict[str, int] = {}  # model counts
+
+    @contextmanager
+    def phase(self, name: str) -> Generator[None, None, None]:
+        """
+        Record phase
+        Peak is that of memory allocated during the phase, above what was allocated when it started, if tracing is
+        started for the phase. If tracemalloc is already tracing (e.g. for a profiler), its peak is not reset: peak is
+        then how much the phase raised it, 0 if the phase stayed below the peak reached before it.
+        :param name: phase name
+        """
+        started = False
+        if self.memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started = True
+            current0, peak0 = tracemalloc.get_traced_memory()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            metrics: Dict[str, Any] = {'duration': time.perf_counter() - start}
+            if self.memory:
+                current, peak = tracemalloc.get_traced_memory()
+                metrics['peak'] = peak - current0 if started else peak - peak0
+                metrics['allocated'] = current - current0
+                if started:
+                    tracemalloc.stop()
+            self.phases[name] = metrics
+
+    def add_file(self, f: str, duration: float, records: int) -> None:
+        """
+        Record file
+        :param f: file
+        :param duration: duration of its parsing (s)
+        :param records: number of records (entries, synsets, frames) built from it
+        """
+        self.files.append({'file': Path(f).name, 'duration': duration, 'records': records, 'rate': records / duration if duration > 0 else 0.})
+
+    def count(self, wn: Any) -> None:
+        """
+        Record model counts
+        :param wn: model
+        """
+        self.counts = {
+            'entries': len(wn.entries),
+            'senses': sum(len(e.senses) for e in wn.entries),
+            'synsets': len(wn.synsets),
+            'sense_relations': sum(len(s.relations) for e in wn.entries for s in e.senses),
+            'synset_relations': sum(len(ss.relations) for ss in wn.synsets),
+        }
+
+    @property
+    def duration(self) -> float:
+        """ Total duration of phases (s) """
+        return sum(p['duration'] for p in self.phases.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'loader': self.loader,
+            'source': self.source,
+            'timestamp': self.timestamp,
+            'duration': self.duration,
+            'phases': self.phases,
+            'files': self.files,
+            'counts': self.counts,
+        }
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def save(self, path: str) -> None:
+        """
+        Save as JSON
+        :param path: JSON file
+        """
+        with open(path, 'w', encoding='utf-8') as out:
+            out.write(self.to_json())
+            out.write('\n')
+
+    def __str__(self) -> str:
+        lines = [f'{self.loader} load of {self.source} took {self.duration:.3f}s']
+        for name, p in self.phases.items():
+            peak = f' peak {p["peak"] / 1048576:.1f}MB' if 'peak' in p else ''
+            lines.append(f'  {name:<16}{p["duration"]:>10.3f}s{peak}')
+        for f in self.files:
+            lines.append(f'  {f["file"]:<32}{f["duration"]:>10.3f}s {f["records"]:>8} records {f["rate"]:>10.0f}/s')
+        return '\n'.join(lines)
+
+
+def phase(metrics: Optional[LoadMetrics], name: str) -> ContextManager[None]:
+    """
+    Phase recorder, that records nothing if there are no metrics
+    :param metrics: metrics, possibly None
+    :param name: phase name
+    :return: context manager
+    """
+    return nullcontext() if metrics is None else metrics.phase(name)
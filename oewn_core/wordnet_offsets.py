@@ -0,0 +1,331 @@
+#!/usr/bin/python3
+
+"""
+WordNet byte-offset index of YAML sources
+
+A sidecar index maps each synset id and each lemma to the (file, byte offset, length) of its top-level record in the YAML
+source dir, and each sense id to its lemma. Single synsets, entries and senses are then parsed on demand, without the
+whole files being loaded. The index is built by scanning lines (no YAML parsing, quoted keys excepted), it is stored in
+the cache dir and rebuilt when source files change.
+The lazy resolvers are dict-like (read-only Mapping) replacements for the model's synset and sense resolvers.
+
+Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
+"""
+
+#  Copyright (c) 2024.
+#  Creative Commons 4 for original code
+#  GPL3 for rewrite
+
+import argparse
+import os
+import pickle
+import sys
+import time
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import yaml
+
+from oewn_core.wordnet import Entry, Sense, Synset
+from oewn_core.wordnet_cache import default_cache_dir, fingerprint
+from oewn_core.wordnet_fromyaml import entries_files, synsets_files, load_lemma, load_synset
+
+Location = Tuple[str, int, int]
+""" File name, byte offset, byte length """
+
+index_name = 'offsets.pickle'
+""" Name of index file, in cache dir """
+
+
+class OffsetIndex:
+    """
+    Byte-offset index of top-level records in YAML source files
+    """
+
+    def __init__(self) -> None:
+        self.fingerprints: Dict[str, Tuple[int, int]] = {}  # file name -> (mtime in ns, size) when indexed
+        self.synsets: Dict[str, Location] = {}  # synset id -> location of synset record
+        self.lemmas: Dict[str, Location] = {}  # lemma -> location of lemma record
+        self.senses: Dict[str, str] = {}  # sense id -> lemma
+
+    def __str__(self) -> str:
+        return f'offset index of {len(self.synsets)} synsets, {len(self.lemmas)} lemmas, {len(self.senses)} senses in {len(self.fingerprints)} files'
+
+    def valid(self, home: str) -> bool:
+        """
+        Whether index is valid for source files
+        :param home: home dir for YAML *.yaml file
+        :return: true if no file has been added, removed or changed since it was indexed
+        """
+        return self.fingerprints == source_fingerprints(home)
+
+    @staticmethod
+    def read(home: str, location: Location) -> Tuple[Any, Any]:
+        """
+        Parse record
+        :param home: home dir for YAML *.yaml file
+        :param location: location of record
+        :return: record's key and value
+        """
+        name, offset, length = location
+        with open(f'{home}/{name}', 'rb') as inp:
+            inp.seek(offset)
+            chunk = inp.read(length)
+        y: Dict[str, Any] = yaml.load(chunk, Loader=yaml.CLoader)
+        return next(iter(y.items()))
+
+    def synset(self, home: str, synsetid: str) -> Synset:
+        """
+        Parse synset
+        :param home: home dir for YAML *.yaml file
+        :param synsetid: synset id
+        :return: synset
+        :raises: KeyError if synset id is not indexed
+        """
+        location = self.synsets[synsetid]
+        _, y = self.read(home, location)
+        return load_synset(y, synsetid, Path(location[0]).stem)
+
+    def entries(self, home: str, lemma: str) -> List[Entry]:
+        """
+        Parse lemma's entries
+        :param home: home dir for YAML *.yaml file
+        :param lemma: lemma
+        :return: entries, with their senses
+        :raises: KeyError if lemma is not indexed
+        """
+        _, y = self.read(home, self.lemmas[lemma])
+        return load_lemma(y, lemma)
+
+
+def source_fingerprints(home: str) -> Dict[str, Tuple[int, int]]:
+    return {Path(f).name: fingerprint(f)[:2] for f in entries_files(home) + synsets_files(home)}
+
+
+def record_key(line: bytes, record: bytes) -> Optional[str]:
+    """
+    Key of top-level record
+    :param line: record's first line
+    :param record: record
+    :return: key, None if record is not a key-value pair (e.g. the empty mapping of an empty file)
+    """
+    text = line.decode('utf-8').rstrip()
+    if text[:1] in ("'", '"', '?', '!', '&', '{') or not text.endswith(':'):
+        # quoted or complex key
+        y: Dict[str, Any] = yaml.load(record, Loader=yaml.CLoader)
+        return next(iter(y), None) if isinstance(y, dict) else None
+    return text[:-1]
+
+
+def sense_id(line: bytes) -> Optional[str]:
+    """
+    Sense id in line of entries file
+    :param line: line
+    :return: sense id if line holds a sense's id, None otherwise
+    """
+    text = line.decode('utf-8').rstrip()
+    if not (text.startswith('    - id: ') or text.startswith('      id: ')):
+        return None
+    value = text[10:]
+    if value[:1] == "'" and value[-1:] == "'":
+        return value[1:-1].replace("''", "'")  # single-quoted scalar
+    if value[:1] in ("'", '"'):
+        return yaml.load(value, Loader=yaml.CLoader)
+    return value
+
+
+def record_start(line: bytes) -> bool:
+    """
+    Whether line starts a top-level record
+    :param line: line
+    :return: false if line is indented, blank, a comment, a document marker, a top-level sequence item or a complex key's value, true otherwise
+    """
+    if line[:1] in (b' ', b'\t', b'\n', b'\r', b'#'):
+        return False
+    if line[:1] in (b'-', b':') and line[1:2] in (b'', b' ', b'\t', b'\n', b'\r'):
+        return False  # '- ' sequence item or ': ' complex key's value, not plain scalars like '-ism' or ':-)'
+    if line[:3] in (b'---', b'...') and line[3:4] in (b'', b' ', b'\t', b'\n', b'\r'):
+        return False  # document marker, not plain scalars like '.22-caliber'
+    return True
+
+
+def index_file(f: str, index: Dict[str, Location], senses: Optional[Dict[str, str]] = None) -> None:
+    """
+    Index top-level records of YAML file
+    :param f: YAML file
+    :param index: index to add record locations to, by key
+    :param senses: if not None, index to add sense ids to, with their lemma
+    """
+    name = Path(f).name
+    with open(f, 'rb') as inp:
+        data = inp.read()
+    starts: List[int] = []
+    sense_lines: List[Tuple[int, bytes]] = []
+    offset = 0
+    for line in data.splitlines(keepends=True):
+        if record_start(line):
+            starts.append(offset)
+        elif senses is not None and line[:1] == b' ' and b'id: ' in line:
+            sense_lines.append((len(starts) - 1, line))
+        offset += len(line)
+    keys: List[Optional[str]] = []
+    for i, start in enumerate(starts):
+        end = starts[i + 1] if i + 1 < len(starts) else len(data)
+        line_end = data.find(b'\n', start, end)
+        key = record_key(data[start:line_end if line_end != -1 else end], data[start:end])
+        if key is not None:
+            index[key] = (name, start, end - start)
+        keys.append(key)
+    if senses is not None:
+        for i, line in sense_lines:
+            sid = sense_id(line)
+            if sid is not None and i >= 0 and keys[i] is not None:
+                senses[sid] = keys[i]
+
+
+def build_index(home: str) -> OffsetIndex:
+    """
+    Build offset index of YAML source files
+    :param home: home dir for YAML *.yaml file
+    :return: index
+    """
+    index = OffsetIndex()
+    index.fingerprints = source_fingerprints(home)
+    for f in entries_files(home):
+        index_file(f, index.lemmas, index.senses)
+    for f in synsets_files(home):
+        index_file(f, index.synsets)
+    return index
+
+
+def index_path(home: str) -> str:
+    """
+    Default index file
+    :param home: home dir for YAML *.yaml file
+    :return: index file path, in default cache dir
+    """
+    return f'{default_cache_dir(home)}/{index_name}'
+
+
+def load_index(home: str, path: Optional[str] = None) -> OffsetIndex:
+    """
+    Get offset index of YAML source files, read from index file if it is valid, built and written atomically otherwise
+    :param home: home dir for YAML *.yaml file
+    :param path: index file, None for default
+    :return: index
+    """
+    if path is None:
+        path = index_path(home)
+    try:
+        with open(path, 'rb') as inp:
+            index: OffsetIndex = pickle.load(inp)
+        if index.valid(home):
+            return index
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        pass
+    index = build_index(home)
+    os.makedirs(Path(path).parent, exist_ok=True)
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'wb') as out:
+        pickle.dump(index, out, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+    return index
+
+
+class LazySynsetResolver(Mapping):
+    """
+    Synset resolver from id, synsets being parsed on first access, and cached
+    """
+
+    def __init__(self, home: str, index: Optional[OffsetIndex] = None) -> None:
+        self.home: str = home
+        self.index: OffsetIndex = index if index is not None else load_index(home)
+        self.cache: Dict[str, Synset] = {}
+
+    def __getitem__(self, synsetid: str) -> Synset:
+        synset = self.cache.get(synsetid)
+        if synset is None:
+            synset = self.index.synset(self.home, synsetid)
+            self.cache[synsetid] = synset
+        return synset
+
+    def __contains__(self, synsetid: object) -> bool:
+        return synsetid in self.index.synsets
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.index.synsets)
+
+    def __len__(self) -> int:
+        return len(self.index.synsets)
+
+
+class LazySenseResolver(Mapping):
+    """
+    Sense resolver from id, senses being parsed with their lemma's entries on first access, and cached
+    """
+
+    def __init__(self, home: str, index: Optional[OffsetIndex] = None) -> None:
+        self.home: str = home
+        self.index: OffsetIndex = index if index is not None else load_index(home)
+        self.cache: Dict[str, Sense] = {}
+        self.lemmas: Dict[str, List[Entry]] = {}
+
+    def entries(self, lemma: str) -> List[Entry]:
+        """
+        Lemma's entries, parsed on first access, and cached with their senses
+        :param lemma: lemma
+        :return: entries
+        :raises: KeyError if lemma is not indexed
+        """
+        entries = self.lemmas.get(lemma)
+        if entries is None:
+            entries = self.index.entries(self.home, lemma)
+            self.lemmas[lemma] = entries
+            for e in entries:
+                for s in e.senses:
+                    self.cache[s.id] = s
+        return entries
+
+    def __getitem__(self, senseid: str) -> Sense:
+        sense = self.cache.get(senseid)
+        if sense is None:
+            self.entries(self.index.senses[senseid])
+            sense = self.cache[senseid]
+        return sense
+
+    def __contains__(self, senseid: object) -> bool:
+        return senseid in self.index.senses
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.index.senses)
+
+    def __len__(self) -> int:
+        return len(self.index.senses)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="look up synsets and senses in YAML by offset index")
+    arg_parser.add_argument('in_dir', type=str, help='from-dir')
+    arg_parser.add_argument('ids', type=str, nargs='+', help='synset ids or sense ids')
+    args = arg_parser.parse_args()
+    index = load_index(args.in_dir)
+    synsets = LazySynsetResolver(args.in_dir, index)
+    senses = LazySenseResolver(args.in_dir, index)
+    for i in args.ids:
+        if i in synsets:
+            ss = synsets[i]
+            print(f'{ss.id} {ss.lex_name} {ss.members} {ss.definitions}')
+        elif i in senses:
+            s = senses[i]
+            print(f'{s.id} {s.entry.lemma} {s.synsetid}')
+        else:
+            print(f'{i} not found', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    start_time = time.time()
+    main()
+    end_time = time.time()
+    duration = end_time - start_time
+    print(f"Look-up took {duration:.6f} seconds", file=sys.stderr)
@@ -0,0 +1,94 @@
+"""
+WordNet overlays
+
+An overlay is a YAML dir that holds only added or modified entries and synsets (and, optionally, verb frames), in the
+same files as the full YAML source. It is applied on top of a base model, typically a snapshot (pickle):
+entries replace the base entries with the same (lemma, pos, discriminant) key, synsets replace the base synsets with the
+same id, others are added. Resolvers are patched and, if the base is extended, so are the inverse relations.
+Overlays do not delete: an overlay that changes a synset's members or an entry's senses must hold both sides.
+
+Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
+"""
+
+#  Copyright (c) 2024.
+#  Creative Commons 4 for original code
+#  GPL3 for rewrite
+
+import os
+from typing import Dict, List, Optional, Tuple
+
+from oewn_core.wordnet import WordnetModel, Entry, Synset, VerbFrame
+from oewn_core.wordnet_fromyaml import entries_files, synsets_files, load_entries_file, load_synsets_file, load_verbframes
+from oewn_core.wordnet_reload import detach, attach
+
+
+def load_overlay(home: str, wn: WordnetModel) -> Tuple[List[Entry], List[Synset], List[VerbFrame]]:
+    """
+    Load overlay
+    :param home: overlay dir
+    :param wn: model the overlay is to be applied to, whose relation table and string pool (if any) relations and strings are interned in
+    :return: entries, synsets, verb frames of overlay (later ones win over earlier ones with the same key)
+    """
+    entries: Dict[Tuple[str, str, Optional[str]], Entry] = {}
+    for f in entries_files(home):
+        for e in load_entries_file(f, wn.relation_table, wn.strings):
+            entries[e.key] = e
+    synsets: Dict[str, Synset] = {}
+    for f in synsets_files(home):
+        for ss in load_synsets_file(f, wn.relation_table, wn.strings):
+            synsets[ss.id] = ss
+    verbframes = load_verbframes(home, wn.strings) if os.path.exists(f'{home}/frames.yaml') else []
+    return list(entries.values()), list(synsets.values()), verbframes
+
+
+def apply_overlay(wn: WordnetModel, home: str, extend: Optional[bool] = None) -> Tuple[int, int]:
+    """
+    Apply overlay to model, in place. Resolved cross-references are staled.
+    :param wn: base model
+    :param home: overlay dir
+    :param extend: whether the base's inverse relations are stored (see WordnetModel.extend()), None to tell from the model
+    :return: number of replaced objects, number of added objects
+    :raises: ValueError if relations are views over columnar stores (see wordnet_graph)
+    """
+    if wn.synset_graph is not None or wn.sense_graph is not None:
+        raise ValueError(f'{wn} has columnar relation stores, expand them first')
+    if extend is None:
+        extend = wn.extended
+    entries, synsets, verbframes = load_overlay(home, wn)
+
+    entry_index = {e.key: i for i, e in enumerate(wn.entries)}
+    synset_index = {ss.id: i for i, ss in enumerate(wn.synsets)}
+    old_entries = [wn.entries[entry_index[e.key]] for e in entries if e.key in entry_index]
+    old_synsets = [wn.synsets[synset_index[ss.id]] for ss in synsets if ss.id in synset_index]
+    sources = detach(wn, old_entries, old_synsets, extend)
+
+    # replace in place, add last
+    new_entries = list(wn.entries)
+    for e in entries:
+        i = entry_index.get(e.key)
+        if i is None:
+            new_entries.append(e)
+        else:
+            new_entries[i] = e
+    wn.entries = new_entries
+    for ss in synsets:
+        i = synset_index.get(ss.id)
+        if i is None:
+            wn.synsets.append(ss)
+        else:
+            wn.synsets[i] = ss
+    if verbframes:
+        frame_index = {f.id: i for i, f in enumerate(wn.verbframes)}
+        new_verbframes = list(wn.verbframes)
+        for f in verbframes:
+            i = frame_index.get(f.id)
+            if i is None:
+                new_verbframes.append(f)
+            else:
+                new_verbframes[i] = f
+        wn.verbframes = new_verbframes
+    attach(wn, entries, synsets, sources, extend)
+    wn.stale()
+
+    replaced = len(old_entries) + len(old_synsets)
+    return replaced, len(entries) + len(synsets) - replaced
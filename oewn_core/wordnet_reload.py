@@ -0,0 +1,258 @@
+"""
+WordNet incremental reload of changed YAML files into a live model
+
+YAML files that changed since the model was loaded (as told by their modification time and size, then by their content
+hash) are parsed again, and only the entries and synsets they hold are replaced in the model.
+Files own their objects as the YAML writer partitions them: entries by the first letter of their lemma
+(entries-[a-z0].yaml), synsets by their lexical name (<lex_name>.yaml).
+Resolvers are patched and, if the model is extended, so are the inverse relations that point to or from replaced objects.
+
+Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
+"""
+
+#  Copyright (c) 2024.
+#  Creative Commons 4 for original code
+#  GPL3 for rewrite
+
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, TypeVar
+
+from oewn_core.wordnet import WordnetModel, Entry, Sense, Synset, extended_sense_relations, extended_synset_relations
+from oewn_core.wordnet_cache import content_hash, fingerprint
+from oewn_core.wordnet_fromyaml import entries_files, synsets_files, source_files, load_entries_file, load_synsets_file, load_verbframes
+from oewn_core.wordnet_toyaml import az
+
+T = TypeVar('T')
+
+
+def entries_file_name(lemma: str) -> str:
+    """
+    Name of the entries file that holds lemma, as partitioned by the YAML writer
+    :param lemma: lemma
+    :return: file name
+    """
+    first = lemma.lower()[:1]
+    return f'entries-{first if first and first in az else "0"}.yaml'
+
+
+def synsets_file_name(lex_name: str) -> str:
+    """
+    Name of the synsets file that holds lexical name's synsets
+    :param lex_name: lexical name
+    :return: file name
+    """
+    return f'{lex_name}.yaml'
+
+
+def is_entries_file(name: str) -> bool:
+    return name.startswith('entries-')
+
+
+def is_synsets_file(name: str) -> bool:
+    return not is_entries_file(name) and name != 'frames.yaml'
+
+
+def changed_files(wn: WordnetModel, home: str) -> Tuple[List[str], List[str]]:
+    """
+    Source files that changed since the model was loaded. Fingerprints of files whose modification time or size changed
+    but whose content did not are updated.
+    :param wn: model, all files are changed if it holds no fingerprints
+    :param home: home dir for YAML *.yaml file
+    :return: changed (or added) file paths, deleted file names (files that a partial load left out are ignored)
+    """
+    sources = wn.sources if wn.sources is not None else {}
+    changed: List[str] = []
+    names: Set[str] = set()
+    for f in source_files(home):
+        name = Path(f).name
+        names.add(name)
+        if name in sources and sources[name] is None:
+            continue  # left out
+        old = sources.get(name)
+        new = fingerprint(f)
+        if old is not None and old[:2] == new[:2]:
+            continue
+        digest = content_hash(f)
+        if old is not None and old[2] == digest:
+            sources[name] = fingerprint(f, digest)
+            continue
+        changed.append(f)
+    deleted = [name for name, fp in sources.items() if fp is not None and name not in names]
+    return changed, deleted
+
+
+def regroup(items: List[T], name_of, batches: Dict[str, List[T]], deleted: Set[str], order: List[str]) -> List[T]:
+    """
+    Replace per-file groups of items
+    :param items: current items
+    :param name_of: function that gives the name of the file that holds an item
+    :param batches: replacement items, per file name
+    :param deleted: names of deleted files, whose items are dropped
+    :param order: file names in load order
+    :return: items grouped in load order, groups of files that are not in load order last
+    """
+    groups: Dict[str, List[T]] = {}
+    for o in items:
+        groups.setdefault(name_of(o), []).append(o)
+    groups.update(batches)
+    for name in deleted:
+        groups.pop(name, None)
+    result: List[T] = []
+    for name in order:
+        result.extend(groups.pop(name, ()))
+    for group in groups.values():
+        result.extend(group)
+    return result
+
+
+def strip_inverses(nodes: List[Synset] | List[Sense], resolver: Dict[str, Synset] | Dict[str, Sense], extended: Dict[str, str], replaced: Set[str]) -> None:
+    """
+    Remove the inverse relations that extension added to the targets of nodes that are replaced
+    :param nodes: nodes that are replaced
+    :param resolver: node resolver
+    :param extended: inverse relation types of inversable relation types
+    :param replaced: ids of nodes that are replaced
+    """
+    for node in nodes:
+        for r in node.relations:
+            if isinstance(node, Sense) and r.other_type:
+                continue
+            inv_t = extended.get(r.relation_type)
+            if inv_t is None or r.target in replaced:
+                continue
+            target = resolver.get(r.target)
+            if target is not None:
+                target.relations = [r2 for r2 in target.relations if not (r2.target == node.id and r2.relation_type == inv_t and not getattr(r2, 'other_type', False))]
+
+
+def sources_of(adjacency_incoming: Dict[str, Dict[str, List[str]]], replaced: Set[str]) -> Set[str]:
+    """
+    Sources of relations to nodes that are replaced, replaced nodes excepted
+    :param adjacency_incoming: incoming adjacency (see Adjacency)
+    :param replaced: ids of nodes that are replaced
+    :return: source ids
+    """
+    return {source for node_id in replaced for sources in adjacency_incoming.get(node_id, {}).values() for source in sources} - replaced
+
+
+def detach(wn: WordnetModel, old_entries: List[Entry], old_synsets: List[Synset], extend: bool) -> Tuple[Set[str], Set[str]]:
+    """
+    First step of the replacement of entries and synsets: remove them from the resolvers and, if the model is extended,
+    remove the inverse relations they gave rise to. The model's lists are to be replaced next, then attach() is to be called.
+    :param wn: model
+    :param old_entries: entries that are replaced or removed
+    :param old_synsets: synsets that are replaced or removed
+    :param extend: whether inverse relations are stored
+    :return: ids of senses and of synsets that relate to removed nodes, whose inverse relations attach() recomputes
+    """
+    old_senses = [s for e in old_entries for s in e.senses]
+    old_sense_ids = {s.id for s in old_senses}
+    old_synset_ids = {ss.id for ss in old_synsets}
+
+    # nodes that relate to replaced nodes, whose inverse relations are recomputed
+    sense_sources = sources_of(wn.sense_adjacency.incoming, old_sense_ids) if old_sense_ids else set()
+    synset_sources = sources_of(wn.synset_adjacency.incoming, old_synset_ids) if old_synset_ids else set()
+    if extend:
+        strip_inverses(old_senses, wn.sense_resolver, extended_sense_relations, old_sense_ids)
+        strip_inverses(old_synsets, wn.synset_resolver, extended_synset_relations, old_synset_ids)
+
+    # resolvers
+    for s in old_senses:
+        wn.sense_resolver.pop(s.id, None)
+        wn.member_resolver.pop((s.entry.lemma, s.synsetid), None)
+    for ss in old_synsets:
+        wn.synset_resolver.pop(ss.id, None)
+    return sense_sources, synset_sources
+
+
+def attach(wn: WordnetModel, new_entries: List[Entry], new_synsets: List[Synset], sources: Tuple[Set[str], Set[str]], extend: bool) -> None:
+    """
+    Last step of the replacement of entries and synsets, once the model's lists hold them: add them to the resolvers
+    and, if the model is extended, add the inverse relations from them and to them.
+    Derived indexes are invalidated, resolved cross-references are to be resolved again or staled.
+    :param wn: model
+    :param new_entries: entries that replace or are added
+    :param new_synsets: synsets that replace or are added
+    :param sources: nodes that relate to removed nodes, as returned by detach()
+    :param extend: whether inverse relations are stored
+    """
+    new_senses: List[Sense] = []
+    for e in new_entries:
+        for s in e.senses:
+            wn.sense_resolver[s.id] = s
+            wn.member_resolver[(e.lemma, s.synsetid)] = e
+            new_senses.append(s)
+    for ss in new_synsets:
+        wn.synset_resolver[ss.id] = ss
+
+    # patch inverse relations, from new nodes and to new nodes
+    sense_sources, synset_sources = sources
+    if extend:
+        for s in new_senses + [wn.sense_resolver[sid] for sid in sense_sources if sid in wn.sense_resolver]:
+            wn.extend_sense_relations(s)
+        for ss in new_synsets + [wn.synset_resolver[ssid] for ssid in synset_sources if ssid in wn.synset_resolver]:
+            wn.extend_synset_relations(ss)
+
+    # derived indexes
+    wn.invalidate_adjacency()
+    if wn.dense_ids is not None:
+        wn.dense_ids.update(wn)  # ids of removed objects are kept, so that integers remain stable
+
+
+def reload_changed(wn: WordnetModel, home: str, resolve: bool = False, extend: Optional[bool] = None) -> List[str]:
+    """
+    Reload YAML files that changed since the model was loaded, replacing the entries and synsets they hold in place
+    :param wn: model, loaded from YAML files in home (all files are reloaded if it holds no fingerprints, e.g. unpickled)
+    :param home: home dir for YAML *.yaml file
+    :param resolve: whether cross-references are resolved again (otherwise they are staled)
+    :param extend: whether inverse relations are stored (see WordnetModel.extend()), None to tell from the model
+    :return: names of the files that were reloaded
+    :raises: ValueError if relations are views over columnar stores (see wordnet_graph)
+    """
+    if wn.synset_graph is not None or wn.sense_graph is not None:
+        raise ValueError(f'{wn} has columnar relation stores, expand them first')
+    if extend is None:
+        extend = wn.extended
+
+    changed, deleted_names = changed_files(wn, home)
+    if not changed and not deleted_names:
+        return []
+    batches_names = {Path(f).name: f for f in changed}
+    deleted = set(deleted_names)
+    entry_names = {name for name in list(batches_names) + deleted_names if is_entries_file(name)}
+    synset_names = {name for name in list(batches_names) + deleted_names if is_synsets_file(name)}
+
+    # parse, before the model is changed
+    entry_batches = {name: load_entries_file(f, wn.relation_table, wn.strings) for name, f in batches_names.items() if is_entries_file(name)}
+    synset_batches = {name: load_synsets_file(f, wn.relation_table, wn.strings) for name, f in batches_names.items() if is_synsets_file(name)}
+
+    # objects that are replaced
+    old_entries = [e for e in wn.entries if entries_file_name(e.lemma) in entry_names]
+    old_synsets = [ss for ss in wn.synsets if synsets_file_name(ss.lex_name) in synset_names]
+    sources = detach(wn, old_entries, old_synsets, extend)
+
+    # replace, in load order
+    if entry_names:
+        order = [Path(f).name for f in entries_files(home)]
+        wn.entries = regroup(list(wn.entries), lambda e: entries_file_name(e.lemma), entry_batches, deleted, order)
+    if synset_names:
+        order = [Path(f).name for f in synsets_files(home)]
+        wn.synsets = regroup(wn.synsets, lambda ss: synsets_file_name(ss.lex_name), synset_batches, deleted, order)
+    if 'frames.yaml' in batches_names:
+        wn.verbframes = load_verbframes(home, wn.strings)
+    attach(wn, [e for batch in entry_batches.values() for e in batch], [ss for batch in synset_batches.values() for ss in batch], sources, extend)
+
+    # cross-references
+    if resolve:
+        wn.resolve()
+    else:
+        wn.stale()
+
+    # fingerprints
+    if wn.sources is None:
+        wn.sources = {}
+    for name, f in batches_names.items():
+        wn.sources[name] = fingerprint(f, content_hash(f))
+    for name in deleted:
+        wn.sources.pop(name, None)
+    return list(batches_names) + deleted_names
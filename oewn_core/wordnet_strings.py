@@ -0,0 +1,166 @@
+"""
+WordNet identifier string interning
+
+Identifiers (synset ids, sense ids, lemmas, relation targets, ...) are repeated many times across the model:
+Sense.synsetid, Relation.target, Synset.members, resolver keys. Loaders allocate a fresh copy for each occurrence.
+Interning makes each distinct identifier exist once per model: each load interns in a pool of its own, that is kept
+with the model (wn.strings) so that reloads and overlays intern in it too, and that is released with the model.
+Text (definitions, examples, usages) is not interned.
+
+Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
+"""
+
+#  Copyright (c) 2024.
+#  Creative Commons 4 for original code
+#  GPL3 for rewrite
+
+import sys
+from typing import Dict, List, Optional
+
+from oewn_core.wordnet import WordnetModel, Entry, Sense, Synset, InternedSenseRelation, InternedSynsetRelation
+
+
+class StringPool:
+    """
+    Interning of identifier strings, with statistics.
+    Strings are interned in the pool's own table, so that pools (and their statistics) are independent.
+    """
+
+    def __init__(self) -> None:
+        self.table: Dict[str, str] = {}
+        self.requests: int = 0
+        self.hits: int = 0
+        self.saved: int = 0
+
+    def __str__(self) -> str:
+        return f'{len(self.table)} distinct strings, {self.hits} duplicates out of {self.requests} interned strings, {self.saved:,} bytes saved'
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def __call__(self, s: Optional[str]) -> Optional[str]:
+        """
+        Intern string
+        :param s: string
+        :return: interned string, s if s is not a plain string
+        """
+        if type(s) is not str:
+            return s
+        self.requests += 1
+        i = self.table.setdefault(s, s)
+        if i is not s:
+            # s is a duplicate, that is released if not referenced elsewhere
+            self.hits += 1
+            self.saved += sys.getsizeof(s)
+        return i
+
+    def list(self, strings: Optional[List[str]]) -> Optional[List[str]]:
+        """
+        Intern strings
+        :param strings: list of strings
+        :return: list of interned strings
+        """
+        return [self(s) for s in strings] if strings is not None else None
+
+    def reset(self) -> None:
+        """ Reset statistics, interned strings are kept """
+        self.requests = 0
+        self.hits = 0
+        self.saved = 0
+
+    # M O D E L   O B J E C T S
+
+    def intern_entry(self, entry: Entry) -> Entry:
+        """
+        Intern entry's identifier strings in place (senses excepted)
+        :param entry: entry
+        :return: entry
+        """
+        entry.lemma = self(entry.lemma)
+        entry.pos = self(entry.pos)
+        entry.discriminant = self(entry.discriminant)
+        entry.forms = self.list(entry.forms)
+        for p in entry.pronunciations:
+            p.variety = self(p.variety)
+        return entry
+
+    def intern_sense(self, sense: Sense, relations: bool = True) -> Sense:
+        """
+        Intern sense's identifier strings in place
+        :param sense: sense
+        :param relations: whether to intern relations' strings
+        :return: sense
+        """
+        sense.id = self(sense.id)
+        sense.synsetid = self(sense.synsetid)
+        sense.adjposition = self(sense.adjposition)
+        sense.verbframeids = self.list(sense.verbframeids)
+        if relations:
+            for r in sense.relations:
+                self.intern_relation(r)
+        return sense
+
+    def intern_synset(self, synset: Synset, relations: bool = True) -> Synset:
+        """
+        Intern synset's identifier strings in place
+        :param synset: synset
+        :param relations: whether to intern relations' strings
+        :return: synset
+        """
+        synset.id = self(synset.id)
+        synset.pos = self(synset.pos)
+        synset.members = self.list(synset.members)
+        synset.lex_name = self(synset.lex_name)
+        if relations:
+            for r in synset.relations:
+                self.intern_relation(r)
+        return synset
+
+    def intern_relation(self, r: Sense.Relation | Synset.Relation) -> None:
+        """
+        Intern relation's target and type in place
+        :param r: relation
+        """
+        if isinstance(r, (InternedSenseRelation, InternedSynsetRelation)):
+            # immutable but the values are unchanged, so are the key and hash
+            object.__setattr__(r, 'target', self(r.target))
+            object.__setattr__(r, 'relation_type', self(r.relation_type))
+        else:
+            r.target = self(r.target)
+            r.relation_type = self(r.relation_type)
+
+
+def intern_model(wn: WordnetModel, strings: Optional[StringPool] = None) -> StringPool:
+    """
+    Intern model's identifier strings in place, as needed when the model was not built with interning (e.g. unpickled).
+    Resolvers are rebuilt with interned keys. The pool is kept with the model (wn.strings).
+    :param wn: model
+    :param strings: string pool, None for the model's own pool (a new one if it has none)
+    :return: string pool
+    """
+    if strings is None:
+        strings = wn.strings if wn.strings is not None else StringPool()
+    wn.strings = strings
+    for e in wn.entries:
+        strings.intern_entry(e)
+        for s in e.senses:
+            strings.intern_sense(s, relations=wn.sense_graph is None)
+    for ss in wn.synsets:
+        strings.intern_synset(ss, relations=wn.synset_graph is None)
+    for f in wn.verbframes:
+        f.id = strings(f.id)
+    if wn.dense_ids is not None:
+        # graphs' nodes are the dense ids' maps
+        for m in (wn.dense_ids.synsets, wn.dense_ids.senses):
+            m.ids[:] = strings.list(m.ids)
+            m.rebuild_index()
+        m = wn.dense_ids.entries
+        m.ids[:] = [(strings(lemma), strings(pos), strings(discriminant)) for lemma, pos, discriminant in m.ids]
+        m.rebuild_index()
+
+    # relation tables and resolvers, keyed by interned strings
+    if wn.relation_table is not None:
+        wn.relation_table.sense_relations = {r.key: r for r in wn.relation_table.sense_relations.values()}
+        wn.relation_table.synset_relations = {r.key: r for r in wn.relation_table.synset_relations.values()}
+    wn.rebuild_indexes()
+    return strings
@@ -0,0 +1,119 @@
+"""
+WordNet lazy text store
+
+Synsets' text (definitions, examples, usages, ILI definition) makes up most of a model's bytes but graph-oriented
+jobs never read it. A text store holds it compressed, in blocks of consecutive synsets, and synsets hold a small
+handle to it instead (see LazyText), so that the store lives as long as the synsets whose text it holds. Text is
+decompressed and restored to its synset on first access (see Synset.fetch_text()).
+Pickling a synset fetches its text, so that pickles are the same whether text is stored or not.
+
+Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
+"""
+
+#  Copyright (c) 2024.
+#  Creative Commons 4 for original code
+#  GPL3 for rewrite
+
+import pickle
+import zlib
+from array import array
+from typing import Any, List, Optional, Tuple
+
+from oewn_core.wordnet import WordnetModel, LazyText
+
+Text = Tuple[List[str], List[Any], List[str], Optional[str]]
+""" Definitions, examples, usages, ILI definition """
+
+
+class TextStore:
+    """
+    Compressed store of synsets' text, in blocks
+    """
+
+    def __init__(self, block_size: int = 64) -> None:
+        self.block_size: int = block_size
+        self.blob: bytearray = bytearray()
+        self.offsets: array = array('Q', [0])  # block i spans blob[offsets[i]:offsets[i+1]]
+        self.count: int = 0
+        self.raw: int = 0  # uncompressed size
+        self._block: List[Text] = []  # block being filled
+        self._cached: Tuple[int, Optional[List[Text]]] = (-1, None)  # last decompressed block
+
+    def __str__(self) -> str:
+        return f'text store of {self.count} synsets in {len(self.offsets) - 1} blocks, {len(self.blob):,} bytes ({self.raw:,} uncompressed)'
+
+    def add(self, text: Text) -> LazyText:
+        """
+        Add text
+        :param text: text
+        :return: handle of text
+        """
+        i = self.count
+        self._block.append(text)
+        self.count += 1
+        if len(self._block) == self.block_size:
+            self.flush()
+        return LazyText(self, i)
+
+    def flush(self) -> None:
+        """ Compress block being filled """
+        if self._block:
+            data = pickle.dumps(self._block, protocol=pickle.HIGHEST_PROTOCOL)
+            self.raw += len(data)
+            self.blob += zlib.compress(data)
+            self.offsets.append(len(self.blob))
+            self._block = []
+
+    def get(self, i: int) -> Text:
+        """
+        Get text
+        :param i: index of text in store
+        :return: text
+        """
+        b, k = divmod(i, self.block_size)
+        if b == len(self.offsets) - 1:
+            return self._block[k]  # not flushed yet
+        cached_b, block = self._cached
+        if cached_b != b or block is None:
+            block = pickle.loads(zlib.decompress(self.blob[self.offsets[b]:self.offsets[b + 1]]))
+            self._cached = (b, block)
+        return block[k]
+
+    def release(self) -> None:
+        """ Free store, whose remaining text can no longer be fetched """
+        self.blob = bytearray()
+        self.offsets = array('Q', [0])
+        self._block = []
+        self._cached = (-1, None)
+
+
+def store_text(wn: WordnetModel, block_size: int = 64) -> TextStore:
+    """
+    Move synsets' text to a text store, text is fetched back on first access
+    :param wn: model
+    :param block_size: number of synsets per compressed block (larger blocks compress better but are slower to fetch)
+    :return: text store, held by the model
+    """
+    if wn.text_store is not None:
+        load_text(wn)
+    store = TextStore(block_size)
+    for ss in wn.synsets:
+        text = (ss.definitions, ss.examples, ss.usages, ss.ili_definition)
+        ss._text = store.add(text)
+        ss._definitions = ss._examples = ss._usages = ss._ili_definition = None
+    store.flush()
+    wn.text_store = store
+    return store
+
+
+def load_text(wn: WordnetModel) -> None:
+    """
+    Fetch all synsets' text back from the model's text store, which is released
+    :param wn: model
+    """
+    if wn.text_store is None:
+        return
+    for ss in wn.synsets:
+        ss.fetch_text()
+    wn.text_store.release()
+    wn.text_store = None
@@ -9,18 +9,28 @@ Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
 #  Creative Commons 4 for original code
 #  GPL3 for rewrite
 
-import codecs
-from typing import Dict, List, Any
+import os
+import shutil
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from typing import Dict, List, Any, Optional, TextIO, Tuple, Callable, Iterable, Generator, Set
 
 import yaml
 
-from oewn_core.wordnet import WordnetModel, Sense, Synset, Example, ignored_symmetric_sense_relations, ignored_symmetric_synset_relations
+from oewn_core.wordnet import WordnetModel, Entry, Sense, Synset, Example, ignored_symmetric_sense_relations, ignored_symmetric_synset_relations
+from oewn_core.wordnet_emitter import Unsupported, emit
 
 az = 'abcdefghijklmnopqrstuvwxyz'
 
 check_resolved = False
 """ Whether resolved_* members' resolution is checked, a no-op because these are not saved """
 
+fast_emitter = True
+""" Whether YAML is written by the fast schema emitter (see wordnet_emitter), whose output is the same as yaml.dump()'s """
+
+Record = Tuple[str, Dict[str, Any], List[List[Any]]]
+""" Top-level key, value, and the model's lists that value holds (that yaml.dump() would alias if they were shared) """
+
 
 def entry_to_yaml(entry, sense_resolver=None) -> Dict[str, Any]:
     """
@@ -140,12 +150,95 @@ def example_to_yaml(example: str | Example) -> Dict[str, str] | str:
     return example
 
 
-def save_entries(wn: WordnetModel, home: str) -> None:
+def dumps(y: Dict[str, Any], fast: Optional[bool] = None) -> str:
     """
-    Persist entries to YAML (entries-(0|a|...|z).yaml
+    Dump YAML to string, as yaml.dump(y, allow_unicode=True) does
+    :param y: top-level dictionary
+    :param fast: whether the fast emitter is used, None for fast_emitter
+    :return: YAML text
+    """
+    if fast is None:
+        fast = fast_emitter
+    if fast:
+        try:
+            return emit(y)
+        except Unsupported:
+            pass  # outside the emitter's schema
+    return yaml.dump(y, allow_unicode=True)
+
+
+def dump(y: Dict[str, Any], out: TextIO, fast: Optional[bool] = None) -> None:
+    """
+    Dump YAML, as yaml.dump(y, out, allow_unicode=True) does
+    :param y: top-level dictionary
+    :param out: output stream
+    :param fast: whether the fast emitter is used, None for fast_emitter
+    """
+    out.write(dumps(y, fast))
+
+
+def unchanged(f: str, data: bytes) -> bool:
+    """
+    Whether file already holds data
+    :param f: file
+    :param data: data
+    :return: whether file exists and its content is data
+    """
+    try:
+        if os.path.getsize(f) != len(data):
+            return False
+        with open(f, 'rb') as inp:
+            return inp.read() == data
+    except OSError:
+        return False
+
+
+def same_content(f1: str, f2: str, chunk: int = 1 << 16) -> bool:
+    """
+    Whether files have the same content
+    :param f1: file
+    :param f2: other file
+    :param chunk: size of chunks compared
+    :return: whether both files exist and have the same content
+    """
+    try:
+        if os.path.getsize(f1) != os.path.getsize(f2):
+            return False
+        with open(f1, 'rb') as inp1, open(f2, 'rb') as inp2:
+            while True:
+                b1 = inp1.read(chunk)
+                if b1 != inp2.read(chunk):
+                    return False
+                if not b1:
+                    return True
+    except OSError:
+        return False
+
+
+def write_atomically(f: str, data: bytes) -> None:
+    """
+    Write file through a temporary file that replaces it, so that readers never see a partly written file
+    :param f: file
+    :param data: data
+    """
+    tmp = f'{f}.{os.getpid()}.tmp'
+    try:
+        with open(tmp, 'wb') as out:
+            out.write(data)
+        if os.path.exists(f):
+            shutil.copymode(f, tmp)
+        os.replace(tmp, f)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def entries_to_yaml(wn: WordnetModel) -> Dict[str, Dict[str, Any]]:
+    """
+    Build dictionaries for entries YAML files
     :param wn: model
-    :param home: home dir for persist files
-    :return: None
+    :return: dictionaries, keyed by file initial (0|a|...|z)
     """
     sense_resolver = wn.sense_resolver if wn.sense_resolver else None
     entry_yaml = {c: {} for c in az}
@@ -169,22 +262,16 @@ def save_entries(wn: WordnetModel, home: str) -> None:
             raise ValueError(f'Duplicate entry: {entry.lemma}-{key}')
 
         entry_yaml[first][entry.lemma][key] = y
-
-    # save
-    for c in az:
-        with codecs.open(f'{home}/entries-%s.yaml' % c, 'w', 'utf-8') as out:
-            yaml.dump(entry_yaml[c], out, allow_unicode=True)
-    with codecs.open(f'{home}/entries-0.yaml', 'w', 'utf-8') as out:
-        yaml.dump(entry_yaml['0'], out, allow_unicode=True)
+    return entry_yaml
 
 
-def save_synsets(wn: WordnetModel, home: str) -> None:
+def synsets_to_yaml(wn: WordnetModel) -> Dict[str, Dict[str, Any]]:
     """
-    Persist synsets to YAML (noun|verb|adj|adv)*.yaml
+    Build dictionaries for synsets YAML files
     :param wn: model
-    :param home: home dir for persist files
+    :return: dictionaries, keyed by lexical name
     """
-    synset_yaml = {}
+    synset_yaml: Dict[str, Dict[str, Any]] = {}
     for synset in wn.synsets:
         # build
         y = synset_to_yaml(synset, synset_resolver=wn.synset_resolver, member_resolver=wn.member_resolver)
@@ -197,32 +284,266 @@ def save_synsets(wn: WordnetModel, home: str) -> None:
         if synset.id in synset_yaml[synset.lex_name]:
             raise ValueError(f'Duplicate synset: {synset.id} in {synset.lex_name}')
         synset_yaml[synset.lex_name][synset.id] = y
+    return synset_yaml
+
+
+def verbframes_to_yaml(wn: WordnetModel) -> Dict[str, str]:
+    """
+    Build dictionary for verb frames YAML file
+    :param wn: model
+    :return: dictionary
+    """
+    return {b.id: b.verbframe for b in wn.verbframes}
+
+
+def save_file(f: str, y: Dict[str, Any], fast: Optional[bool] = None, incremental: bool = True) -> bool:
+    """
+    Persist one YAML file, atomically
+    :param f: file
+    :param y: top-level dictionary
+    :param fast: whether the fast emitter is used, None for fast_emitter
+    :param incremental: whether the file is left untouched if it already holds the same content
+    :return: whether the file was written
+    """
+    data = dumps(y, fast).encode('utf-8')
+    if incremental and unchanged(f, data):
+        return False
+    write_atomically(f, data)
+    return True
+
+
+def save_files(files: List[Tuple[str, Dict[str, Any]]], executor: Optional[Executor] = None, incremental: bool = True) -> List[str]:
+    """
+    Persist YAML files
+    :param files: files and their top-level dictionaries
+    :param executor: if not None, process pool that files are emitted and written in, largest first
+    :param incremental: whether files that already hold the same content are left untouched
+    :return: written files
+    """
+    if executor is None:
+        return [f for f, y in files if save_file(f, y, incremental=incremental)]
+    # the emitter flag is passed along, as worker processes may not share the module's state
+    files = sorted(files, key=lambda fy: len(fy[1]), reverse=True)
+    written = executor.map(partial(save_file, fast=fast_emitter, incremental=incremental), [f for f, _ in files], [y for _, y in files])
+    return [f for (f, _), w in zip(files, written) if w]
+
+
+def save_entries(wn: WordnetModel, home: str, executor: Optional[Executor] = None, incremental: bool = True) -> List[str]:
+    """
+    Persist entries to YAML (entries-(0|a|...|z).yaml
+    :param wn: model
+    :param home: home dir for persist files
+    :param executor: if not None, process pool that files are emitted and written in
+    :param incremental: whether files that already hold the same content are left untouched
+    :return: written files
+    """
+    entry_yaml = entries_to_yaml(wn)
+    return save_files([(f'{home}/entries-%s.yaml' % c, entry_yaml[c]) for c in list(az) + ['0']], executor, incremental)
+
 
-    # save
-    for key, synsets in synset_yaml.items():
-        with codecs.open(f'{home}/%s.yaml' % key, 'w', 'utf-8') as out:
-            yaml.dump(synsets, out, allow_unicode=True)
+def save_synsets(wn: WordnetModel, home: str, executor: Optional[Executor] = None, incremental: bool = True) -> List[str]:
+    """
+    Persist synsets to YAML (noun|verb|adj|adv)*.yaml
+    :param wn: model
+    :param home: home dir for persist files
+    :param executor: if not None, process pool that files are emitted and written in
+    :param incremental: whether files that already hold the same content are left untouched
+    :return: written files
+    """
+    return save_files([(f'{home}/%s.yaml' % key, synsets) for key, synsets in synsets_to_yaml(wn).items()], executor, incremental)
+
+
+def entries_by_file(wn: WordnetModel) -> Dict[str, Dict[str, List[Entry]]]:
+    """
+    Group entries by file and lemma, without building their YAML
+    :param wn: model
+    :return: entries, keyed by file initial (0|a|...|z) and lemma
+    """
+    entries: Dict[str, Dict[str, List[Entry]]] = {c: {} for c in az}
+    entries['0'] = {}
+    for entry in wn.entries:
+        first = entry.lemma.lower()[:1]
+        if first not in az:
+            first = '0'
+        entries[first].setdefault(entry.lemma, []).append(entry)
+    return entries
+
+
+def entry_records(lemmas: Dict[str, List[Entry]], sense_resolver=None) -> Generator[Record, None, None]:
+    """
+    Lemma records of one entries file, in key order, built one at a time
+    :param lemmas: entries, keyed by lemma
+    :param sense_resolver: if not None, sense resolution will be attempted
+    :return: generator of records
+    """
+    for lemma in sorted(lemmas):
+        y: Dict[str, Any] = {}
+        lists: List[List[Any]] = []
+        for entry in lemmas[lemma]:
+            key = f'{entry.pos}-{entry.discriminant}' if entry.discriminant else entry.pos
+            if key in y:
+                raise ValueError(f'Duplicate entry: {entry.lemma}-{key}')
+            y[key] = entry_to_yaml(entry, sense_resolver=sense_resolver)
+            lists.append(entry.forms)
+            for s in entry.senses:
+                lists.append(s.verbframeids)
+                lists.append(s.examples)
+        yield lemma, y, lists
+
+
+def synsets_by_file(wn: WordnetModel) -> Dict[str, List[Synset]]:
+    """
+    Group synsets by file, in id order, without building their YAML
+    :param wn: model
+    :return: synsets, keyed by lexical name
+    """
+    synsets: Dict[str, List[Synset]] = {}
+    for synset in wn.synsets:
+        synsets.setdefault(synset.lex_name, []).append(synset)
+    for lex_name, lex_synsets in synsets.items():
+        lex_synsets.sort(key=lambda ss: ss.id)
+        for ss1, ss2 in zip(lex_synsets, lex_synsets[1:]):
+            if ss1.id == ss2.id:
+                raise ValueError(f'Duplicate synset: {ss2.id} in {lex_name}')
+    return synsets
+
+
+def synset_records(synsets: List[Synset], synset_resolver=None, member_resolver=None) -> Generator[Record, None, None]:
+    """
+    Synset records of one synsets file, in key order, built one at a time
+    :param synsets: synsets, in id order
+    :param synset_resolver: if not None, synset resolution will be attempted and checked
+    :param member_resolver: if not None, member resolution will be attempted and checked
+    :return: generator of records
+    """
+    for synset in synsets:
+        yield synset.id, synset_to_yaml(synset, synset_resolver=synset_resolver, member_resolver=member_resolver), [synset.members, synset.definitions, synset.usages]
+
+
+def stream_records(records: Iterable[Record], out) -> None:
+    """
+    Write records, one at a time, as yaml.dump() would write the mapping of all records
+    :param records: records, in key order
+    :param out: binary output stream
+    :raises: Unsupported if records share lists, yaml.dump() would then alias them across records
+    """
+    seen: Set[int] = set()
+    empty = True
+    for key, y, lists in records:
+        for lst in lists:
+            if lst:
+                if id(lst) in seen:
+                    raise Unsupported('shared list')
+                seen.add(id(lst))
+        # the mapping of all records is dumped as the concatenation of single-record mappings
+        out.write(dumps({key: y}).encode('utf-8'))
+        empty = False
+    if empty:
+        out.write(dumps({}).encode('utf-8'))
+
+
+def stream_file(f: str, records: Callable[[], Iterable[Record]], incremental: bool = True) -> bool:
+    """
+    Persist one YAML file, atomically, one record at a time, so that the file's YAML is never held whole
+    :param f: file
+    :param records: records factory, called again to dump all records at once should they share lists
+    :param incremental: whether the file is left untouched if it already holds the same content
+    :return: whether the file was written
+    """
+    tmp = f'{f}.{os.getpid()}.tmp'
+    try:
+        try:
+            with open(tmp, 'wb') as out:
+                stream_records(records(), out)
+        except Unsupported:
+            with open(tmp, 'wb') as out:
+                out.write(dumps({key: y for key, y, _ in records()}).encode('utf-8'))
+        if incremental and same_content(tmp, f):
+            os.remove(tmp)
+            return False
+        if os.path.exists(f):
+            shutil.copymode(f, tmp)
+        os.replace(tmp, f)
+        return True
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def stream_entries(wn: WordnetModel, home: str, incremental: bool = True) -> List[str]:
+    """
+    Persist entries to YAML (entries-(0|a|...|z).yaml, one lemma at a time
+    :param wn: model
+    :param home: home dir for persist files
+    :param incremental: whether files that already hold the same content are left untouched
+    :return: written files
+    """
+    sense_resolver = wn.sense_resolver if wn.sense_resolver else None
+    written = []
+    for c, lemmas in entries_by_file(wn).items():
+        f = f'{home}/entries-%s.yaml' % c
+        if stream_file(f, partial(entry_records, lemmas, sense_resolver), incremental):
+            written.append(f)
+    return written
+
+
+def stream_synsets(wn: WordnetModel, home: str, incremental: bool = True) -> List[str]:
+    """
+    Persist synsets to YAML (noun|verb|adj|adv)*.yaml, one synset at a time
+    :param wn: model
+    :param home: home dir for persist files
+    :param incremental: whether files that already hold the same content are left untouched
+    :return: written files
+    """
+    written = []
+    for key, synsets in synsets_by_file(wn).items():
+        f = f'{home}/%s.yaml' % key
+        if stream_file(f, partial(synset_records, synsets, wn.synset_resolver, wn.member_resolver), incremental):
+            written.append(f)
+    return written
 
 
-def save_verbframes(wn: WordnetModel, home: str) -> None:
+def save_verbframes(wn: WordnetModel, home: str, incremental: bool = True) -> List[str]:
     """
     Persist verb frames to YAML frame.yaml
     :param wn: model
     :param home: home dir for persist file
+    :param incremental: whether the file is left untouched if it already holds the same content
+    :return: written files
      """
-    frame_yaml = {b.id: b.verbframe for b in wn.verbframes}
-    with open(f'{home}/frames.yaml', 'w', encoding='utf-8') as out:
-        yaml.dump(frame_yaml, out, allow_unicode=True)
+    return save_files([(f'{home}/frames.yaml', verbframes_to_yaml(wn))], incremental=incremental)
 
 
-def save(wn: WordnetModel, home: str) -> None:
+def save(wn: WordnetModel, home: str, jobs: int = 1, incremental: bool = True, stream: bool = False) -> List[str]:
     """
     Persist model to YAML *.yaml
+    Files are written atomically (through a temporary file that replaces them), those that already hold the same content
+    are left untouched, unless incremental is False.
     :param wn: model
     :param home: home dir for persist files
+    :param jobs: number of processes that files are emitted and written in, the files are the same as when written by one
+    :param incremental: whether files that already hold the same content are left untouched
+    :param stream: whether files are written one record (lemma or synset) at a time (lower peak memory), the files are the same
+    :return: written files
+    :raises: ValueError if streaming is asked for with more than one job, as streamed files are written by one process
     """
+    if stream and jobs > 1:
+        raise ValueError('Streamed files are written by one process')
     print(f'saving to YAML {home}')
-    save_entries(wn, home)
-    save_synsets(wn, home)
-    save_verbframes(wn, home)
-    print(f'saved to YAML {home}')
+    if stream:
+        written = stream_entries(wn, home, incremental)
+        written += stream_synsets(wn, home, incremental)
+        written += save_verbframes(wn, home, incremental)
+        print(f'saved to YAML {home}, {len(written)} files written')
+        return written
+    executor = ProcessPoolExecutor(jobs) if jobs > 1 else None
+    try:
+        written = save_entries(wn, home, executor, incremental)
+        written += save_synsets(wn, home, executor, incremental)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    written += save_verbframes(wn, home, incremental)
+    print(f'saved to YAML {home}, {len(written)} files written')
+    return written
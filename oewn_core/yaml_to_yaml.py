@@ -26,12 +26,16 @@ def main() -> None:
     Will have a normalizing effect, after which it's not modified
     """
     arg_parser = argparse.ArgumentParser(description="load from yaml and save")
+    arg_parser.add_argument('--jobs', type=int, default=1, help='number of processes that files are parsed and written in')
+    arg_parser.add_argument('--stream', action='store_true', default=False, help='stream files one record at a time')
+    arg_parser.add_argument('--stream-save', action='store_true', default=False, help='write files one record at a time, in one process')
+    arg_parser.add_argument('--force', action='store_true', default=False, help='rewrite files that are unchanged')
     arg_parser.add_argument('in_dir', type=str, help='from-dir')
     arg_parser.add_argument('out_dir', type=str, help='to-dir')
     args = arg_parser.parse_args()
 
-    wn = load(args.in_dir)
-    save(wn, args.out_dir)
+    wn = load(args.in_dir, jobs=args.jobs, stream=args.stream)
+    save(wn, args.out_dir, jobs=1 if args.stream_save else args.jobs, incremental=not args.force, stream=args.stream_save)
 
 
 if __name__ == '__main__':
@@ -14,7 +14,7 @@ import argparse
 import re
 import sys
 from collections import Counter
-from typing import Dict, Pattern, Tuple
+from typing import Dict, Pattern, Set, Tuple
 
 from oewn_core.wordnet import Entry, Synset, Sense, PartOfSpeech, WordnetModel
 
@@ -169,13 +169,12 @@ def extract_lex_id(sense_key: str) -> int:
 
 def get_head_word(wn: WordnetModel, sense: Sense) -> Tuple[str, str] | None:
     synset = wn.synset_resolver[sense.synsetid]
-    similars = [r for r in synset.relations if
-                Synset.Relation.Type(r.relation_type) == Synset.Relation.Type.SIMILAR and
+    similars = [t for t in wn.outgoing(synset.id, Synset.Relation.Type.SIMILAR) if
                 # ignore satellites in non-Princeton sets
-                not r.target.startswith("9") and
-                not r.target.startswith("8")]
+                not t.startswith("9") and
+                not t.startswith("8")]
     if len(similars) == 1:
-        target_id = similars[0].target
+        target_id = similars[0]
         target = wn.synset_resolver[target_id]
         target_entry = wn.member_resolver[(target.members[0], target.id)]
         target_sense = next((s for s in target_entry.senses if s.synsetid == target_id), None)
@@ -249,19 +248,13 @@ def check_symmetry(wn: WordnetModel) -> None:
 
 
 def check_transitive_synset(wn: WordnetModel, synset: Synset) -> None:
-    for r1 in synset.relations:
-        t1 = Synset.Relation.Type(r1.relation_type)
-        if t1 == Synset.Relation.Type.HYPERNYM:
-            synset2 = wn.synset_resolver[r1.target]
-            for r2 in synset2.relations:
-                t2 = Synset.Relation.Type(r2.relation_type)
-                if t2 == Synset.Relation.Type.HYPERNYM:
-                    if any(r for r in synset.relations if
-                           r.target == r2.target and Synset.Relation.Type(r.relation_type) == Synset.Relation.Type.HYPERNYM):
-                        trans = next(r for r in synset.relations if
-                                     r.target == r2.target and
-                                     Synset.Relation.Type(r.relation_type) == Synset.Relation.Type.HYPERNYM)
-                        warn(f'Transitive error for {synset.id} => {synset2.id} => {r2.target} with {synset.id} => {trans.target}')
+    # relations are scanned on both sides, not read from the adjacency index, which is not rebuilt when relations change
+    hypernyms = [r.target for r in synset.relations if r.relation_type == Synset.Relation.Type.HYPERNYM]
+    for synset2_id in hypernyms:
+        synset2 = wn.synset_resolver[synset2_id]
+        for target2 in (r.target for r in synset2.relations if r.relation_type == Synset.Relation.Type.HYPERNYM):
+            if target2 in hypernyms:
+                warn(f'Transitive error for {synset.id} => {synset2.id} => {target2} with {synset.id} => {target2}')
 
 
 def check_transitive(wn: WordnetModel) -> None:
@@ -269,7 +262,17 @@ def check_transitive(wn: WordnetModel) -> None:
         check_transitive_synset(wn, synset)
 
 
+def check_no_loops_in_graph(wn: WordnetModel, relation_types: Set[Synset.Relation.Type], message: str) -> None:
+    graph = wn.synset_graph
+    codes = {graph.type_codes[t] for t in relation_types}
+    for i in graph.find_loops(codes):
+        warn(f'{message} for {graph.ids[i]}')
+
+
 def check_no_loops(wn: WordnetModel) -> None:
+    if wn.synset_graph is not None:
+        check_no_loops_in_graph(wn, {Synset.Relation.Type.HYPERNYM}, 'Loop')
+        return
     hypernyms = {}
     for synset in wn.synsets:
         hypernyms[synset.id] = set()
@@ -290,6 +293,9 @@ def check_no_loops(wn: WordnetModel) -> None:
 
 
 def check_no_domain_loops(wn: WordnetModel) -> None:
+    if wn.synset_graph is not None:
+        check_no_loops_in_graph(wn, {Synset.Relation.Type.DOMAIN_TOPIC, Synset.Relation.Type.DOMAIN_REGION, Synset.Relation.Type.EXEMPLIFIES}, 'Domain loop')
+        return
     domains = {}
     for synset in wn.synsets:
         domains[synset.id] = set()
@@ -468,18 +474,17 @@ def check_instances(wn: WordnetModel) -> None:
     def collect_instances():
         result = set()
         for ss in wn.synsets:
-            if any(Synset.Relation.Type(r2.relation_type) == Synset.Relation.Type.INSTANCE_HYPERNYM for r2 in ss.relations):
-                if any(Synset.Relation.Type(r3.relation_type) == Synset.Relation.Type.HYPERNYM for r3 in ss.relations):
+            if wn.outgoing(ss.id, Synset.Relation.Type.INSTANCE_HYPERNYM):
+                if wn.hypernyms(ss.id):
                     warn(f'Synset {ss.id} has both hypernym and instance hypernym')
                 result.add(ss.id)
         return result
 
     instances = collect_instances()
     for synset in wn.synsets:
-        for r in synset.relations:
-            if Synset.Relation.Type(r.relation_type) == Synset.Relation.Type.HYPERNYM:
-                if r.target in instances:
-                    warn(f'Hypernym targets instance {synset.id} => {r.target}')
+        for target in wn.hypernyms(synset.id):
+            if target in instances:
+                warn(f'Hypernym targets instance {synset.id} => {target}')
 
 
 def check_ili(synset: Synset) -> None:
@@ -21,7 +21,9 @@ from typing import Optional, List, Dict, Tuple
 from xml.sax import parse
 from xml.sax.handler import ContentHandler
 
-from oewn_core.wordnet import WordnetModel, Entry, Sense, Synset, PartOfSpeech, Pronunciation, Example, VerbFrame
+from oewn_core.wordnet import WordnetModel, Entry, Sense, Synset, PartOfSpeech, Pronunciation, Example, VerbFrame, RelationTable
+from oewn_core.wordnet_metrics import LoadMetrics, phase
+from oewn_core.wordnet_strings import StringPool
 from oewn_xml.wordnet_xml import from_xml_synset_id, from_xml_sense_id
 
 
@@ -47,9 +49,15 @@ class SAXParser(ContentHandler):
     SAX parser
     """
 
-    def __init__(self) -> None:
+    def __init__(self, table: Optional[RelationTable] = None, strings: Optional[StringPool] = None) -> None:
         ContentHandler.__init__(self)
 
+        # relation interning
+        self.table: Optional[RelationTable] = table
+
+        # string interning
+        self.strings: Optional[StringPool] = strings
+
         # local data
         self.lexicon: Optional[WordnetModel] = None
         self.entry: Optional[Entry] = None
@@ -101,6 +109,9 @@ class SAXParser(ContentHandler):
         elif name == 'Lemma':
             self.entry.lemma = attrs['writtenForm']
             self.entry.pos = attrs['partOfSpeech']
+            if self.strings is not None:
+                self.entry.lemma = self.strings(self.entry.lemma)
+                self.entry.pos = self.strings(self.entry.pos)
         elif name == 'Form':
             self.entry.forms.append(attrs['writtenForm'])
         elif name == 'Definition':
@@ -114,16 +125,21 @@ class SAXParser(ContentHandler):
             self.example = ''
         elif name == 'SynsetRelation':
             target = make_synset_id(attrs['target'])
+            if self.strings is not None:
+                target = self.strings(target)
             rtype = attrs['relType']
-            self.synset.relations.append(Synset.Relation(target, Synset.Relation.Type(rtype).value))
+            t = Synset.Relation.Type(rtype).value
+            self.synset.relations.append(self.table.synset_relation(target, t) if self.table is not None else Synset.Relation(target, t))
         elif name == 'SenseRelation':
             target = make_sense_id(attrs['target'])
+            if self.strings is not None:
+                target = self.strings(target)
             rtype = attrs['relType']
             is_other = rtype == Sense.Relation.Type.OTHER.value
             rtype2 = Sense.Relation.OtherType(attrs['dc:type']).value if is_other else Sense.Relation.Type(rtype).value
-            self.sense.relations.append(Sense.Relation(target, rtype2, is_other))
+            self.sense.relations.append(self.table.sense_relation(target, rtype2, is_other) if self.table is not None else Sense.Relation(target, rtype2, is_other))
         elif name == 'SyntacticBehaviour':
-            self.verbframes.append(VerbFrame(attrs['id'], attrs['subcategorizationFrame']))
+            self.verbframes.append(VerbFrame(self.strings(attrs['id']) if self.strings is not None else attrs['id'], attrs['subcategorizationFrame']))
         elif name == 'Pronunciation':
             self.pronunciation = ''
             self.pronunciation_variety = attrs.get('variety')
@@ -143,10 +159,14 @@ class SAXParser(ContentHandler):
 
     def endElement(self, name) -> None:
         if name == 'LexicalEntry':
+            if self.strings is not None:
+                self.strings.intern_entry(self.entry)
             self.entries.append(self.entry)
             self.entry = None
         elif name == 'Sense':
             assert self.entry
+            if self.strings is not None:
+                self.strings.intern_sense(self.sense, relations=False)
             self.entry.senses.append(self.sense)
             if self.sense.id in self.sense_resolver:
                 raise ValueError(f'Duplicate sense ID while parsing: {self.sense.id}')
@@ -157,6 +177,8 @@ class SAXParser(ContentHandler):
             self.member_resolver[mk] = self.entry
             self.sense = None
         elif name == 'Synset':
+            if self.strings is not None:
+                self.strings.intern_synset(self.synset, relations=False)
             self.synsets.append(self.synset)
             if self.synset.id in self.member_resolver:
                 raise ValueError(f'Duplicate synset ID while parsing: {self.synset.id}')
@@ -211,36 +233,50 @@ class SAXParser(ContentHandler):
         wn.sense_resolver = self.sense_resolver
         wn.synset_resolver = self.synset_resolver
         wn.member_resolver = self.member_resolver
+        wn.relation_table = self.table
+        wn.strings = self.strings
         return wn
 
 
-def load_core(wordnet_file) -> WordnetModel:
+def load_core(wordnet_file, intern: bool = False, intern_strings: bool = False) -> WordnetModel:
     with codecs.open(wordnet_file, encoding='utf-8') as source:
-        sax_parser = SAXParser()
+        sax_parser = SAXParser(RelationTable() if intern else None, StringPool() if intern_strings else None)
         parse(source, sax_parser)
         return sax_parser.get_parsed()
 
 
-def load(home: str, extend: bool = True, resolve: bool = False, verbose: bool = False) -> WordnetModel:
+def load(home: str, extend: bool = True, resolve: bool = False, verbose: bool = False, intern: bool = False, virtual: bool = False, intern_strings: bool = False,
+         metrics: Optional[LoadMetrics] = None) -> WordnetModel:
     if verbose:
         print(f'loading from XML in {home}')
-    wn: WordnetModel = load_core(home)
+    with phase(metrics, 'parse'):
+        start = time.perf_counter()
+        wn: WordnetModel = load_core(home, intern=intern, intern_strings=intern_strings)
+        if metrics is not None:
+            metrics.add_file(home, time.perf_counter() - start, len(wn.entries) + len(wn.synsets) + len(wn.verbframes))
     if verbose:
         print(f'loaded {wn} from XML in {home}')
+        if intern_strings:
+            print(f'interned strings: {wn.strings}')
     if extend:
         if verbose:
             print(f'extending relations')
             print(f'before extension: {wn.info_relations()}')
-        wn.extend()
+        with phase(metrics, 'extend'):
+            wn.extend(virtual=virtual)
         if verbose:
             print(f'after extension:  {wn.info_relations()}')
             print(f'extended relations')
     if resolve:
         if verbose:
             print(f'resolving cross-references')
-        wn.resolve()
+        with phase(metrics, 'resolve'):
+            wn.resolve()
         if verbose:
             print(f'resolved cross-references')
+    if metrics is not None:
+        metrics.count(wn)
+        wn.metrics = metrics
     if verbose:
         print(wn)
         print(wn.info())
@@ -250,9 +286,15 @@ def load(home: str, extend: bool = True, resolve: bool = False, verbose: bool =
 
 def main() -> WordnetModel:
     arg_parser = argparse.ArgumentParser(description="load from yaml")
+    arg_parser.add_argument('--metrics', type=str, default=None, help='save load metrics to this JSON file')
+    arg_parser.add_argument('--trace-memory', action='store_true', default=False, help='record memory peaks in load metrics (slower)')
     arg_parser.add_argument('in_dir', type=str, help='from-dir')
     args = arg_parser.parse_args()
-    return load(args.in_dir)
+    metrics = LoadMetrics('xml', args.in_dir, memory=args.trace_memory) if args.metrics else None
+    wn = load(args.in_dir, metrics=metrics)
+    if metrics is not None:
+        metrics.save(args.metrics)
+    return wn
 
 
 if __name__ == '__main__':
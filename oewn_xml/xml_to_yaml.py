@@ -20,17 +20,20 @@ from oewn_core.wordnet_toyaml import save
 from oewn_xml.wordnet_fromxml import load
 
 
-def xml1_to_yaml(in_file, out_dir) -> None:
+def xml1_to_yaml(in_file, out_dir, jobs: int = 1, incremental: bool = True, stream: bool = False) -> None:
     wn = load(in_file)
-    save(wn, out_dir)
+    save(wn, out_dir, jobs=jobs, incremental=incremental, stream=stream)
 
 
 def main() -> None:
     arg_parser = argparse.ArgumentParser(description="load from xml and save to yaml")
+    arg_parser.add_argument('--jobs', type=int, default=1, help='number of processes that files are written in')
+    arg_parser.add_argument('--stream', action='store_true', default=False, help='write files one record at a time, in one process')
+    arg_parser.add_argument('--force', action='store_true', default=False, help='rewrite files that are unchanged')
     arg_parser.add_argument('in_file', type=str, help='from-file')
     arg_parser.add_argument('out_dir', type=str, help='to-dir')
     args = arg_parser.parse_args()
-    xml1_to_yaml(args.in_file, args.out_dir)
+    xml1_to_yaml(args.in_file, args.out_dir, jobs=args.jobs, incremental=not args.force, stream=args.stream)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,62 @@
+"""
+WordNet model adjacency index tests
+Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
+"""
+#  Copyright (c) 2024.
+#  Creative Commons 4 for original code
+#  GPL3 for rewrite
+
+import unittest
+
+from oewn_core.deserialize import load
+from oewn_core.wordnet import Synset
+from tests.model import data_home
+
+
+class AdjacencyTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.wn = load(data_home, extend=False)
+
+    def test_outgoing(self) -> None:
+        for ss in self.wn.synsets:
+            for t in {r.relation_type for r in ss.relations}:
+                expected = [r.target for r in ss.relations if r.relation_type == t]
+                self.assertEqual(list(self.wn.outgoing(ss.id, t)), expected)
+            self.assertEqual(list(self.wn.hypernyms(ss.id)), [r.target for r in ss.relations if r.relation_type == Synset.Relation.Type.HYPERNYM])
+
+    def test_incoming(self) -> None:
+        for ss in self.wn.synsets:
+            for h in self.wn.hypernyms(ss.id):
+                self.assertIn(ss.id, self.wn.hyponyms(h))
+                self.assertIn(ss.id, self.wn.incoming(h, 'hypernym'))
+
+    def test_sense(self) -> None:
+        for s in self.wn.senses:
+            for r in s.relations:
+                self.assertIn(r.target, self.wn.outgoing(s.id, r.relation_type))
+                self.assertIn(s.id, self.wn.incoming(r.target, r.relation_type))
+
+    def test_none(self) -> None:
+        ss = self.wn.synsets[0]
+        self.assertEqual(len(self.wn.outgoing(ss.id, 'zzzz')), 0)
+        self.assertEqual(len(self.wn.incoming('zzzz', 'hypernym')), 0)
+
+    def test_hyponyms_after_extend(self) -> None:
+        hyponyms = {ss.id: sorted(self.wn.hyponyms(ss.id)) for ss in self.wn.synsets}
+        self.wn.extend()
+        for ss in self.wn.synsets:
+            self.assertEqual(sorted(self.wn.hyponyms(ss.id)), hyponyms[ss.id])
+            self.assertEqual(sorted(self.wn.outgoing(ss.id, Synset.Relation.Type.HYPONYM)), hyponyms[ss.id])
+
+    def test_invalidate(self) -> None:
+        ss1, ss2 = self.wn.synsets[0], self.wn.synsets[1]
+        _ = self.wn.synset_adjacency
+        ss1.relations.append(Synset.Relation(ss2.id, Synset.Relation.Type.HYPERNYM))
+        self.wn.invalidate_adjacency()
+        self.assertIn(ss2.id, self.wn.hypernyms(ss1.id))
+        self.assertIn(ss1.id, self.wn.hyponyms(ss2.id))
+
+
+if __name__ == '__main__':
+    unittest.main()
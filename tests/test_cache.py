@@ -0,0 +1,58 @@
+"""
+WordNet per-file parsed YAML cache tests
+Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
+"""
+#  Copyright (c) 2024.
+#  Creative Commons 4 for original code
+#  GPL3 for rewrite
+
+import os
+import unittest
+from glob import glob
+
+from oewn_core.wordnet_cache import default_cache_dir, cache_file
+from oewn_core.wordnet_fromyaml import load
+from tests.utils import YamlHomeTestCase, dump_model
+
+
+class CacheTestCase(YamlHomeTestCase):
+    per_test = True
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.cache = default_cache_dir(self.home)
+
+    def test_cache(self) -> None:
+        wn = load(self.home, extend=False)
+        wn1 = load(self.home, extend=False, cache=self.cache)
+        files = glob(f'{self.home}/*.yaml')
+        yaml_files = [f for f in files if not f.endswith('frames.yaml')]
+        for f in yaml_files:
+            self.assertTrue(os.path.exists(cache_file(f, self.cache)))
+        wn2 = load(self.home, extend=False, cache=self.cache)
+        self.assertEqual(dump_model(wn), dump_model(wn1))
+        self.assertEqual(dump_model(wn), dump_model(wn2))
+
+    def test_changed(self) -> None:
+        load(self.home, extend=False, cache=self.cache)
+        changed = glob(f'{self.home}/noun*.yaml')[0]
+        unchanged = glob(f'{self.home}/entries-*.yaml')[0]
+        mtime = os.stat(cache_file(unchanged, self.cache)).st_mtime_ns
+        with open(changed, 'a', encoding='utf-8') as out:
+            out.write('99999999-n:\n  definition:\n  - changed\n  members: []\n  partOfSpeech: n\n')
+        wn = load(self.home, extend=False, cache=self.cache)
+        self.assertEqual(dump_model(load(self.home, extend=False)), dump_model(wn))
+        self.assertEqual(wn.synset_resolver['99999999-n'].definitions, ['changed'])
+        self.assertEqual(mtime, os.stat(cache_file(unchanged, self.cache)).st_mtime_ns)
+
+    def test_interned(self) -> None:
+        load(self.home, extend=False, cache=self.cache)
+        wn = load(self.home, extend=False, cache=self.cache, intern=True, intern_strings=True)
+        self.assertEqual(dump_model(load(self.home, extend=False)), dump_model(wn))
+        for ss in wn.synsets:
+            for r in ss.relations:
+                self.assertIs(r, wn.relation_table.synset_relation(r.target, r.relation_type))
+
+
+if __name__ == '__main__':
+    unittest.main()
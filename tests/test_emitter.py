@@ -0,0 +1,53 @@
+"""
+WordNet fast YAML emitter tests
+Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
+"""
+#  Copyright (c) 2024.
+#  Creative Commons 4 for original code
+#  GPL3 for rewrite
+
+import io
+import unittest
+
+import yaml
+
+from oewn_core.deserialize import load
+from oewn_core.wordnet_emitter import Unsupported, emit
+from oewn_core.wordnet_toyaml import dump, entries_to_yaml, synsets_to_yaml, verbframes_to_yaml
+from tests.model import data_home
+
+
+class EmitterTestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        wn = load(data_home, extend=False)
+        cls.docs = {**{f'entries-{c}': y for c, y in entries_to_yaml(wn).items()}, **synsets_to_yaml(wn), 'frames': verbframes_to_yaml(wn)}
+
+    def test_conformance(self) -> None:
+        for name, y in self.docs.items():
+            with self.subTest(name):
+                self.assertEqual(yaml.dump(y, allow_unicode=True), emit(y))
+
+    def test_scalars(self) -> None:
+        long = 'lorem ipsum dolor sit amet ' * 5
+        for s in ('yes', 'null', '3.14', '007', "o'clock", "'quoted", 'colon: here', 'x%1:00:00::', '- dash', ' lead', 'trail ', '',
+                  'tab\there', 'bell\x07', 'señor', '\U0001F600', long, long + "'", long.replace(' ', '  '), "'" + long + ' ', long + '\t'):
+            y = {s[:100] or 'k': {'definition': [s], 'ili': s, 'example': [{'source': s, 'text': s}]}}
+            with self.subTest(s):
+                self.assertEqual(yaml.dump(y, allow_unicode=True), emit(y))
+
+    def test_unsupported(self) -> None:
+        shared = ['a']
+        for y in ({'k': []}, {'k': {}}, {'k': 'multi\nline'}, {'multi\nline': 'v'}, {'k' * 128: 'v'}, {'k': 1}, {'k': shared, 'l': shared}):
+            with self.subTest(repr(y)):
+                with self.assertRaises(Unsupported):
+                    emit(y)
+                out = io.StringIO()
+                dump(y, out)
+                self.assertEqual(yaml.dump(y, allow_unicode=True), out.getvalue())
+        self.assertEqual(yaml.dump({}, allow_unicode=True), emit({}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,7 +9,8 @@ Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
 
 import unittest
 
-from tests.model import wn
+from oewn_core.deserialize import load
+from tests.model import wn, data_home
 from tests.utils import dump
 
 
@@ -33,5 +34,39 @@ class ExtendTestCase(unittest.TestCase):
             dump(s)
         self.assertTrue(True)
 
+    def test_extend_edges(self) -> None:
+        def relations(m):
+            return [[(r.relation_type, r.target) for r in ss.relations] for ss in m.synsets], \
+                [[(r.relation_type, r.target, r.other_type) for r in s.relations] for s in m.senses]
+
+        # edge set (extend) and scan (no edge set) produce the same relations in the same order
+        wn1 = load(data_home, extend=False)
+        wn1.extend()
+        wn2 = load(data_home, extend=False)
+        for ss in wn2.synsets:
+            wn2.extend_synset_relations(ss)
+        for s in wn2.senses:
+            wn2.extend_sense_relations(s)
+        self.assertEqual(relations(wn1), relations(wn2))
+
+        # idempotent
+        before = relations(wn1)
+        wn1.extend()
+        self.assertEqual(relations(wn1), before)
+
+    def test_extend_unknown_type(self) -> None:
+        # unknown relation types are reported, not taken for types without inverse
+        wn1 = load(data_home, extend=False)
+        ss = next(ss for ss in wn1.synsets if ss.relations)
+        ss.relations.append(wn1.make_synset_relation(ss.relations[0].target, 'hypernymm'))
+        with self.assertRaises(ValueError):
+            wn1.extend()
+        wn2 = load(data_home, extend=False)
+        s = next(s for s in wn2.senses if s.relations)
+        s.relations.append(wn2.make_sense_relation(s.relations[0].target, 'antonymm'))
+        with self.assertRaises(ValueError):
+            wn2.extend()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,47 @@
+"""
+WordNet fused loader tests
+Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
+"""
+#  Copyright (c) 2024.
+#  Creative Commons 4 for original code
+#  GPL3 for rewrite
+
+import unittest
+
+from oewn_core.wordnet_fromyaml import load
+from oewn_core.wordnet_fused import load as load_fused
+from tests.utils import YamlHomeTestCase, dump_model
+
+
+class FusedLoadTestCase(YamlHomeTestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.wn = load(cls.home, extend=True, resolve=True)
+
+    def test_same_as_multi_pass(self) -> None:
+        wn, counts = load_fused(self.home)
+        self.assertEqual(dump_model(self.wn), dump_model(wn))
+        self.assertTrue(wn.extended)
+        self.assertEqual(self.wn.info(), counts.info(wn))
+        self.assertEqual(self.wn.info_relations(), counts.info_relations(wn))
+
+    def test_resolved(self) -> None:
+        wn, _ = load_fused(self.home)
+        for s in wn.senses:
+            self.assertIs(s.resolved_synset, wn.synset_resolver[s.synsetid])
+            for r in s.relations:
+                self.assertIs(r.resolved_target, wn.sense_resolver[r.target])
+        for ss in wn.synsets:
+            self.assertEqual([wn.member_resolver[(m, ss.id)] for m in ss.members], ss.resolved_members)
+            for r in ss.relations:
+                self.assertIs(r.resolved_target, wn.synset_resolver[r.target])
+
+    def test_unextended(self) -> None:
+        wn, _ = load_fused(self.home, extend=False, resolve=False)
+        self.assertEqual(dump_model(load(self.home, extend=False)), dump_model(wn))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+"""
+WordNet columnar relation store tests
+Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
+"""
+#  Copyright (c) 2024.
+#  Creative Commons 4 for original code
+#  GPL3 for rewrite
+
+import pickle
+import unittest
+
+from oewn_core.deserialize import load
+from oewn_core.wordnet import Synset
+from oewn_core.wordnet_graph import compact, expand, RelationsView
+from tests.model import data_home
+
+
+def synset_edges(wn):
+    return [[(r.target, r.relation_type) for r in ss.relations] for ss in wn.synsets]
+
+
+def sense_edges(wn):
+    return [[(r.target, r.relation_type, r.other_type) for r in s.relations] for s in wn.senses]
+
+
+class GraphTestCase(unittest.TestCase):
+
+    def test_views(self) -> None:
+        wn0 = load(data_home, extend=False)
+        wn = compact(load(data_home, extend=False))
+        print(f'\n{wn.synset_graph}\n{wn.sense_graph}')
+        self.assertIsInstance(wn.synsets[0].relations, RelationsView)
+        self.assertEqual(synset_edges(wn0), synset_edges(wn))
+        self.assertEqual(sense_edges(wn0), sense_edges(wn))
+
+    def test_extend(self) -> None:
+        wn0 = load(data_home, extend=True)
+        wn = compact(load(data_home, extend=False))
+        wn.extend()
+        self.assertEqual(synset_edges(wn0), synset_edges(wn))
+        self.assertEqual(sense_edges(wn0), sense_edges(wn))
+        expand(wn)
+        self.assertIsInstance(wn.synsets[0].relations, list)
+        self.assertEqual(synset_edges(wn0), synset_edges(wn))
+
+    def test_closure(self) -> None:
+        wn = compact(load(data_home, extend=False))
+        graph = wn.synset_graph
+        code = graph.type_codes[Synset.Relation.Type.HYPERNYM]
+        for i, ss in enumerate(wn.synsets):
+            direct = {graph.index[r.target] for r in ss.relations if r.relation_type == Synset.Relation.Type.HYPERNYM}
+            self.assertTrue(direct <= graph.closure(i, code))
+
+    def test_pickle(self) -> None:
+        wn = compact(load(data_home, extend=False))
+        wn2 = pickle.loads(pickle.dumps(wn))
+        self.assertEqual(synset_edges(wn), synset_edges(wn2))
+        self.assertEqual(bytes(wn.synset_graph.buffers[1]), bytes(wn2.synset_graph.buffers[1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
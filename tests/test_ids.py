@@ -0,0 +1,60 @@
+"""
+WordNet dense integer ids tests
+Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
+"""
+#  Copyright (c) 2024.
+#  Creative Commons 4 for original code
+#  GPL3 for rewrite
+
+import pickle
+import unittest
+
+from oewn_core.deserialize import load
+from oewn_core.wordnet import Synset
+from oewn_core.wordnet_graph import compact
+from oewn_core.wordnet_ids import IdMap, dense_ids
+from tests.model import data_home
+
+
+class DenseIdsTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.wn = load(data_home, extend=False)
+
+    def test_dense_ids(self) -> None:
+        ids = dense_ids(self.wn)
+        self.assertIs(ids, dense_ids(self.wn))
+        self.assertEqual(len(ids.synsets), len(self.wn.synsets))
+        for i, ss in enumerate(self.wn.synsets):
+            self.assertEqual(ids.synsets[ss.id], i)
+            self.assertEqual(ids.synsets.key(i), ss.id)
+        for i, s in enumerate(self.wn.senses):
+            self.assertEqual(ids.senses[s.id], i)
+        for i, e in enumerate(self.wn.entries):
+            self.assertEqual(ids.entries[e.key], i)
+            self.assertEqual(ids.entries.key(i), e.key)
+
+    def test_update(self) -> None:
+        ids = dense_ids(self.wn)
+        before = list(ids.synsets)
+        ss = Synset('99999999-n', 'n', [], 'noun.Tops')
+        self.wn.synsets.append(ss)
+        self.assertEqual(ids.update(self.wn), 1)
+        self.assertEqual(ids.synsets[ss.id], len(before))
+        self.assertEqual(list(ids.synsets)[:len(before)], before)
+
+    def test_duplicate(self) -> None:
+        with self.assertRaises(ValueError):
+            IdMap(['a', 'b', 'a'])
+
+    def test_pickle(self) -> None:
+        compact(self.wn)
+        wn2 = pickle.loads(pickle.dumps(self.wn))
+        self.assertEqual(list(wn2.dense_ids.synsets), list(self.wn.dense_ids.synsets))
+        self.assertEqual(wn2.dense_ids.entries.index, self.wn.dense_ids.entries.index)
+        self.assertIs(wn2.synset_graph.nodes, wn2.dense_ids.synsets)
+        self.assertIs(wn2.sense_graph.nodes, wn2.dense_ids.senses)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+WordNet model cached indexes tests
+Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
+"""
+#  Copyright (c) 2024.
+#  Creative Commons 4 for original code
+#  GPL3 for rewrite
+
+import pickle
+import unittest
+
+from oewn_core.deserialize import load
+from oewn_core.wordnet import Entry, VerbFrame
+from tests.model import data_home
+
+
+class IndexesTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.wn = load(data_home, extend=False)
+
+    def test_entry_resolver_cached(self) -> None:
+        r = self.wn.entry_resolver
+        self.assertIs(r, self.wn.entry_resolver)
+        self.assertEqual(len(r), len({e.key for e in self.wn.entries}))
+
+    def test_entry_resolver_invalidated(self) -> None:
+        r = self.wn.entry_resolver
+        e = Entry('zzzz', 'n', None)
+        self.wn.entries.append(e)
+        self.assertIsNot(r, self.wn.entry_resolver)
+        self.assertIs(self.wn.entry_resolver[e.key], e)
+        self.wn.entries.remove(e)
+        self.assertNotIn(e.key, self.wn.entry_resolver)
+        self.wn.entries = self.wn.entries[:1]
+        self.assertEqual(len(self.wn.entry_resolver), 1)
+
+    def test_verbframe_resolver_invalidated(self) -> None:
+        r = self.wn.verbframe_resolver
+        self.assertIs(r, self.wn.verbframe_resolver)
+        self.wn.verbframes.append(VerbFrame('zzzz', 'Somebody ----s zzzz'))
+        self.assertEqual(self.wn.verbframe_resolver['zzzz'], 'Somebody ----s zzzz')
+
+    def test_rebuild_indexes(self) -> None:
+        e = self.wn.entries[0]
+        key = e.key
+        _ = self.wn.entry_resolver
+        e.lemma = e.lemma + 'zzzz'  # not tracked
+        self.wn.rebuild_indexes()
+        self.assertIs(self.wn.entry_resolver[e.key], e)
+        self.assertNotIn(key, self.wn.entry_resolver)
+        for s in e.senses:
+            self.assertIs(self.wn.member_resolver[(e.lemma, s.synsetid)], e)
+
+    def test_pickle(self) -> None:
+        _ = self.wn.entry_resolver
+        wn2 = pickle.loads(pickle.dumps(self.wn))
+        self.assertEqual(len(wn2.entries), len(self.wn.entries))
+        self.assertEqual(wn2.entry_resolver.keys(), self.wn.entry_resolver.keys())
+        wn2.entries.pop()
+        self.assertEqual(len(wn2.entry_resolver), len({e.key for e in wn2.entries}))
+
+
+if __name__ == '__main__':
+    unittest.main()
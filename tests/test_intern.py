@@ -0,0 +1,64 @@
+"""
+WordNet model interned relations tests
+Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
+"""
+#  Copyright (c) 2024.
+#  Creative Commons 4 for original code
+#  GPL3 for rewrite
+
+import pickle
+import unittest
+
+from oewn_core.deserialize import load
+from oewn_core.wordnet import InternedSynsetRelation, InternedSenseRelation
+from tests.model import data_home
+
+
+class InternTestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.wn = load(data_home, extend=True, intern=True)
+        cls.wn0 = load(data_home, extend=True)
+
+    def test_shared(self) -> None:
+        wn = self.wn
+        table = wn.relation_table
+        print(f'\n{table}')
+        self.assertIsNotNone(table)
+        for ss in wn.synsets:
+            for r in ss.relations:
+                self.assertIsInstance(r, InternedSynsetRelation)
+                self.assertIs(r, table.synset_relation(r.target, r.relation_type))
+        for s in wn.senses:
+            for r in s.relations:
+                self.assertIsInstance(r, InternedSenseRelation)
+                self.assertIs(r, table.sense_relation(r.target, r.relation_type, r.other_type))
+
+    def test_immutable_hashable(self) -> None:
+        r = next(r for r in self.wn.synset_relations)
+        with self.assertRaises(AttributeError):
+            r.target = 'x'
+        self.assertIn(InternedSynsetRelation(r.target, r.relation_type), {r})
+
+    def test_same_as_not_interned(self) -> None:
+        for ss, ss0 in zip(self.wn.synsets, self.wn0.synsets):
+            self.assertEqual([(r.target, r.relation_type) for r in ss.relations], [(r.target, r.relation_type) for r in ss0.relations])
+        for s, s0 in zip(self.wn.senses, self.wn0.senses):
+            self.assertEqual([(r.target, r.relation_type, r.other_type) for r in s.relations], [(r.target, r.relation_type, r.other_type) for r in s0.relations])
+
+    def test_resolve(self) -> None:
+        self.wn.resolve()
+        for ss in self.wn.synsets:
+            for r in ss.relations:
+                self.assertIs(self.wn.resolve_target(r), self.wn.synset_resolver[r.target])
+
+    def test_pickle(self) -> None:
+        wn2 = pickle.loads(pickle.dumps(self.wn))
+        for ss in wn2.synsets:
+            for r in ss.relations:
+                self.assertIs(r, wn2.relation_table.synset_relation(r.target, r.relation_type))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+"""
+WordNet model lazy resolution tests
+Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
+"""
+#  Copyright (c) 2024.
+#  Creative Commons 4 for original code
+#  GPL3 for rewrite
+
+import copy
+import pickle
+import unittest
+
+from oewn_core.deserialize import load
+from oewn_core.wordnet import Synset
+from tests.model import data_home
+
+
+class LazyResolutionTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.wn = load(data_home)
+        self.wn.resolve(lazy=True)
+
+    def tearDown(self) -> None:
+        self.wn.end_lazy_resolution()
+
+    def test_lazy(self) -> None:
+        self.assertTrue(self.wn.lazy)
+        for s in self.wn.senses:
+            self.assertIs(s.resolved_synset, self.wn.synset_resolver[s.synsetid])
+            for r in s.relations:
+                self.assertIs(r.resolved_target, self.wn.sense_resolver[r.target])
+        for ss in self.wn.synsets:
+            self.assertEqual(ss.resolved_members, [self.wn.member_resolver[(m, ss.id)] for m in ss.members])
+            for r in ss.relations:
+                self.assertIs(r.resolved_target, self.wn.synset_resolver[r.target])
+
+    def test_same_as_eager(self) -> None:
+        wn2 = load(data_home, resolve=True)
+        for ss, ss2 in zip(self.wn.synsets, wn2.synsets):
+            self.assertEqual([e.key for e in ss.resolved_members], [e.key for e in ss2.resolved_members])
+            self.assertEqual([r.resolved_target.id for r in ss.relations], [r.resolved_target.id for r in ss2.relations])
+
+    def test_stale(self) -> None:
+        ss1, ss2 = self.wn.synsets[0], self.wn.synsets[1]
+        r = self.wn.make_synset_relation(ss1.id, Synset.Relation.Type.ALSO)
+        self.assertIs(r.resolved_target, ss1)
+        r.target = ss2.id
+        self.assertIs(r.resolved_target, ss1)  # cached
+        r.stale(self.wn.resolution)
+        self.assertIs(r.resolved_target, ss2)
+        r.stale()
+        self.assertIsNone(r.resolved_target)
+
+    def test_miss(self) -> None:
+        ss = self.wn.synsets[0]
+        r = self.wn.make_synset_relation('unknown-n', Synset.Relation.Type.ALSO)
+        self.assertIsNone(r.resolved_target)
+        self.wn.synset_resolver['unknown-n'] = ss
+        try:
+            self.assertIsNone(r.resolved_target)  # miss is cached
+            self.wn.stale()
+            self.assertIsNone(r.resolved_target)  # detached from model's relations
+            r.stale(self.wn.resolution)
+            self.assertIs(r.resolved_target, ss)
+        finally:
+            del self.wn.synset_resolver['unknown-n']
+
+    def test_interned(self) -> None:
+        self.wn.intern_relations()
+        for ss in self.wn.synsets:
+            for r in ss.relations:
+                self.assertIs(r.resolved_target, self.wn.synset_resolver[r.target])
+        for s in self.wn.senses:
+            for r in s.relations:
+                self.assertIs(r.resolved_target, self.wn.sense_resolver[r.target])
+
+        # interned relations resolve through their own model
+        wn2 = load(data_home)
+        wn2.intern_relations()
+        wn2.resolve(lazy=True)
+        try:
+            r = next(r for ss in self.wn.synsets for r in ss.relations)
+            r2 = wn2.relation_table.synset_relation(r.target, r.relation_type)
+            self.assertIsNot(r, r2)
+            self.assertIs(r2.resolved_target, wn2.synset_resolver[r.target])
+            self.assertIs(r.resolved_target, self.wn.synset_resolver[r.target])
+        finally:
+            wn2.end_lazy_resolution()
+
+    def test_models(self) -> None:
+        wn2 = load(data_home, extend=False)
+        self.assertFalse(wn2.lazy)
+        self.assertIsNone(wn2.synsets[0].resolved_members)
+        wn2.resolve(lazy=True)
+        try:
+            self.assertTrue(wn2.lazy)
+            self.assertTrue(self.wn.lazy)
+            for s, s2 in zip(self.wn.senses, wn2.senses):
+                self.assertIs(s.resolved_synset, self.wn.synset_resolver[s.synsetid])
+                self.assertIs(s2.resolved_synset, wn2.synset_resolver[s2.synsetid])
+        finally:
+            wn2.end_lazy_resolution()
+
+    def test_detached(self) -> None:
+        # copies are detached from the model, they resolve through no other lazily resolved model
+        wn2 = load(data_home, extend=False)
+        wn2.resolve(lazy=True)
+        try:
+            ss = self.wn.synsets[-1]
+            self.assertIsNone(copy.copy(ss).resolved_members)
+            self.assertIsNone(copy.copy(next(iter(self.wn.senses))).resolved_synset)
+        finally:
+            wn2.end_lazy_resolution()
+
+    def test_end(self) -> None:
+        ss1, ss2 = self.wn.synsets[0], self.wn.synsets[1]
+        members = ss1.resolved_members
+        self.wn.end_lazy_resolution()
+        self.assertFalse(self.wn.lazy)
+        self.assertIs(ss1.resolved_members, members)  # kept
+        self.assertIsNone(ss2.resolved_members)
+
+    def test_pickle(self) -> None:
+        s = next(iter(self.wn.senses))
+        _ = s.resolved_synset
+        s2 = pickle.loads(pickle.dumps(s))
+        self.assertNotIn('_resolved_synset', s2.__getstate__())
+        self.assertIsNone(s2.resolved_synset)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+"""
+WordNet load metrics tests
+Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
+"""
+#  Copyright (c) 2024.
+#  Creative Commons 4 for original code
+#  GPL3 for rewrite
+
+import json
+import pickle
+import tracemalloc
+import unittest
+
+from oewn_core.deserialize import load as load_pickle
+from oewn_core.wordnet_fromyaml import load, source_files
+from oewn_core.wordnet_metrics import LoadMetrics
+from tests.model import data_home
+from tests.utils import YamlHomeTestCase
+
+
+class LoadMetricsTestCase(YamlHomeTestCase):
+
+    def test_yaml(self) -> None:
+        metrics = LoadMetrics('yaml', self.home)
+        wn = load(self.home, resolve=True, metrics=metrics)
+        self.assertIs(metrics, wn.metrics)
+        self.assertEqual(['parse', 'extend', 'resolve'], list(metrics.phases))
+        self.assertEqual(len(source_files(self.home)), len(metrics.files))
+        self.assertEqual(len(wn.entries) + len(wn.synsets) + len(wn.verbframes), sum(f['records'] for f in metrics.files))
+        self.assertEqual(len(wn.synsets), metrics.counts['synsets'])
+        self.assertNotIn('peak', metrics.phases['parse'])
+
+        d = json.loads(metrics.to_json())
+        self.assertEqual(metrics.files, d['files'])
+        self.assertAlmostEqual(metrics.duration, d['duration'])
+
+    def test_memory(self) -> None:
+        metrics = LoadMetrics('pickle', data_home, memory=True)
+        load_pickle(data_home, metrics=metrics)
+        self.assertEqual(['unpickle', 'extend'], list(metrics.phases))
+        self.assertTrue(all(p['peak'] >= p['allocated'] for p in metrics.phases.values()))
+        self.assertGreater(metrics.phases['unpickle']['peak'], 0)
+
+    def test_caller_tracing(self) -> None:
+        tracemalloc.start()
+        try:
+            blob = bytearray(50_000_000)
+            del blob
+            _, peak0 = tracemalloc.get_traced_memory()
+            metrics = LoadMetrics('pickle', data_home, memory=True)
+            with metrics.phase('small'):
+                small = bytearray(1_000_000)
+            del small
+            self.assertTrue(tracemalloc.is_tracing())
+            self.assertGreaterEqual(tracemalloc.get_traced_memory()[1], peak0)  # caller's peak is kept
+            self.assertEqual(0, metrics.phases['small']['peak'])
+        finally:
+            tracemalloc.stop()
+
+    def test_pickle(self) -> None:
+        wn = load_pickle(data_home, extend=False, metrics=LoadMetrics())
+        self.assertIsNone(pickle.loads(pickle.dumps(wn)).metrics)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+"""
+WordNet normalize tests
+Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
+"""
+#  Copyright (c) 2024.
+#  Creative Commons 4 for original code
+#  GPL3 for rewrite
+
+import os
+import unittest
+from glob import glob
+
+from oewn_core.normalize import normalize
+from tests.utils import YamlHomeTestCase
+
+
+class NormalizeTestCase(YamlHomeTestCase):
+    per_test = True
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.f = sorted(glob(f'{self.home}/noun*.yaml'))[0]
+        with open(self.f, encoding='utf-8') as inp:
+            self.normalized = inp.read()
+        with open(self.f, 'w', encoding='utf-8') as out:
+            out.write(self.normalized.replace('partOfSpeech: n', 'partOfSpeech:   n', 1))
+
+    def test_check(self) -> None:
+        mtime = os.stat(self.f).st_mtime_ns
+        self.assertEqual([self.f], normalize(self.home, check=True))
+        self.assertEqual(mtime, os.stat(self.f).st_mtime_ns)
+
+    def test_normalize(self) -> None:
+        mtimes = {f: os.stat(f).st_mtime_ns for f in glob(f'{self.home}/*.yaml') if f != self.f}
+        self.assertEqual([self.f], normalize(self.home, jobs=2))
+        with open(self.f, encoding='utf-8') as inp:
+            self.assertEqual(self.normalized, inp.read())
+        self.assertEqual(mtimes, {f: os.stat(f).st_mtime_ns for f in mtimes})
+        self.assertEqual([], normalize(self.home, check=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+WordNet byte-offset index tests
+Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
+"""
+#  Copyright (c) 2024.
+#  Creative Commons 4 for original code
+#  GPL3 for rewrite
+
+import os
+import tempfile
+import unittest
+from glob import glob
+
+import yaml
+
+from oewn_core.wordnet_fromyaml import load
+from oewn_core.wordnet_offsets import build_index, load_index, index_path, index_file, LazySynsetResolver, LazySenseResolver
+from tests.utils import YamlHomeTestCase
+
+
+class OffsetIndexTestCase(YamlHomeTestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.wn = load(cls.home, extend=False)
+
+    def test_index(self) -> None:
+        index = build_index(self.home)
+        self.assertEqual(set(self.wn.synset_resolver), set(index.synsets))
+        self.assertEqual(set(self.wn.sense_resolver), set(index.senses))
+        self.assertEqual({e.lemma for e in self.wn.entries}, set(index.lemmas))
+
+    def test_synsets(self) -> None:
+        resolver = LazySynsetResolver(self.home, build_index(self.home))
+        self.assertEqual(len(self.wn.synset_resolver), len(resolver))
+        for ss in self.wn.synsets:
+            ss2 = resolver[ss.id]
+            self.assertEqual((ss.id, ss.pos, ss.members, ss.lex_name, ss.definitions), (ss2.id, ss2.pos, ss2.members, ss2.lex_name, ss2.definitions))
+            self.assertEqual([(r.target, r.relation_type) for r in ss.relations], [(r.target, r.relation_type) for r in ss2.relations])
+        self.assertNotIn('no-such-synset', resolver)
+        with self.assertRaises(KeyError):
+            _ = resolver['no-such-synset']
+
+    def test_senses(self) -> None:
+        resolver = LazySenseResolver(self.home, build_index(self.home))
+        for s in self.wn.senses:
+            s2 = resolver[s.id]
+            self.assertEqual((s.id, s.synsetid, s.entry.key), (s2.id, s2.synsetid, s2.entry.key))
+            self.assertEqual([(r.target, r.relation_type) for r in s.relations], [(r.target, r.relation_type) for r in s2.relations])
+            self.assertIs(s2, resolver[s.id])
+
+    def test_sidecar(self) -> None:
+        index = load_index(self.home)
+        self.assertTrue(os.path.exists(index_path(self.home)))
+        mtime = os.stat(index_path(self.home)).st_mtime_ns
+        self.assertEqual(index.synsets, load_index(self.home).synsets)
+        self.assertEqual(mtime, os.stat(index_path(self.home)).st_mtime_ns)
+        f = glob(f'{self.home}/noun*.yaml')[0]
+        with open(f, 'rb') as inp:
+            data = inp.read()
+        try:
+            with open(f, 'a', encoding='utf-8') as out:
+                out.write('99999999-n:\n  definition:\n  - added\n  members: []\n  partOfSpeech: n\n')
+            self.assertEqual(['added'], LazySynsetResolver(self.home)['99999999-n'].definitions)
+        finally:
+            with open(f, 'wb') as out:
+                out.write(data)
+
+    def test_plain_keys(self) -> None:
+        y = {lemma: {'n': {'sense': [{'id': f'{lemma}%1:00:00::', 'synset': f'0000000{i}-n'}]}}
+             for i, lemma in enumerate(['.22-caliber', '-ism', ':-)', '...', '- x', 'x'])}
+        with tempfile.TemporaryDirectory() as d:
+            f = f'{d}/entries-x.yaml'
+            with open(f, 'w', encoding='utf-8') as out:
+                out.write('---\n')
+                yaml.dump(y, out, allow_unicode=True)
+            with open(f, 'rb') as inp:
+                data = inp.read()
+            lemmas = {}
+            senses = {}
+            index_file(f, lemmas, senses)
+        self.assertEqual(set(y), set(lemmas))
+        for lemma, (_, offset, size) in lemmas.items():
+            self.assertEqual({lemma: y[lemma]}, yaml.load(data[offset:offset + size], Loader=yaml.CLoader))
+            self.assertEqual(lemma, senses[f'{lemma}%1:00:00::'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+WordNet overlay tests
+Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
+"""
+#  Copyright (c) 2024.
+#  Creative Commons 4 for original code
+#  GPL3 for rewrite
+
+import os
+import tempfile
+import unittest
+from glob import glob
+
+import yaml
+
+from oewn_core.deserialize import load as load_pickle
+from oewn_core.wordnet_fromyaml import load
+from oewn_core.wordnet_overlay import apply_overlay
+from tests.model import data_home
+from tests.utils import dump_unordered, old_pickle, yaml_home
+
+added_synset = {'99999999-n': {'definition': ['overlaid'], 'members': ['overlaid'], 'partOfSpeech': 'n'}}
+added_entry = {'overlaid': {'n': {'sense': [{'id': 'overlaid%1:00:00::', 'synset': '99999999-n'}]}}}
+
+
+def dump_sorted(wn):
+    entries, synsets, senses, members, synsetids = dump_unordered(wn, relations=True)
+    return sorted(entries, key=repr), sorted(synsets, key=repr), senses, members, synsetids
+
+
+def write(f, y) -> None:
+    with open(f, 'w', encoding='utf-8') as out:
+        yaml.dump(y, out, allow_unicode=True)
+
+
+class OverlayTestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.dir = tempfile.TemporaryDirectory()
+        cls.base = f'{cls.dir.name}/base'
+        cls.home = f'{cls.dir.name}/full'
+        cls.overlay = f'{cls.dir.name}/overlay'
+        os.makedirs(cls.overlay)
+        yaml_home(cls.base)
+        yaml_home(cls.home)
+
+        # modified synset, with a hypernym that is dropped, and added synset with hypernym
+        f = glob(f'{cls.home}/noun*.yaml')[0]
+        with open(f, encoding='utf-8') as inp:
+            y = yaml.load(inp, Loader=yaml.CLoader)
+        synsetid, synset_y = next((k, v) for k, v in y.items() if 'hypernym' in v)
+        del synset_y['hypernym']
+        synset_y['definition'] = ['modified']
+        added_synset['99999999-n']['hypernym'] = [synsetid]
+        y.update(added_synset)
+        write(f, y)
+        write(f'{cls.overlay}/{os.path.basename(f)}', {synsetid: synset_y, **added_synset})
+
+        # added entry
+        f = f'{cls.home}/entries-o.yaml'
+        with open(f, encoding='utf-8') as inp:
+            y = yaml.load(inp, Loader=yaml.CLoader) or {}
+        y.update(added_entry)
+        write(f, y)
+        write(f'{cls.overlay}/entries-o.yaml', added_entry)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.dir.cleanup()
+
+    def test_overlay(self) -> None:
+        wn = load_pickle(data_home, overlays=[self.overlay], resolve=True)
+        self.assertEqual(dump_sorted(load(self.home)), dump_sorted(wn))
+        self.assertEqual(['overlaid'], wn.synset_resolver['99999999-n'].definitions)
+        self.assertIs(wn.sense_resolver['overlaid%1:00:00::'].resolved_synset, wn.synset_resolver['99999999-n'])
+
+    def test_old_pickle(self) -> None:
+        with open(f'{self.dir.name}/old.pickle', 'wb') as out:
+            out.write(old_pickle(load_pickle(data_home)))
+        wn = load_pickle(self.dir.name, file='old.pickle', overlays=[self.overlay])
+        self.assertEqual(dump_sorted(load(self.home)), dump_sorted(wn))
+
+    def test_interned_strings(self) -> None:
+        wn = load_pickle(data_home, overlays=[self.overlay], intern_strings=True)
+        ss = wn.synset_resolver['99999999-n']
+        self.assertIs(ss.id, wn.strings.table[ss.id])
+        for r in ss.relations:
+            self.assertIs(r.target, wn.synset_resolver[r.target].id)
+        s = wn.sense_resolver['overlaid%1:00:00::']
+        self.assertIs(s.synsetid, ss.id)
+        self.assertIs(wn.member_resolver[('overlaid', ss.id)].lemma, ss.members[0])
+
+    def test_unextended(self) -> None:
+        wn = load(self.base, extend=False)
+        self.assertEqual((1, 2), apply_overlay(wn, self.overlay))
+        self.assertEqual(dump_sorted(load(self.home, extend=False)), dump_sorted(wn))
+
+
+if __name__ == '__main__':
+    unittest.main()
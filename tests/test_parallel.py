@@ -0,0 +1,55 @@
+"""
+WordNet parallel YAML load tests
+Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
+"""
+#  Copyright (c) 2024.
+#  Creative Commons 4 for original code
+#  GPL3 for rewrite
+
+import filecmp
+import os
+import tempfile
+import unittest
+
+from oewn_core.deserialize import load as load_pickle
+from oewn_core.wordnet_fromyaml import load
+from oewn_core.wordnet_toyaml import save
+from tests.model import data_home
+from tests.utils import YamlHomeTestCase, dump_model
+
+
+class ParallelLoadTestCase(YamlHomeTestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.wn = load(cls.home, extend=False)
+
+    def test_same_as_serial(self) -> None:
+        wn = load(self.home, extend=False, jobs=2)
+        self.assertEqual(dump_model(self.wn), dump_model(wn))
+
+    def test_interned(self) -> None:
+        wn = load(self.home, extend=False, jobs=2, intern=True, intern_strings=True)
+        self.assertEqual(dump_model(self.wn), dump_model(wn))
+        for ss in wn.synsets:
+            for r in ss.relations:
+                self.assertIs(r, wn.relation_table.synset_relation(r.target, r.relation_type))
+                self.assertIs(r.target, wn.synset_resolver[r.target].id)
+
+
+class ParallelSaveTestCase(unittest.TestCase):
+
+    def test_same_as_serial(self) -> None:
+        wn = load_pickle(data_home, extend=False)
+        with tempfile.TemporaryDirectory() as serial, tempfile.TemporaryDirectory() as parallel:
+            save(wn, serial)
+            save(wn, parallel, jobs=2)
+            files = sorted(os.listdir(serial))
+            self.assertEqual(files, sorted(os.listdir(parallel)))
+            match, mismatch, errors = filecmp.cmpfiles(serial, parallel, files, shallow=False)
+            self.assertEqual(files, match)
+
+
+if __name__ == '__main__':
+    unittest.main()
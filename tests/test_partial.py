@@ -0,0 +1,64 @@
+"""
+WordNet partial YAML load tests
+Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
+"""
+#  Copyright (c) 2024.
+#  Creative Commons 4 for original code
+#  GPL3 for rewrite
+
+import unittest
+
+from oewn_core.wordnet_fromyaml import load
+from tests.utils import YamlHomeTestCase
+
+
+class PartialLoadTestCase(YamlHomeTestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.wn = load(cls.home, extend=False)
+
+    def check_closed(self, wn) -> None:
+        for s in wn.senses:
+            self.assertIn(s.synsetid, wn.synset_resolver)
+            for r in s.relations:
+                self.assertIn(r.target, wn.sense_resolver)
+        for ss in wn.synsets:
+            for r in ss.relations:
+                self.assertIn(r.target, wn.synset_resolver)
+
+    def test_pos(self) -> None:
+        wn = load(self.home, pos={'n'}, resolve=True)
+        self.assertEqual({ss.id for ss in self.wn.synsets if ss.pos == 'n'}, {ss.id for ss in wn.synsets})
+        self.assertTrue(all(e.senses for e in wn.entries))
+        self.check_closed(wn)
+        self.assertEqual(len(self.wn.verbframes), len(wn.verbframes))
+
+    def test_satellites(self) -> None:
+        wn = load(self.home, extend=False, pos={'s'})
+        self.assertEqual({ss.id for ss in self.wn.synsets if ss.pos == 's'}, {ss.id for ss in wn.synsets})
+
+    def test_lexfiles(self) -> None:
+        lex_name = self.wn.synsets[0].lex_name
+        wn = load(self.home, extend=False, lexfiles=[lex_name], include_frames=False)
+        self.assertEqual([ss.id for ss in self.wn.synsets if ss.lex_name == lex_name], [ss.id for ss in wn.synsets])
+        self.check_closed(wn)
+        self.assertEqual([], wn.verbframes)
+
+    def test_no_entries(self) -> None:
+        wn = load(self.home, extend=False, pos={'v'}, include_entries=False)
+        self.assertEqual([], wn.entries)
+        self.assertEqual({ss.id for ss in self.wn.synsets if ss.pos == 'v'}, {ss.id for ss in wn.synsets})
+
+    def test_dangling(self) -> None:
+        wn = load(self.home, extend=False, pos={'r'}, dangling='keep')
+        self.assertEqual(sum(1 for _ in self.wn.senses), sum(1 for _ in wn.senses))
+        with self.assertRaises(ValueError):
+            load(self.home, extend=False, pos={'r'}, dangling='error')
+        with self.assertRaises(ValueError):
+            load(self.home, extend=False, pos={'r'}, dangling='ignore')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+"""
+WordNet incremental reload tests
+Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
+"""
+#  Copyright (c) 2024.
+#  Creative Commons 4 for original code
+#  GPL3 for rewrite
+
+import os
+import pickle
+import unittest
+from glob import glob
+
+import yaml
+
+from oewn_core.wordnet import extended_sense_relations
+from oewn_core.wordnet_fromyaml import load
+from oewn_core.wordnet_reload import reload_changed
+from tests.utils import YamlHomeTestCase, dump_unordered, old_pickle
+
+
+def edit(f, change) -> None:
+    with open(f, encoding='utf-8') as inp:
+        y = yaml.load(inp, Loader=yaml.CLoader)
+    change(y)
+    with open(f, 'w', encoding='utf-8') as out:
+        yaml.dump(y, out, allow_unicode=True)
+    st = os.stat(f)
+    os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def drop_relations(y) -> None:
+    for synset_y in y.values():
+        if synset_y.pop('hypernym', None) is not None:
+            synset_y['definition'] = ['changed']
+            return
+
+
+def drop_sense_relations(y) -> None:
+    for lemma, poses in y.items():
+        for pos, entry_y in poses.items():
+            for sense_y in entry_y['sense']:
+                relations = [k for k in sense_y if k in extended_sense_relations]
+                if relations:
+                    for k in relations:
+                        del sense_y[k]
+                    return
+
+
+def drop_sense(y) -> None:
+    for lemma, poses in y.items():
+        for pos, entry_y in poses.items():
+            if len(entry_y['sense']) > 1:
+                entry_y['sense'].pop()
+                return
+
+
+class ReloadTestCase(YamlHomeTestCase):
+    per_test = True
+
+    def test_unchanged(self) -> None:
+        wn = load(self.home)
+        self.assertEqual([], reload_changed(wn, self.home))
+        f = glob(f'{self.home}/noun*.yaml')[0]
+        edit(f, drop_relations)
+        self.assertEqual([os.path.basename(f)], reload_changed(wn, self.home))
+        os.utime(f, ns=(0, 0))
+        self.assertEqual([], reload_changed(wn, self.home))
+
+    def test_unextended(self) -> None:
+        wn = load(self.home, extend=False)
+        synsets_file = glob(f'{self.home}/noun*.yaml')[0]
+        entries_file = glob(f'{self.home}/entries-*.yaml')[0]
+        edit(synsets_file, drop_relations)
+        edit(entries_file, drop_sense)
+        reloaded = reload_changed(wn, self.home)
+        self.assertEqual(sorted([os.path.basename(synsets_file), os.path.basename(entries_file)]), sorted(reloaded))
+        self.assertEqual(dump_unordered(load(self.home, extend=False)), dump_unordered(wn))
+
+    def test_extended(self) -> None:
+        wn = load(self.home)
+        for f in glob(f'{self.home}/noun*.yaml')[:3]:
+            edit(f, drop_relations)
+        for f in glob(f'{self.home}/entries-*.yaml')[:3]:
+            edit(f, drop_sense_relations)
+        reload_changed(wn, self.home, resolve=True)
+        self.assertEqual(dump_unordered(load(self.home), relations=True), dump_unordered(wn, relations=True))
+        for ss in wn.synsets:
+            for r in ss.relations:
+                self.assertIs(r.resolved_target, wn.synset_resolver[r.target])
+
+    def test_old_pickle(self) -> None:
+        self.assertFalse(pickle.loads(old_pickle(load(self.home, extend=False))).extended)
+        wn = pickle.loads(old_pickle(load(self.home)))
+        self.assertTrue(wn.extended)
+        for f in glob(f'{self.home}/noun*.yaml')[:3]:
+            edit(f, drop_relations)
+        reload_changed(wn, self.home)
+        self.assertEqual(dump_unordered(load(self.home), relations=True), dump_unordered(wn, relations=True))
+
+    def test_interned_strings(self) -> None:
+        wn = load(self.home, intern_strings=True)
+        strings = wn.strings
+        f = glob(f'{self.home}/noun*.yaml')[0]
+        edit(f, drop_relations)
+        reload_changed(wn, self.home)
+        self.assertIs(strings, wn.strings)
+        for ss in wn.synsets:
+            self.assertIs(ss.id, strings.table[ss.id])
+            for r in ss.relations:
+                self.assertIs(r.target, wn.synset_resolver[r.target].id)
+        for s in wn.senses:
+            self.assertIs(s.synsetid, wn.synset_resolver[s.synsetid].id)
+
+    def test_deleted(self) -> None:
+        wn = load(self.home, extend=False)
+        f = glob(f'{self.home}/adv*.yaml')[0]
+        os.remove(f)
+        self.assertEqual([os.path.basename(f)], reload_changed(wn, self.home))
+        self.assertEqual(dump_unordered(load(self.home, extend=False)), dump_unordered(wn))
+
+
+if __name__ == '__main__':
+    unittest.main()
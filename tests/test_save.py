@@ -0,0 +1,93 @@
+"""
+WordNet incremental and streaming YAML save tests
+Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
+"""
+#  Copyright (c) 2024.
+#  Creative Commons 4 for original code
+#  GPL3 for rewrite
+
+import filecmp
+import os
+import tempfile
+import unittest
+
+from oewn_core.deserialize import load
+from oewn_core.wordnet_toyaml import save
+from tests.model import data_home
+
+
+def mtimes(home):
+    return {f: os.stat(f'{home}/{f}').st_mtime_ns for f in os.listdir(home)}
+
+
+class IncrementalSaveTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.wn = load(data_home, extend=False)
+        self.dir = tempfile.TemporaryDirectory()
+        self.home = self.dir.name
+        self.files = save(self.wn, self.home)
+
+    def tearDown(self) -> None:
+        self.dir.cleanup()
+
+    def test_unchanged(self) -> None:
+        self.assertEqual(sorted(os.listdir(self.home)), sorted(os.path.basename(f) for f in self.files))
+        before = mtimes(self.home)
+        self.assertEqual([], save(self.wn, self.home))
+        self.assertEqual(before, mtimes(self.home))
+        self.assertEqual(len(self.files), len(save(self.wn, self.home, incremental=False)))
+
+    def test_changed(self) -> None:
+        ss = self.wn.synsets[0]
+        ss.definitions = ['changed']
+        self.assertEqual([f'{self.home}/{ss.lex_name}.yaml'], save(self.wn, self.home))
+        self.assertEqual([], [f for f in os.listdir(self.home) if f.endswith('.tmp')])
+        with tempfile.TemporaryDirectory() as full:
+            save(self.wn, full, incremental=False)
+            files = sorted(os.listdir(full))
+            self.assertEqual(files, filecmp.cmpfiles(full, self.home, files, shallow=False)[0])
+
+
+
+class StreamingSaveTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.wn = load(data_home, extend=False)
+        self.dir = tempfile.TemporaryDirectory()
+        self.full = f'{self.dir.name}/full'
+        self.home = f'{self.dir.name}/streamed'
+        os.makedirs(self.full)
+        os.makedirs(self.home)
+
+    def tearDown(self) -> None:
+        self.dir.cleanup()
+
+    def assertSame(self) -> None:
+        save(self.wn, self.full, incremental=False)
+        files = sorted(os.listdir(self.full))
+        self.assertEqual(files, sorted(os.listdir(self.home)))
+        self.assertEqual(files, filecmp.cmpfiles(self.full, self.home, files, shallow=False)[0])
+
+    def test_same(self) -> None:
+        written = save(self.wn, self.home, stream=True)
+        self.assertSame()
+        self.assertEqual(sorted(os.listdir(self.home)), sorted(os.path.basename(f) for f in written))
+        before = mtimes(self.home)
+        self.assertEqual([], save(self.wn, self.home, stream=True))
+        self.assertEqual(before, mtimes(self.home))
+
+    def test_shared(self) -> None:
+        ss1 = self.wn.synsets[0]
+        ss2 = next(ss for ss in self.wn.synsets[1:] if ss.lex_name == ss1.lex_name)
+        ss2.definitions = ss1.definitions
+        self.assertIn(f'{self.home}/{ss1.lex_name}.yaml', save(self.wn, self.home, stream=True))
+        self.assertSame()
+        self.assertEqual([], [f for f in os.listdir(self.home) if f.endswith('.tmp')])
+
+    def test_jobs(self) -> None:
+        with self.assertRaises(ValueError):
+            save(self.wn, self.home, jobs=2, stream=True)
+
+if __name__ == '__main__':
+    unittest.main()
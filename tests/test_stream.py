@@ -0,0 +1,41 @@
+"""
+WordNet streaming YAML load tests
+Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
+"""
+#  Copyright (c) 2024.
+#  Creative Commons 4 for original code
+#  GPL3 for rewrite
+
+import io
+import unittest
+from glob import glob
+
+import yaml
+
+from oewn_core.wordnet_fromyaml import load, stream_records
+from tests.utils import YamlHomeTestCase, dump_model
+
+
+class StreamLoadTestCase(YamlHomeTestCase):
+
+    def test_records(self) -> None:
+        for f in glob(f'{self.home}/*.yaml'):
+            with open(f, encoding='utf-8') as inp:
+                y = yaml.load(inp, Loader=yaml.CLoader)
+            with open(f, encoding='utf-8') as inp:
+                records = list(stream_records(inp))
+            self.assertEqual(list(y.items()), records)
+
+    def test_scalars(self) -> None:
+        y = 'a: 1\n2: [yes, null, "3"]\nb: &x {c: d}\ne: *x\n'
+        self.assertEqual(list(yaml.load(y, Loader=yaml.CLoader).items()), list(stream_records(io.StringIO(y))))
+        self.assertEqual([], list(stream_records(io.StringIO(''))))
+
+    def test_same_as_load(self) -> None:
+        wn = load(self.home, extend=False)
+        wn2 = load(self.home, extend=False, stream=True)
+        self.assertEqual(dump_model(wn), dump_model(wn2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+"""
+WordNet identifier string interning tests
+Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
+"""
+#  Copyright (c) 2024.
+#  Creative Commons 4 for original code
+#  GPL3 for rewrite
+
+import unittest
+
+from oewn_core.deserialize import load
+from oewn_core.wordnet_strings import StringPool, intern_model
+from tests.model import data_home
+
+
+class StringsTestCase(unittest.TestCase):
+
+    def test_pool(self) -> None:
+        strings = StringPool()
+        a = ''.join(['zz', 'zz-n'])
+        b = ''.join(['zzz', 'z-n'])
+        self.assertIsNot(a, b)
+        self.assertIs(strings(a), strings(b))
+        self.assertEqual(strings.requests, 2)
+        self.assertEqual(strings.hits, 1)
+        self.assertGreater(strings.saved, 0)
+        self.assertIsNone(strings(None))
+        self.assertEqual(1, len(strings))
+
+    def test_pools(self) -> None:
+        # each load has its own pool, kept with the model but not pickled
+        wn1 = load(data_home, extend=False, intern_strings=True)
+        wn2 = load(data_home, extend=False, intern_strings=True)
+        self.assertIsNot(wn1.strings, wn2.strings)
+        self.assertEqual(wn1.strings.requests, wn2.strings.requests)
+        self.assertIsNot(wn1.synsets[0].id, wn2.synsets[0].id)
+        self.assertNotIn('strings', wn1.__getstate__())
+        self.assertIsNone(load(data_home, extend=False).strings)
+
+    def test_model(self) -> None:
+        wn = load(data_home, extend=False)
+        strings = intern_model(wn)
+        self.assertIs(strings, wn.strings)
+        self.assertGreater(strings.hits, 0)
+        for ss in wn.synsets:
+            for r in ss.relations:
+                self.assertIs(r.target, wn.synset_resolver[r.target].id)
+            for m in ss.members:
+                self.assertIs(m, wn.member_resolver[(m, ss.id)].lemma)
+        for s in wn.senses:
+            self.assertIs(s.synsetid, wn.synset_resolver[s.synsetid].id)
+            for r in s.relations:
+                self.assertIs(r.target, wn.sense_resolver[r.target].id)
+        for (lemma, synsetid), e in wn.member_resolver.items():
+            self.assertIs(lemma, e.lemma)
+            self.assertIs(synsetid, wn.synset_resolver[synsetid].id)
+
+    def test_interned_relations(self) -> None:
+        wn = load(data_home, extend=True, intern=True, intern_strings=True)
+        for ss in wn.synsets:
+            for r in ss.relations:
+                self.assertIs(r.target, wn.synset_resolver[r.target].id)
+                self.assertIs(wn.relation_table.synset_relation(r.target, r.relation_type), r)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+"""
+WordNet lazy text store tests
+Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
+"""
+#  Copyright (c) 2024.
+#  Creative Commons 4 for original code
+#  GPL3 for rewrite
+
+import gc
+import pickle
+import unittest
+import weakref
+
+from oewn_core.deserialize import load
+from oewn_core.wordnet_text import store_text, load_text
+from tests.model import data_home
+
+
+def text(wn):
+    return [(ss.id, ss.definitions, [x if isinstance(x, str) else (x.text, x.source) for x in ss.examples], ss.usages, ss.ili_definition) for ss in wn.synsets]
+
+
+class TextStoreTestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.wn = load(data_home, extend=False)
+        cls.text = text(cls.wn)
+
+    def test_lazy(self) -> None:
+        wn = load(data_home, extend=False, lazy_text=True)
+        self.assertIsNotNone(wn.text_store)
+        self.assertTrue(all(ss._definitions is None for ss in wn.synsets))
+        self.assertEqual(self.text, text(wn))
+        self.assertTrue(all(ss._text is None for ss in wn.synsets))
+
+    def test_pickle(self) -> None:
+        wn = load(data_home, extend=False, lazy_text=True)
+        wn2 = pickle.loads(pickle.dumps(wn))
+        self.assertIsNone(wn2.text_store)
+        self.assertTrue(all(ss._text is not None for ss in wn.synsets))  # pickling does not fetch
+        self.assertEqual(self.text, text(wn2))
+
+    def test_set(self) -> None:
+        wn = load(data_home, extend=False)
+        store_text(wn, block_size=7)
+        ss = wn.synsets[3]
+        ss.definitions = ['changed']
+        self.assertEqual(self.text[3][2:], text(wn)[3][2:])
+        self.assertEqual(['changed'], ss.definitions)
+        load_text(wn)
+        self.assertIsNone(wn.text_store)
+        self.assertEqual(self.text[4:], text(wn)[4:])
+
+    def test_lifetime(self) -> None:
+        wn = load(data_home, extend=False, lazy_text=True)
+        wn2 = load(data_home, extend=False, lazy_text=True)
+        store = weakref.ref(wn.text_store)
+        self.assertIsNot(wn.text_store, wn2.text_store)
+        del wn
+        gc.collect()
+        self.assertIsNone(store())
+        self.assertEqual(self.text, text(wn2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -37,6 +37,23 @@ class TransitiveTestCase(unittest.TestCase):
         with self.assertRaises(ValidationError):
             check_transitive_synset(wn, s3)
 
+    def test_changed_hypernym(self) -> None:
+        s3: Synset = wn.synset_resolver['05544491-n']
+        s2: Synset = wn.synset_resolver[next(r.target for r in s3.relations if r.relation_type == Synset.Relation.Type.HYPERNYM)]
+        t: Synset = next(ss for ss in wn.synsets if ss.id not in (s2.id, s3.id) and ss.id not in wn.hypernyms(s2.id))
+        r = Synset.Relation(t.id, Synset.Relation.Type.HYPERNYM.value)
+        s3.relations.append(r)
+        try:
+            check_transitive_synset(wn, s3)  # adjacency index is built before s2 changes
+
+            s2.relations.append(r)
+            with self.assertRaises(ValidationError):
+                check_transitive_synset(wn, s3)
+        finally:
+            s3.relations.remove(r)
+            if r in s2.relations:
+                s2.relations.remove(r)
+
 
 if __name__ == '__main__':
     unittest.main()
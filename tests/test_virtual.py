@@ -0,0 +1,65 @@
+"""
+WordNet model virtual extension tests
+Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
+"""
+#  Copyright (c) 2024.
+#  Creative Commons 4 for original code
+#  GPL3 for rewrite
+
+import pickle
+import unittest
+
+from oewn_core.deserialize import load
+from tests.model import data_home
+
+
+def relation_keys(relations):
+    return [(r.relation_type, r.target) for r in relations]
+
+
+class VirtualExtensionTestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.wn = load(data_home, extend=False)
+        cls.wn.extend(virtual=True)
+        cls.wn_x = load(data_home, extend=True)
+
+    def test_not_stored(self) -> None:
+        wn0 = load(data_home, extend=False)
+        for ss, ss0 in zip(self.wn.synsets, wn0.synsets):
+            self.assertEqual(relation_keys(ss.relations), relation_keys(ss0.relations))
+        for s, s0 in zip(self.wn.senses, wn0.senses):
+            self.assertEqual(relation_keys(s.relations), relation_keys(s0.relations))
+
+    def test_relations_of(self) -> None:
+        for ss, ss_x in zip(self.wn.synsets, self.wn_x.synsets):
+            self.assertEqual(relation_keys(self.wn.relations_of(ss)), relation_keys(ss_x.relations))
+            self.assertEqual(relation_keys(self.wn.relations_of(ss, inverses=False)), relation_keys(ss.relations))
+        for s, s_x in zip(self.wn.senses, self.wn_x.senses):
+            self.assertEqual(relation_keys(self.wn.relations_of(s)), relation_keys(s_x.relations))
+
+    def test_adjacency(self) -> None:
+        for ss in self.wn_x.synsets:
+            for t in {r.relation_type for r in ss.relations}:
+                self.assertEqual(sorted(self.wn.outgoing(ss.id, t)), sorted(self.wn_x.outgoing(ss.id, t)))
+                self.assertEqual(sorted(self.wn.incoming(ss.id, t)), sorted(self.wn_x.incoming(ss.id, t)))
+
+    def test_pickle(self) -> None:
+        wn2 = pickle.loads(pickle.dumps(self.wn))
+        self.assertTrue(wn2.virtual_extension)
+        ss = wn2.synsets[0]
+        self.assertEqual(relation_keys(wn2.relations_of(ss)), relation_keys(self.wn.relations_of(self.wn.synsets[0])))
+
+    def test_materialize(self) -> None:
+        wn2 = load(data_home, extend=False, virtual=True)
+        self.assertFalse(wn2.virtual_extension)
+        wn2.extend(virtual=True)
+        wn2.extend()
+        self.assertFalse(wn2.virtual_extension)
+        for ss, ss_x in zip(wn2.synsets, self.wn_x.synsets):
+            self.assertEqual(relation_keys(wn2.relations_of(ss)), relation_keys(ss_x.relations))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,9 +7,17 @@ Author: Bernard Bou <1313ou@gmail.com> for rewrite and revamp
 #  Creative Commons 4 for original code
 #  GPL3 for rewrite
 
-from typing import Any, List, Dict, Tuple
-
-from oewn_core.wordnet import Synset, Sense
+import copyreg
+import io
+import pickle
+import shutil
+import tempfile
+import unittest
+from typing import Any, List, Dict, Optional, Tuple
+
+from oewn_core.deserialize import load as load_pickle
+from oewn_core.wordnet import Synset, Sense, WordnetModel
+from oewn_core.wordnet_toyaml import save
 from oewn_xml.wordnet_xml import dash_factory, legacy_factory, to_xml_sense_id, from_xml_sense_id, is_valid_xml_id, split_at_last
 
 
@@ -46,6 +54,89 @@ def dump(s: Synset | Sense):
         print(f'\t{r}')
 
 
+def dump_model(wn):
+    entries = [(e.key, e.forms, [(s.id, s.synsetid, [(r.target, r.relation_type, r.other_type) for r in s.relations]) for s in e.senses]) for e in wn.entries]
+    synsets = [(ss.id, ss.members, ss.lex_name, ss.definitions, [(r.target, r.relation_type) for r in ss.relations]) for ss in wn.synsets]
+    return entries, synsets, list(wn.sense_resolver), list(wn.member_resolver), list(wn.synset_resolver)
+
+
+def dump_unordered(wn, relations: bool = False):
+    entries, synsets, senses, members, synsetids = dump_model(wn)
+    if relations:
+        entries = [(k, forms, [(sid, ssid, sorted(rs)) for sid, ssid, rs in senses_]) for k, forms, senses_ in entries]
+        synsets = [(ssid, members_, lex_name, definitions, sorted(rs)) for ssid, members_, lex_name, definitions, rs in synsets]
+    return entries, synsets, sorted(senses), sorted(members), sorted(synsetids)
+
+
+class OldFormatPickler(pickle.Pickler):
+    """
+    Pickler of models as versions that did not record extension pickled them
+    """
+
+    def reducer_override(self, obj):
+        if type(obj) is WordnetModel:
+            state = obj.__getstate__()
+            del state['extended']
+            return copyreg.__newobj__, (WordnetModel,), state
+        return NotImplemented
+
+
+def old_pickle(wn: WordnetModel) -> bytes:
+    out = io.BytesIO()
+    OldFormatPickler(out).dump(wn)
+    return out.getvalue()
+
+
+yaml_source: Optional[tempfile.TemporaryDirectory] = None
+""" Test model saved to YAML, once per test run """
+
+
+def yaml_home(home: str) -> str:
+    """
+    Make YAML home, a copy of the test model saved to YAML *.yaml files
+    :param home: dir, created if it does not exist
+    :return: home
+    """
+    global yaml_source
+    if yaml_source is None:
+        from tests.model import data_home  # not on import, as loading the test model needs OEWN_HOME
+        yaml_source = tempfile.TemporaryDirectory()
+        save(load_pickle(data_home, extend=False), yaml_source.name)
+    shutil.copytree(yaml_source.name, home, dirs_exist_ok=True)
+    return home
+
+
+class YamlHomeTestCase(unittest.TestCase):
+    """
+    Test case with the test model saved to YAML in a temporary home (home).
+    The home is shared by the test case's tests, unless they modify it (per_test), each test then has a home of its own.
+    """
+
+    per_test: bool = False
+    dir: tempfile.TemporaryDirectory
+    home: str
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        if not cls.per_test:
+            cls.dir = tempfile.TemporaryDirectory()
+            cls.home = yaml_home(cls.dir.name)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        if not cls.per_test:
+            cls.dir.cleanup()
+
+    def setUp(self) -> None:
+        if self.per_test:
+            self.dir = tempfile.TemporaryDirectory()
+            self.home = yaml_home(self.dir.name)
+
+    def tearDown(self) -> None:
+        if self.per_test:
+            self.dir.cleanup()
+
+
 def make_dummy_sk(lemma) -> str:
     return make_sk(lemma, '1:00:00::')
 